@@ -1,5 +1,6 @@
 import logging
 from typing import List, Optional, Dict, Any, Tuple
+import numpy as np
 from pydantic import BaseModel, Field
 from news_agent.aggregator.models import ContentChunk, ContentCluster, ClusterMetadata
 from news_agent.aggregator.embeddings import EmbeddingManager
@@ -28,14 +29,14 @@ class BaseAgent:
         self.evaluator_prompt = ChatPromptTemplate.from_template(config.evaluator_agent_prompt)
         self.refiner_prompt = ChatPromptTemplate.from_template(config.refiner_agent_prompt)
 
-    def _compute_centroid(self, chunks: List[ContentChunk]) -> Optional[List[float]]:
+    def _compute_centroid(self, chunks: List[ContentChunk]) -> Optional[np.ndarray]:
         """Compute the centroid of a list of content chunks."""
-        embeddings = [chunk.embedding for chunk in chunks if chunk.embedding]
+        embeddings = [chunk.embedding for chunk in chunks if chunk.has_embedding]
         if not embeddings:
             return None
         return self.embedding_manager.compute_centroid(embeddings)
 
-    def _calculate_similarity(self, emb1: List[float], emb2: List[float]) -> float:
+    def _calculate_similarity(self, emb1: np.ndarray, emb2: np.ndarray) -> float:
         """Calculate similarity between two embeddings."""
         return self.embedding_manager.calculate_similarity(emb1, emb2)
 
@@ -88,7 +89,7 @@ class BaseAgent:
             return 1.0
 
         try:
-            embeddings = [chunk.embedding for chunk in chunks if chunk.embedding]
+            embeddings = [chunk.embedding for chunk in chunks if chunk.has_embedding]
             if len(embeddings) < 2:
                 return 0.5
 
@@ -128,7 +129,7 @@ class ProposerAgent(BaseAgent):
                 if i == j or chunk2.id in assigned_chunk_ids:
                     continue
 
-                if chunk1.embedding and chunk2.embedding:
+                if chunk1.has_embedding and chunk2.has_embedding:
                     similarity = self._calculate_similarity(chunk1.embedding, chunk2.embedding)
                     if similarity >= self.config.initial_grouping_threshold:
                         current_cluster_chunks.append(chunk2)
@@ -267,11 +268,11 @@ class RefinerAgent(BaseAgent):
         logger.debug(f"RefinerAgent: Reassigning chunks within cluster {cluster.id}")
         reassigned = []
         kept = []
-        if not cluster.centroid:
+        if cluster.centroid is None:
             return cluster.chunks, [] # All chunks are unassigned if no centroid
 
         for chunk in cluster.chunks:
-            if chunk.embedding:
+            if chunk.has_embedding:
                 similarity = self._calculate_similarity(chunk.embedding, cluster.centroid)
                 if similarity < self.config.initial_grouping_threshold: # Use a stricter threshold for reassignment
                     reassigned.append(chunk)
@@ -306,7 +307,7 @@ class RefinerAgent(BaseAgent):
                 if i == j or j in processed_indices:
                     continue
 
-                if cluster1.centroid and cluster2.centroid:
+                if cluster1.centroid is not None and cluster2.centroid is not None:
                     similarity = self._calculate_similarity(cluster1.centroid, cluster2.centroid)
                     if similarity >= self.config.initial_grouping_threshold: # Use initial grouping threshold for merging
                         potential_merge_partners.append(cluster2)
@@ -135,7 +135,8 @@ class AggregatorAgent:
             # Summarization
             self.summarizer = GeminiSummarizer(
                 self.config.summarizer,
-                api_key=api_key 
+                api_key=api_key,
+                embedding_fn=self.embedding_manager.encode_single
             )
             
             logger.debug("GeminiSummarizer initialized")
@@ -146,7 +147,9 @@ class AggregatorAgent:
                     self.supabase_manager = SupabaseManager(
                         self.config.supabase.url,
                         self.config.supabase.key,
-                        self.config.supabase.vector_dimension
+                        self.config.supabase.vector_dimension,
+                        index_type=self.config.supabase.index_type,
+                        target_dimension=self.config.supabase.target_dimension
                     )
                     logger.debug("SupabaseManager initialized")
                     # Keep database_manager reference for backward compatibility
@@ -217,11 +220,11 @@ class AggregatorAgent:
             
             # Stage 5: Cluster scoring and ranking
             logger.info("Stage 5: Cluster scoring")
-            scored_clusters = self.cluster_scorer.score_clusters(clusters, user_preferences)
-            
             # Limit to top clusters
             max_clusters = self.config.processing.max_clusters_output
-            top_clusters = scored_clusters[:max_clusters]
+            top_clusters = self.cluster_scorer.score_clusters(
+                clusters, user_preferences, top_k=max_clusters
+            )
             logger.info(f"Selected top {len(top_clusters)} clusters for output")
             
             # Stage 6: Summary generation
@@ -314,8 +317,9 @@ class AggregatorAgent:
                     continue
                 
                 # Stage 5: Scoring (sync)
-                scored_clusters = self.cluster_scorer.score_clusters(clusters, user_preferences)
-                top_clusters = scored_clusters[:self.config.processing.max_clusters_output]
+                top_clusters = self.cluster_scorer.score_clusters(
+                    clusters, user_preferences, top_k=self.config.processing.max_clusters_output
+                )
                 
                 # Stage 6: Summary generation (async)
                 summaries = await self.summarizer.summarize_clusters_async(top_clusters)
@@ -405,8 +409,9 @@ class AggregatorAgent:
                 all_clusters = self.clustering_engine.cluster_chunks(unique_chunks)
             
             # Score and rank clusters
-            scored_clusters = self.cluster_scorer.score_clusters(all_clusters, user_preferences)
-            top_clusters = scored_clusters[:self.config.processing.max_clusters_output]
+            top_clusters = self.cluster_scorer.score_clusters(
+                all_clusters, user_preferences, top_k=self.config.processing.max_clusters_output
+            )
             
             # Generate summaries for new/updated clusters
             clusters_needing_summaries = [c for c in top_clusters if not c.summary]
@@ -550,9 +555,14 @@ class AggregatorAgent:
             if hasattr(self, 'database_manager') and self.database_manager:
                 self.database_manager.close()
             
-            if hasattr(self, 'embedding_manager'):
-                # Embedding manager cleanup is handled in its destructor
-                pass
+            if hasattr(self, 'embedding_manager') and self.embedding_manager:
+                self.embedding_manager.close()
+            
+            if hasattr(self, 'preprocessor') and self.preprocessor:
+                self.preprocessor.close()
+            
+            if hasattr(self, 'summarizer') and self.summarizer:
+                self.summarizer.close()
             
             logger.info("AggregatorAgent cleanup completed")
             
@@ -95,7 +95,7 @@ class ClusteringEngine:
         if not chunks:
             return []
         
-        valid_chunks = [chunk for chunk in chunks if chunk.embedding and len(chunk.embedding) > 0]
+        valid_chunks = [chunk for chunk in chunks if chunk.has_embedding]
         if len(valid_chunks) < self.agentic_config.min_cluster_size:
             logger.warning(f"Not enough valid chunks for clustering: {len(valid_chunks)}")
             return []
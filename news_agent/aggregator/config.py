@@ -19,7 +19,9 @@ class EmbeddingConfig:
     max_length: int = 512
     normalize_embeddings: bool = True
     device: str = "auto"  # "auto", "cpu", or "cuda"
+    use_fp16: bool = True  # Run the model in half precision when on CUDA
     cache_dir: Optional[str] = None
+    cache_max_entries: int = 100_000  # LRU bound for the on-disk embedding cache
 
 
 @dataclass
@@ -72,6 +74,8 @@ class PreprocessingConfig:
     chunk_overlap: int = 100
     language_detection: bool = True
     supported_languages: List[str] = field(default_factory=lambda: ["en", "es", "fr", "de"])
+    max_workers: int = 1  # >1 processes planner items on a thread pool
+    max_html_bytes: int = 256_000  # Raw HTML beyond this is dropped before parsing
 
 
 @dataclass
@@ -85,8 +89,14 @@ class SummarizerConfig:
     batch_size: int = 5
     retry_attempts: int = 3
     retry_delay: float = 1.0  # Initial retry delay in seconds
+    retry_max_delay: float = 10.0  # Backoff cap for transient errors
+    resource_exhausted_max_delay: float = 60.0  # Backoff cap when the API quota is exhausted
     timeout: int = 30  # Request timeout in seconds
+    requests_per_minute: int = 60  # Gemini request quota enforced by a token bucket
     api_key: Optional[str] = None  # API key for the summarization service
+    cache_enabled: bool = True  # Reuse summaries for clusters with identical content
+    cache_max_entries: int = 1024  # LRU bound for the in-memory summary cache
+    semantic_threshold: float = 0.92  # Cosine similarity to reuse a near-duplicate cluster's summary
 
 
 @dataclass
@@ -96,6 +106,8 @@ class SupabaseConfig:
     key: Optional[str] = None
     vector_dimension: int = 384  # For all-MiniLM-L6-v2
     enable_realtime: bool = True
+    index_type: str = "hnsw"  # "hnsw", or "ivfflat" for heavily-updated tables
+    target_dimension: Optional[int] = None  # PCA-reduce stored vectors to this size (e.g. 128); needs fit_projection()
 
 
 @dataclass
@@ -214,7 +226,9 @@ class AggregatorConfig:
                 "max_length": self.embedding.max_length,
                 "normalize_embeddings": self.embedding.normalize_embeddings,
                 "device": self.embedding.device,
-                "cache_dir": self.embedding.cache_dir
+                "use_fp16": self.embedding.use_fp16,
+                "cache_dir": self.embedding.cache_dir,
+                "cache_max_entries": self.embedding.cache_max_entries
             },
             "clustering": {
                 "min_cluster_size": self.clustering.min_cluster_size,
@@ -244,7 +258,9 @@ class AggregatorConfig:
                 "normalize_whitespace": self.preprocessing.normalize_whitespace,
                 "min_sentence_length": self.preprocessing.min_sentence_length,
                 "max_chunk_size": self.preprocessing.max_chunk_size,
-                "supported_languages": self.preprocessing.supported_languages
+                "supported_languages": self.preprocessing.supported_languages,
+                "max_workers": self.preprocessing.max_workers,
+                "max_html_bytes": self.preprocessing.max_html_bytes
             },
             "summarizer": {
                 "model_provider": self.summarizer.model_provider,
@@ -253,13 +269,19 @@ class AggregatorConfig:
                 "max_output_tokens": self.summarizer.max_output_tokens,
                 "temperature": self.summarizer.temperature,
                 "batch_size": self.summarizer.batch_size,
-                "api_key": self.summarizer.api_key
+                "requests_per_minute": self.summarizer.requests_per_minute,
+                "api_key": self.summarizer.api_key,
+                "cache_enabled": self.summarizer.cache_enabled,
+                "cache_max_entries": self.summarizer.cache_max_entries,
+                "semantic_threshold": self.summarizer.semantic_threshold
             },
             "supabase": {
                 "url": self.supabase.url,
                 "key": self.supabase.key,
                 "vector_dimension": self.supabase.vector_dimension,
-                "enable_realtime": self.supabase.enable_realtime
+                "enable_realtime": self.supabase.enable_realtime,
+                "index_type": self.supabase.index_type,
+                "target_dimension": self.supabase.target_dimension
             },
             "processing": {
                 "batch_interval_seconds": self.processing.batch_interval_seconds,
@@ -38,6 +38,13 @@ from .config import SupabaseConfig
 logger = logging.getLogger(__name__)
 
 
+def _to_vector_literal(vector: Optional[np.ndarray]) -> Optional[str]:
+    """Render an embedding as a pgvector text literal, e.g. '[0.1, 0.2]'."""
+    if vector is None or len(vector) == 0:
+        return None
+    return str(np.asarray(vector, dtype=np.float32).tolist())
+
+
 class DatabaseManager:
     """
     Manages database connections and operations for the aggregator system.
@@ -230,7 +237,7 @@ class DatabaseManager:
                         'id': chunk_id,
                         'content': chunk.content,
                         'processed_content': chunk.processed_content,
-                        'embedding': str(chunk.embedding) if chunk.embedding else None,
+                        'embedding': _to_vector_literal(chunk.embedding),
                         'metadata': json.dumps(chunk.metadata.to_dict()),
                         'cluster_id': chunk.cluster_id
                     })
@@ -245,7 +252,7 @@ class DatabaseManager:
                             chunk_id,
                             chunk.content,
                             chunk.processed_content,
-                            str(chunk.embedding) if chunk.embedding else None,
+                            _to_vector_literal(chunk.embedding),
                             Json(chunk.metadata.to_dict()),
                             chunk.cluster_id
                         ))
@@ -294,7 +301,7 @@ class DatabaseManager:
                             'id': chunk_id,
                             'content': chunk.content,
                             'processed_content': chunk.processed_content,
-                            'embedding': str(chunk.embedding) if chunk.embedding else None,
+                            'embedding': _to_vector_literal(chunk.embedding),
                             'metadata': json.dumps(chunk.metadata.to_dict()),
                             'cluster_id': chunk.cluster_id
                         })
@@ -323,7 +330,7 @@ class DatabaseManager:
                                 chunk_id,
                                 chunk.content,
                                 chunk.processed_content,
-                                str(chunk.embedding) if chunk.embedding else None,
+                                _to_vector_literal(chunk.embedding),
                                 Json(chunk.metadata.to_dict()),
                                 chunk.cluster_id
                             ))
@@ -421,7 +428,7 @@ class DatabaseManager:
                 with self.engine.connect() as conn:
                     conn.execute(text(insert_sql), {
                         'id': cluster_id,
-                        'centroid': str(cluster.centroid) if cluster.centroid else None,
+                        'centroid': _to_vector_literal(cluster.centroid),
                         'metadata': json.dumps(cluster.metadata.to_dict()),
                         'chunk_count': cluster.chunk_count
                     })
@@ -433,7 +440,7 @@ class DatabaseManager:
                     with conn.cursor() as cur:
                         cur.execute(insert_sql, (
                             cluster_id,
-                            str(cluster.centroid) if cluster.centroid else None,
+                            _to_vector_literal(cluster.centroid),
                             Json(cluster.metadata.to_dict()),
                             cluster.chunk_count
                         ))
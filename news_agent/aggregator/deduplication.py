@@ -7,17 +7,25 @@ to identify and remove duplicate articles.
 """
 
 import logging
-import hashlib
 from typing import List, Set, Dict, Tuple, Optional, Any
 from collections import defaultdict
 from datetime import datetime
 import re
 
 try:
-    from fuzzywuzzy import fuzz, process
-    FUZZYWUZZY_AVAILABLE = True
+    # C++ implementation of the fuzzywuzzy API
+    from rapidfuzz import fuzz
+    from rapidfuzz.utils import default_process
+    FUZZ_AVAILABLE = True
+    # rapidfuzz skips preprocessing by default; fuzzywuzzy's token ratios lowercase and strip punctuation
+    _TOKEN_RATIO_KWARGS = {'processor': default_process}
 except ImportError:
-    FUZZYWUZZY_AVAILABLE = False
+    try:
+        from fuzzywuzzy import fuzz
+        FUZZ_AVAILABLE = True
+        _TOKEN_RATIO_KWARGS = {}
+    except ImportError:
+        FUZZ_AVAILABLE = False
 
 try:
     from difflib import SequenceMatcher
@@ -62,8 +70,15 @@ class DeduplicationEngine:
         self.title_hashes = set()
         self.content_hashes = set()
         
-        if config.use_fuzzy_matching and not FUZZYWUZZY_AVAILABLE:
-            logger.warning("fuzzywuzzy not available, falling back to difflib")
+        # Per-run memo tables keyed by id(chunk); every public entry point
+        # clears them on exit, so ids of freed chunks are never looked up again
+        self._effective: Dict[int, str] = {}
+        self._prefix500: Dict[int, str] = {}
+        self._signature_cache: Dict[int, Tuple[str, str, str]] = {}
+        self._quality_cache: Dict[int, float] = {}
+        
+        if config.use_fuzzy_matching and not FUZZ_AVAILABLE:
+            logger.warning("rapidfuzz/fuzzywuzzy not available, falling back to difflib")
         
         if not DIFFLIB_AVAILABLE:
             logger.warning("difflib not available, some text matching features disabled")
@@ -81,47 +96,48 @@ class DeduplicationEngine:
         if not chunks:
             return []
         
-        logger.info(f"Starting deduplication of {len(chunks)} chunks")
-        
-        # Stage 1: Filter out chunks with insufficient content
-        valid_chunks = self._filter_valid_chunks(chunks)
-        logger.info(f"After content length filtering: {len(valid_chunks)} chunks")
-        
-        # Stage 2: Exact URL deduplication
-        url_deduped = self._deduplicate_by_url(valid_chunks)
-        logger.info(f"After URL deduplication: {len(url_deduped)} chunks")
-        
-        # Stage 3: Title-based deduplication
-        title_deduped = self._deduplicate_by_title(url_deduped)
-        logger.info(f"After title deduplication: {len(title_deduped)} chunks")
-        
-        # Stage 4: Content hash deduplication
-        hash_deduped = self._deduplicate_by_content_hash(title_deduped)
-        logger.info(f"After content hash deduplication: {len(hash_deduped)} chunks")
-        
-        # Stage 5: Semantic similarity deduplication
-        if self.embedding_manager:
-            semantic_deduped = self._deduplicate_by_semantic_similarity(hash_deduped)
-            logger.info(f"After semantic deduplication: {len(semantic_deduped)} chunks")
-        else:
-            semantic_deduped = hash_deduped
-            logger.info("Skipping semantic deduplication (no embedding manager)")
-        
-        # Stage 6: Final fuzzy content matching
-        final_deduped = self._deduplicate_by_fuzzy_content(semantic_deduped)
-        logger.info(f"Final deduplication result: {len(final_deduped)} chunks")
-        
-        # Clear caches for next run
-        self._clear_caches()
-        
-        return final_deduped
+        try:
+            logger.info(f"Starting deduplication of {len(chunks)} chunks")
+            
+            # Stage 1: Filter out chunks with insufficient content
+            valid_chunks = self._filter_valid_chunks(chunks)
+            logger.info(f"After content length filtering: {len(valid_chunks)} chunks")
+            
+            # Stage 2: Exact URL deduplication
+            url_deduped = self._deduplicate_by_url(valid_chunks)
+            logger.info(f"After URL deduplication: {len(url_deduped)} chunks")
+            
+            # Stage 3: Title-based deduplication
+            title_deduped = self._deduplicate_by_title(url_deduped)
+            logger.info(f"After title deduplication: {len(title_deduped)} chunks")
+            
+            # Stage 4: Content hash deduplication
+            hash_deduped = self._deduplicate_by_content_hash(title_deduped)
+            logger.info(f"After content hash deduplication: {len(hash_deduped)} chunks")
+            
+            # Stage 5: Semantic similarity deduplication
+            if self.embedding_manager:
+                semantic_deduped = self._deduplicate_by_semantic_similarity(hash_deduped)
+                logger.info(f"After semantic deduplication: {len(semantic_deduped)} chunks")
+            else:
+                semantic_deduped = hash_deduped
+                logger.info("Skipping semantic deduplication (no embedding manager)")
+            
+            # Stage 6: Final fuzzy content matching
+            final_deduped = self._deduplicate_by_fuzzy_content(semantic_deduped)
+            logger.info(f"Final deduplication result: {len(final_deduped)} chunks")
+            
+            return final_deduped
+        finally:
+            # Clear caches for next run, even on early exit or error
+            self._clear_caches()
     
     def _filter_valid_chunks(self, chunks: List[ContentChunk]) -> List[ContentChunk]:
         """Filter chunks with valid content length."""
         valid_chunks = []
         
         for chunk in chunks:
-            content = chunk.processed_content or chunk.content
+            content = self._get_effective_content(chunk)
             if len(content) >= self.config.min_content_length:
                 valid_chunks.append(chunk)
         
@@ -212,9 +228,9 @@ class DeduplicationEngine:
         if not title1 or not title2:
             return 0.0
         
-        if FUZZYWUZZY_AVAILABLE and self.config.use_fuzzy_matching:
+        if FUZZ_AVAILABLE and self.config.use_fuzzy_matching:
             # Use token sort ratio for better handling of word order differences
-            return fuzz.token_sort_ratio(title1, title2) / 100.0
+            return fuzz.token_sort_ratio(title1, title2, **_TOKEN_RATIO_KWARGS) / 100.0
         
         elif DIFFLIB_AVAILABLE:
             # Fallback to difflib
@@ -230,8 +246,7 @@ class DeduplicationEngine:
         deduped = []
         
         for chunk in chunks:
-            content = chunk.processed_content or chunk.content
-            content_hash = hashlib.sha256(content.encode()).hexdigest()
+            content_hash = chunk.content_hash
             
             if content_hash not in seen_hashes:
                 seen_hashes.add(content_hash)
@@ -247,7 +262,7 @@ class DeduplicationEngine:
             return chunks
         
         # Ensure all chunks have embeddings
-        chunks_with_embeddings = [chunk for chunk in chunks if chunk.embedding]
+        chunks_with_embeddings = [chunk for chunk in chunks if chunk.has_embedding]
         
         if len(chunks_with_embeddings) != len(chunks):
             logger.warning(f"Some chunks missing embeddings: {len(chunks_with_embeddings)}/{len(chunks)}")
@@ -292,7 +307,7 @@ class DeduplicationEngine:
                 deduped.append(chunk)
         
         # Add back chunks without embeddings
-        chunks_without_embeddings = [chunk for chunk in chunks if not chunk.embedding]
+        chunks_without_embeddings = [chunk for chunk in chunks if not chunk.has_embedding]
         deduped.extend(chunks_without_embeddings)
         
         return deduped
@@ -306,7 +321,7 @@ class DeduplicationEngine:
         content_groups = []
         
         for chunk in chunks:
-            content = (chunk.processed_content or chunk.content)[:500]  # First 500 chars for efficiency
+            content = self._get_content_prefix(chunk)  # First 500 chars for efficiency
             
             # Find best matching group
             best_group_idx = None
@@ -314,7 +329,7 @@ class DeduplicationEngine:
             
             for group_idx, group in enumerate(content_groups):
                 # Compare with first chunk in group as representative
-                representative_content = (group[0].processed_content or group[0].content)[:500]
+                representative_content = self._get_content_prefix(group[0])
                 
                 similarity = self._calculate_content_similarity(content, representative_content)
                 
@@ -344,7 +359,7 @@ class DeduplicationEngine:
         if not content1 or not content2:
             return 0.0
         
-        if FUZZYWUZZY_AVAILABLE and self.config.use_fuzzy_matching:
+        if FUZZ_AVAILABLE and self.config.use_fuzzy_matching:
             return fuzz.ratio(content1, content2) / 100.0
         
         elif DIFFLIB_AVAILABLE:
@@ -370,14 +385,25 @@ class DeduplicationEngine:
         return scored_chunks[0][1]
     
     def _calculate_chunk_quality_score(self, chunk: ContentChunk) -> float:
-        """Calculate quality score for a chunk."""
+        """Calculate quality score for a chunk (memoized per run)."""
+        key = id(chunk)
+        cached = self._quality_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        score = self._compute_chunk_quality_score(chunk)
+        self._quality_cache[key] = score
+        return score
+    
+    def _compute_chunk_quality_score(self, chunk: ContentChunk) -> float:
+        """Compute the raw quality score for a chunk."""
         score = 0.0
         
         # Source reliability score
         score += chunk.metadata.source_reliability_score * 0.4
         
         # Content length (longer is generally better, up to a point)
-        content_length = len(chunk.processed_content or chunk.content)
+        content_length = len(self._get_effective_content(chunk))
         length_score = min(content_length / 1000.0, 1.0)  # Cap at 1000 chars
         score += length_score * 0.2
         
@@ -425,57 +451,91 @@ class DeduplicationEngine:
         if not existing_chunks:
             return self.deduplicate_chunks(new_chunks), []
         
-        logger.info(f"Checking {len(new_chunks)} new chunks against {len(existing_chunks)} existing chunks")
-        
-        unique_chunks = []
-        duplicate_chunks = []
-        
-        for new_chunk in new_chunks:
-            is_duplicate = False
+        try:
+            logger.info(f"Checking {len(new_chunks)} new chunks against {len(existing_chunks)} existing chunks")
             
-            # Check against existing chunks
-            for existing_chunk in existing_chunks:
-                if self._are_chunks_duplicates(new_chunk, existing_chunk):
-                    duplicate_chunks.append(new_chunk)
-                    is_duplicate = True
-                    logger.debug(f"Found duplicate: {new_chunk.metadata.url}")
-                    break
+            unique_chunks = []
+            duplicate_chunks = []
             
-            if not is_duplicate:
-                unique_chunks.append(new_chunk)
-        
-        # Deduplicate among the unique new chunks
-        final_unique = self.deduplicate_chunks(unique_chunks)
+            for new_chunk in new_chunks:
+                is_duplicate = False
+                
+                # Check against existing chunks
+                for existing_chunk in existing_chunks:
+                    if self._are_chunks_duplicates(new_chunk, existing_chunk):
+                        duplicate_chunks.append(new_chunk)
+                        is_duplicate = True
+                        logger.debug(f"Found duplicate: {new_chunk.metadata.url}")
+                        break
+                
+                if not is_duplicate:
+                    unique_chunks.append(new_chunk)
+            
+            # Deduplicate among the unique new chunks
+            final_unique = self.deduplicate_chunks(unique_chunks)
+            
+            logger.info(f"Result: {len(final_unique)} unique, {len(duplicate_chunks)} duplicates")
+            return final_unique, duplicate_chunks
+        finally:
+            self._clear_caches()
+    
+    def _get_effective_content(self, chunk: ContentChunk) -> str:
+        """Get processed content (falling back to raw content), computed once per run."""
+        key = id(chunk)
+        content = self._effective.get(key)
+        if content is None:
+            content = chunk.processed_content or chunk.content
+            self._effective[key] = content
+        return content
+    
+    def _get_content_prefix(self, chunk: ContentChunk) -> str:
+        """Get the first 500 characters of the effective content, computed once per run."""
+        key = id(chunk)
+        prefix = self._prefix500.get(key)
+        if prefix is None:
+            prefix = self._get_effective_content(chunk)[:500]
+            self._prefix500[key] = prefix
+        return prefix
+    
+    def _get_chunk_signature(self, chunk: ContentChunk) -> Tuple[str, str, str]:
+        """
+        Get the (url, normalized title, content hash) signature of a chunk.
         
-        logger.info(f"Result: {len(final_unique)} unique, {len(duplicate_chunks)} duplicates")
-        return final_unique, duplicate_chunks
+        Signatures are computed once per chunk and memoized for the duration of
+        a run, so pairwise comparisons don't re-normalize titles or re-hash
+        content for every candidate pair.
+        """
+        key = id(chunk)
+        signature = self._signature_cache.get(key)
+        if signature is None:
+            signature = (
+                chunk.metadata.url,
+                self._normalize_title(chunk.metadata.title),
+                chunk.content_hash
+            )
+            self._signature_cache[key] = signature
+        return signature
     
     def _are_chunks_duplicates(self, chunk1: ContentChunk, chunk2: ContentChunk) -> bool:
         """Check if two chunks are duplicates using multiple criteria."""
+        url1, title1, hash1 = self._get_chunk_signature(chunk1)
+        url2, title2, hash2 = self._get_chunk_signature(chunk2)
+        
         # URL match
-        if chunk1.metadata.url == chunk2.metadata.url:
+        if url1 == url2:
             return True
         
         # Title similarity
-        title_sim = self._calculate_title_similarity(
-            self._normalize_title(chunk1.metadata.title),
-            self._normalize_title(chunk2.metadata.title)
-        )
+        title_sim = self._calculate_title_similarity(title1, title2)
         if title_sim >= 0.9:
             return True
         
         # Content hash match
-        content1 = chunk1.processed_content or chunk1.content
-        content2 = chunk2.processed_content or chunk2.content
-        
-        hash1 = hashlib.sha256(content1.encode()).hexdigest()
-        hash2 = hashlib.sha256(content2.encode()).hexdigest()
-        
         if hash1 == hash2:
             return True
         
         # Semantic similarity (if embeddings available)
-        if (self.embedding_manager and chunk1.embedding and chunk2.embedding):
+        if (self.embedding_manager and chunk1.has_embedding and chunk2.has_embedding):
             semantic_sim = self.embedding_manager.calculate_similarity(
                 chunk1.embedding, chunk2.embedding
             )
@@ -484,7 +544,9 @@ class DeduplicationEngine:
         
         # Fuzzy content similarity
         if self.config.use_fuzzy_matching:
-            content_sim = self._calculate_content_similarity(content1[:500], content2[:500])
+            content_sim = self._calculate_content_similarity(
+                self._get_content_prefix(chunk1), self._get_content_prefix(chunk2)
+            )
             if content_sim >= self.config.fuzzy_ratio_threshold / 100.0:
                 return True
         
@@ -503,29 +565,32 @@ class DeduplicationEngine:
         if not chunks:
             return []
         
-        groups = []
-        processed = set()
-        
-        for i, chunk1 in enumerate(chunks):
-            if i in processed:
-                continue
+        try:
+            groups = []
+            processed = set()
             
-            # Start new group
-            group = [chunk1]
-            processed.add(i)
-            
-            # Find all duplicates of this chunk
-            for j, chunk2 in enumerate(chunks[i + 1:], i + 1):
-                if j in processed:
+            for i, chunk1 in enumerate(chunks):
+                if i in processed:
                     continue
                 
-                if self._are_chunks_duplicates(chunk1, chunk2):
-                    group.append(chunk2)
-                    processed.add(j)
+                # Start new group
+                group = [chunk1]
+                processed.add(i)
+                
+                # Find all duplicates of this chunk
+                for j, chunk2 in enumerate(chunks[i + 1:], i + 1):
+                    if j in processed:
+                        continue
+                    
+                    if self._are_chunks_duplicates(chunk1, chunk2):
+                        group.append(chunk2)
+                        processed.add(j)
+                
+                groups.append(group)
             
-            groups.append(group)
-        
-        return groups
+            return groups
+        finally:
+            self._clear_caches()
     
     def get_deduplication_stats(self, original_chunks: List[ContentChunk], 
                               deduped_chunks: List[ContentChunk]) -> Dict[str, Any]:
@@ -570,3 +635,7 @@ class DeduplicationEngine:
         self.url_cache.clear()
         self.title_hashes.clear()
         self.content_hashes.clear()
+        self._effective.clear()
+        self._prefix500.clear()
+        self._signature_cache.clear()
+        self._quality_cache.clear()
@@ -7,12 +7,18 @@ with support for batch processing, caching, and pgvector storage integration.
 
 import logging
 import asyncio
+import atexit
+import math
+import re
 import numpy as np
 from typing import List, Optional, Dict, Any, Tuple, Union
 from pathlib import Path
 import json
 import hashlib
-import pickle
+import sqlite3
+import threading
+import weakref
+import time
 from concurrent.futures import ThreadPoolExecutor
 
 try:
@@ -28,70 +34,265 @@ try:
 except ImportError:
     SKLEARN_AVAILABLE = False
 
+try:
+    from scipy.linalg.blas import ssyrk
+    SCIPY_BLAS_AVAILABLE = True
+except ImportError:
+    SCIPY_BLAS_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    import simsimd
+    SIMSIMD_AVAILABLE = True
+except ImportError:
+    SIMSIMD_AVAILABLE = False
+
 from .models import ContentChunk, EmbeddingVector
 from .config import EmbeddingConfig
 
 logger = logging.getLogger(__name__)
 
+_WHITESPACE_RE = re.compile(r'\s+')
+# Any whitespace other than a single space, or two whitespace chars in a row
+_UNNORMALIZED_WHITESPACE_RE = re.compile(r'[^\S ]|\s\s')
+
+
+def _quantize_int8(vector: EmbeddingVector) -> Tuple[np.ndarray, float]:
+    """Symmetrically quantize a vector to int8, returning (values, scale)."""
+    vector = np.asarray(vector, dtype=np.float32)
+    max_abs = float(np.max(np.abs(vector))) if vector.size else 0.0
+    scale = max_abs / 127.0 if max_abs > 0 else 1.0
+    quantized = np.round(vector / scale).astype(np.int8)
+    return quantized, scale
+
+
+def _dequantize_int8(quantized: np.ndarray, scale: float) -> EmbeddingVector:
+    """Restore a float32 vector from its int8 quantization."""
+    return quantized.astype(np.float32) * np.float32(scale)
+
+
+def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """Scale a vector (or each row of a matrix) to unit L2 norm in place."""
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    np.divide(vectors, norms, out=vectors, where=norms > 0)
+    return vectors
+
+
+def _buffer_owner(array: np.ndarray) -> Any:
+    """Return the object owning an array's memory (the array itself if not a view)."""
+    return array if array.base is None else array.base
+
+
+def _cosine_similarity_matrix_float32(matrix: np.ndarray) -> np.ndarray:
+    """
+    Pairwise cosine similarity of the rows of a float32 matrix.
+    
+    Uses BLAS ssyrk to compute only one triangle of the Gram matrix when
+    SciPy is available, then mirrors it; the diagonal holds the squared norms.
+    """
+    if SCIPY_BLAS_AVAILABLE:
+        gram = np.triu(ssyrk(1.0, matrix))
+        gram = gram + np.triu(gram, 1).T
+    else:
+        gram = matrix @ matrix.T
+    
+    norms = np.sqrt(np.diagonal(gram))
+    denominator = np.outer(norms, norms)
+    return np.divide(gram, denominator, out=np.zeros_like(gram), where=denominator > 0)
+
 
 class EmbeddingCache:
     """
-    Simple file-based cache for embeddings to avoid recomputing.
+    SQLite-backed cache for embeddings to avoid recomputing.
+    
+    Embeddings are stored int8-quantized with a per-vector scale, which is
+    ~4x smaller than float32 with negligible cosine-similarity distortion.
+    Each entry is written individually (WAL journal), so inserts are O(1)
+    and the least recently used rows are evicted once the table grows past
+    ``max_entries``. Once closed, lookups miss and writes are dropped.
     """
     
-    def __init__(self, cache_dir: Optional[str] = None):
+    # Bump when the on-disk entry format changes so stale caches are ignored
+    FORMAT_VERSION = 3
+    
+    # How many inserts to allow between row-count checks for eviction
+    EVICTION_CHECK_INTERVAL = 100
+    
+    # Maximum number of keys bound into a single IN (...) query
+    MAX_QUERY_PARAMS = 500
+    
+    def __init__(self, cache_dir: Optional[str] = None, max_entries: int = 100_000):
         """Initialize embedding cache."""
         self.cache_dir = Path(cache_dir) if cache_dir else Path.home() / ".cache" / "news_aggregator" / "embeddings"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.cache_file = self.cache_dir / "embedding_cache.pkl"
-        self._cache = self._load_cache()
-    
-    def _load_cache(self) -> Dict[str, List[float]]:
-        """Load cache from disk."""
-        try:
-            if self.cache_file.exists():
-                with open(self.cache_file, 'rb') as f:
-                    return pickle.load(f)
-        except Exception as e:
-            logger.warning(f"Failed to load embedding cache: {e}")
-        return {}
+        self.cache_file = self.cache_dir / f"embedding_cache_v{self.FORMAT_VERSION}.sqlite"
+        self.max_entries = max_entries
+        self._key_prefixes: Dict[str, bytes] = {}
+        self._inserts_since_check = 0
+        self._lock = threading.Lock()
+        self._conn = self._connect()
     
-    def _save_cache(self):
-        """Save cache to disk."""
-        try:
-            with open(self.cache_file, 'wb') as f:
-                pickle.dump(self._cache, f)
-        except Exception as e:
-            logger.warning(f"Failed to save embedding cache: {e}")
+    def _connect(self) -> sqlite3.Connection:
+        """Open the cache database and ensure the schema exists."""
+        # Autocommit mode; the encode path may run on an executor thread
+        conn = sqlite3.connect(str(self.cache_file), isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS embeddings (
+                key BLOB PRIMARY KEY,
+                emb BLOB NOT NULL,
+                scale REAL NOT NULL,
+                created INTEGER NOT NULL,
+                last_used INTEGER NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_embeddings_last_used ON embeddings (last_used)")
+        return conn
     
-    def _get_cache_key(self, text: str, model_name: str) -> str:
+    def _get_cache_key(self, text: str, model_name: str) -> bytes:
         """Generate cache key for text and model."""
-        content = f"{model_name}:{text}"
-        return hashlib.sha256(content.encode()).hexdigest()
+        prefix = self._key_prefixes.get(model_name)
+        if prefix is None:
+            prefix = self._key_prefixes[model_name] = model_name.encode() + b":"
+        content = prefix + text.encode()
+        # Keys only need to be collision-resistant, not cryptographic
+        if XXHASH_AVAILABLE:
+            return xxhash.xxh3_128_digest(content)
+        return hashlib.sha256(content).digest()
     
-    def get(self, text: str, model_name: str) -> Optional[List[float]]:
+    def get(self, text: str, model_name: str) -> Optional[EmbeddingVector]:
         """Get embedding from cache."""
         key = self._get_cache_key(text, model_name)
-        return self._cache.get(key)
+        with self._lock:
+            if self._conn is None:
+                return None
+            row = self._conn.execute(
+                "SELECT emb, scale FROM embeddings WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE embeddings SET last_used = ? WHERE key = ?", (time.time_ns(), key)
+            )
+        return _dequantize_int8(np.frombuffer(row[0], dtype=np.int8), row[1])
     
-    def set(self, text: str, model_name: str, embedding: List[float]):
+    def set(self, text: str, model_name: str, embedding: EmbeddingVector):
         """Store embedding in cache."""
         key = self._get_cache_key(text, model_name)
-        self._cache[key] = embedding
+        quantized, scale = _quantize_int8(embedding)
+        now = time.time_ns()
+        with self._lock:
+            if self._conn is None:
+                return
+            self._conn.execute(
+                "INSERT OR REPLACE INTO embeddings (key, emb, scale, created, last_used) VALUES (?, ?, ?, ?, ?)",
+                (key, quantized.tobytes(), scale, now, now)
+            )
+            self._inserts_since_check += 1
+            if self._inserts_since_check >= self.EVICTION_CHECK_INTERVAL:
+                self._evict_if_needed()
+    
+    def get_many(self, texts: List[str], model_name: str) -> Dict[str, EmbeddingVector]:
+        """
+        Look up several texts at once.
         
-        # Periodically save cache (every 100 entries)
-        if len(self._cache) % 100 == 0:
-            self._save_cache()
+        Args:
+            texts: Texts to look up (duplicates are fine)
+            model_name: Model the embeddings were produced with
+            
+        Returns:
+            Mapping of text to embedding for the texts found in the cache
+        """
+        keys = {self._get_cache_key(text, model_name): text for text in texts}
+        key_list = list(keys)
+        found: Dict[str, EmbeddingVector] = {}
+        now = time.time_ns()
+        
+        with self._lock:
+            if self._conn is None:
+                return found
+            # Stay well under SQLite's bound-parameter limit
+            for start in range(0, len(key_list), self.MAX_QUERY_PARAMS):
+                batch = key_list[start:start + self.MAX_QUERY_PARAMS]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, emb, scale FROM embeddings WHERE key IN ({placeholders})", batch
+                ).fetchall()
+                for key, emb, scale in rows:
+                    found[keys[key]] = _dequantize_int8(np.frombuffer(emb, dtype=np.int8), scale)
+                if rows:
+                    self._conn.executemany(
+                        "UPDATE embeddings SET last_used = ? WHERE key = ?",
+                        [(now, row[0]) for row in rows]
+                    )
+        
+        return found
+    
+    def set_many(self, items: List[Tuple[str, EmbeddingVector]], model_name: str):
+        """Store several (text, embedding) pairs in a single transaction."""
+        if not items:
+            return
+        
+        now = time.time_ns()
+        rows = []
+        for text, embedding in items:
+            quantized, scale = _quantize_int8(embedding)
+            rows.append((self._get_cache_key(text, model_name), quantized.tobytes(), scale, now, now))
+        
+        with self._lock:
+            if self._conn is None:
+                return
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, emb, scale, created, last_used) VALUES (?, ?, ?, ?, ?)",
+                    rows
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._inserts_since_check += len(rows)
+            if self._inserts_since_check >= self.EVICTION_CHECK_INTERVAL:
+                self._evict_if_needed()
+    
+    def _evict_if_needed(self):
+        """Drop least recently used rows once the table exceeds max_entries."""
+        self._inserts_since_check = 0
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM embeddings WHERE key IN "
+                "(SELECT key FROM embeddings ORDER BY last_used ASC LIMIT ?)",
+                (excess,)
+            )
+            logger.debug(f"Evicted {excess} embeddings from cache")
     
     def clear(self):
         """Clear cache."""
-        self._cache.clear()
-        if self.cache_file.exists():
-            self.cache_file.unlink()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM embeddings")
+    
+    def close(self):
+        """Close the cache database. Safe to call more than once."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
     
-    def __del__(self):
-        """Save cache on destruction."""
-        self._save_cache()
+    def __enter__(self) -> 'EmbeddingCache':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
 
 class EmbeddingManager:
@@ -116,8 +317,18 @@ class EmbeddingManager:
         self.config = config
         self.model = None
         self.device = None
-        self.cache = EmbeddingCache(config.cache_dir) if config.cache_dir else None
-        self._executor = ThreadPoolExecutor(max_workers=4)
+        self.cache = EmbeddingCache(config.cache_dir, config.cache_max_entries) if config.cache_dir else None
+        if self.cache is not None:
+            atexit.register(self.cache.close)
+        # With normalized embeddings cosine similarity is a plain dot product,
+        # but only for arrays this manager produced (and so knows are unit-norm);
+        # they are tracked by the array owning their memory, so row views count
+        self._normalized = config.normalize_embeddings
+        self._produced: 'weakref.WeakValueDictionary[int, np.ndarray]' = weakref.WeakValueDictionary()
+        # Created on first async call with a single worker: the model's
+        # tokenizer is not thread-safe, and length-sorted batching inside one
+        # encode call already keeps the device busy
+        self._executor: Optional[ThreadPoolExecutor] = None
         
         if not SENTENCE_TRANSFORMERS_AVAILABLE:
             raise ImportError("sentence-transformers is required for embedding generation")
@@ -148,6 +359,12 @@ class EmbeddingManager:
             if hasattr(self.model, 'max_seq_length'):
                 self.model.max_seq_length = self.config.max_length
             
+            # Half precision halves memory traffic and uses tensor cores;
+            # outputs are upcast to float32 when copied off the device
+            if self.device == "cuda" and self.config.use_fp16:
+                self.model.half()
+                logger.info("Embedding model running in fp16")
+            
             logger.info(f"Embedding model loaded successfully on {self.device}")
             logger.info(f"Model dimension: {self.model.get_sentence_embedding_dimension()}")
             
@@ -162,6 +379,25 @@ class EmbeddingManager:
             return self.model.get_sentence_embedding_dimension()
         return 384  # Default for all-MiniLM-L6-v2
     
+    def _track_normalized(self, array: np.ndarray) -> np.ndarray:
+        """Record a unit-norm array (or matrix of unit-norm rows) produced by this manager."""
+        if self._normalized:
+            owner = _buffer_owner(array)
+            if isinstance(owner, np.ndarray):
+                self._produced[id(owner)] = owner
+        return array
+    
+    def _is_tracked(self, vector: Any) -> bool:
+        """Whether a vector or matrix is (a view of) an array from _track_normalized."""
+        if not self._normalized or not isinstance(vector, np.ndarray):
+            return False
+        owner = _buffer_owner(vector)
+        return self._produced.get(id(owner)) is owner
+    
+    def _zero_vector(self) -> EmbeddingVector:
+        """Fallback embedding used when encoding fails."""
+        return np.zeros(self.embedding_dimension, dtype=np.float32)
+    
     def _preprocess_text_for_embedding(self, text: str) -> str:
         """
         Preprocess text before embedding generation.
@@ -179,15 +415,14 @@ class EmbeddingManager:
         if len(text) > self.config.max_length * 4:  # Rough character estimate
             text = text[:self.config.max_length * 4]
         
-        # Basic cleaning for embedding
-        text = text.strip()
+        # Fast path: already-clean text needs no rewrite
+        if not _UNNORMALIZED_WHITESPACE_RE.search(text) and text == text.strip():
+            return text
         
-        # Remove excessive newlines
-        text = ' '.join(text.split())
-        
-        return text
+        # Collapse whitespace runs (including newlines) in a single pass
+        return _WHITESPACE_RE.sub(' ', text).strip()
     
-    def encode_single(self, text: str, use_cache: bool = True) -> List[float]:
+    def encode_single(self, text: str, use_cache: bool = True) -> EmbeddingVector:
         """
         Generate embedding for a single text.
         
@@ -196,10 +431,10 @@ class EmbeddingManager:
             use_cache: Whether to use caching
             
         Returns:
-            Embedding vector as list of floats
+            Embedding vector as a float32 array
         """
         if not text:
-            return [0.0] * self.embedding_dimension
+            return self._zero_vector()
         
         # Preprocess text
         processed_text = self._preprocess_text_for_embedding(text)
@@ -208,124 +443,191 @@ class EmbeddingManager:
         if use_cache and self.cache:
             cached_embedding = self.cache.get(processed_text, self.config.model_name)
             if cached_embedding is not None:
-                return cached_embedding
+                if self._normalized:
+                    _normalize_rows(cached_embedding)
+                return self._track_normalized(cached_embedding)
         
         try:
             # Generate embedding
-            embedding = self.model.encode(
-                processed_text,
-                normalize_embeddings=self.config.normalize_embeddings,
-                show_progress_bar=False
-            )
-            
-            # Convert to list
-            embedding_list = embedding.tolist()
-            
-            # Cache result
-            if use_cache and self.cache:
-                self.cache.set(processed_text, self.config.model_name, embedding_list)
-            
-            return embedding_list
+            with torch.inference_mode():
+                embedding = self.model.encode(
+                    processed_text,
+                    normalize_embeddings=self.config.normalize_embeddings,
+                    show_progress_bar=False,
+                    convert_to_numpy=True
+                ).astype(np.float32, copy=False)
             
         except Exception as e:
             logger.error(f"Failed to generate embedding: {e}")
-            return [0.0] * self.embedding_dimension
+            return self._zero_vector()
+        
+        # Cache result; a cache failure must not discard the embedding
+        if use_cache and self.cache:
+            try:
+                self.cache.set(processed_text, self.config.model_name, embedding)
+            except Exception as e:
+                logger.warning(f"Failed to cache embedding: {e}")
+        
+        return self._track_normalized(embedding)
     
-    def encode_batch(self, texts: List[str], use_cache: bool = True) -> List[List[float]]:
+    def _encode_uncached(self, texts: List[str]) -> np.ndarray:
         """
-        Generate embeddings for multiple texts efficiently.
+        Run preprocessed texts through the model, bypassing the cache.
+        
+        Each distinct text is embedded once and scattered back to every row
+        that needs it (republished headlines, repeated boilerplate).
+        
+        Args:
+            texts: Preprocessed input texts
+            
+        Returns:
+            Array of shape (len(texts), embedding_dimension)
+        """
+        unique_positions: Dict[str, int] = {}
+        inverse = [unique_positions.setdefault(text, len(unique_positions)) for text in texts]
+        unique_texts = list(unique_positions)
+        
+        logger.debug(f"Generating embeddings for {len(unique_texts)} texts")
+        
+        # Process in length-sorted batches so each batch pads to a
+        # similar sequence length instead of the longest input overall
+        batch_size = self.config.batch_size
+        embeddings = np.empty((len(unique_texts), self.embedding_dimension), dtype=np.float32)
+        order = np.argsort([len(text) for text in unique_texts], kind="stable")
+        
+        with torch.inference_mode():
+            for i in range(0, len(order), batch_size):
+                batch_indices = order[i:i + batch_size]
+                batch = [unique_texts[j] for j in batch_indices]
+                
+                # fp16 results are upcast on assignment
+                embeddings[batch_indices] = self.model.encode(
+                    batch,
+                    normalize_embeddings=self.config.normalize_embeddings,
+                    show_progress_bar=len(unique_texts) > 50,
+                    batch_size=len(batch),
+                    convert_to_numpy=True
+                )
+        
+        if len(unique_texts) == len(texts):
+            return embeddings
+        return embeddings[inverse]
+    
+    def encode_batch_as_matrix(self, texts: List[str], use_cache: bool = True) -> np.ndarray:
+        """
+        Generate embeddings for multiple texts as a single float32 matrix.
         
         Args:
             texts: List of input texts
             use_cache: Whether to use caching
             
         Returns:
-            List of embedding vectors
+            Array of shape (len(texts), embedding_dimension), one row per text
         """
         if not texts:
-            return []
+            return np.empty((0, self.embedding_dimension), dtype=np.float32)
         
         # Preprocess texts
         processed_texts = [self._preprocess_text_for_embedding(text) for text in texts]
         
-        # Check cache for all texts
-        embeddings = []
-        texts_to_embed = []
-        indices_to_embed = []
-        
-        for i, text in enumerate(processed_texts):
-            if use_cache and self.cache:
-                cached_embedding = self.cache.get(text, self.config.model_name)
-                if cached_embedding is not None:
-                    embeddings.append(cached_embedding)
-                    continue
-            
-            # Need to embed this text
-            embeddings.append(None)  # Placeholder
-            texts_to_embed.append(text)
-            indices_to_embed.append(i)
-        
-        # Generate embeddings for uncached texts
-        if texts_to_embed:
+        # Fast path: no cache, everything goes through the model
+        if not (use_cache and self.cache):
             try:
-                logger.debug(f"Generating embeddings for {len(texts_to_embed)} texts")
-                
-                # Process in batches
-                batch_size = self.config.batch_size
-                new_embeddings = []
-                
-                for i in range(0, len(texts_to_embed), batch_size):
-                    batch = texts_to_embed[i:i + batch_size]
-                    
-                    batch_embeddings = self.model.encode(
-                        batch,
-                        normalize_embeddings=self.config.normalize_embeddings,
-                        show_progress_bar=len(texts_to_embed) > 50,
-                        batch_size=len(batch)
-                    )
-                    
-                    # Convert to list format
-                    for embedding in batch_embeddings:
-                        new_embeddings.append(embedding.tolist())
-                
-                # Fill in the embeddings
-                for i, embedding in enumerate(new_embeddings):
-                    idx = indices_to_embed[i]
-                    embeddings[idx] = embedding
-                    
-                    # Cache the result
-                    if use_cache and self.cache:
-                        text = texts_to_embed[i]
-                        self.cache.set(text, self.config.model_name, embedding)
-                
+                return self._track_normalized(self._encode_uncached(processed_texts))
             except Exception as e:
                 logger.error(f"Failed to generate batch embeddings: {e}")
-                # Fill with zero vectors
-                zero_vector = [0.0] * self.embedding_dimension
-                for idx in indices_to_embed:
-                    embeddings[idx] = zero_vector
+                return np.zeros((len(texts), self.embedding_dimension), dtype=np.float32)
+        
+        # Check cache for all texts in one lookup
+        cached = self.cache.get_many(processed_texts, self.config.model_name)
+        indices_to_embed = [i for i, text in enumerate(processed_texts) if text not in cached]
+        
+        # Fast path: every text was cached
+        if not indices_to_embed:
+            matrix = np.stack([cached[text] for text in processed_texts])
+            # Cached rows lose unit norm slightly to int8 quantization
+            return self._track_normalized(_normalize_rows(matrix)) if self._normalized else matrix
+        
+        matrix = np.empty((len(texts), self.embedding_dimension), dtype=np.float32)
+        if cached:
+            cached_rows = [i for i, text in enumerate(processed_texts) if text in cached]
+            matrix[cached_rows] = [cached[processed_texts[i]] for i in cached_rows]
+            if self._normalized:
+                matrix[cached_rows] = _normalize_rows(matrix[cached_rows])
+        
+        # Generate embeddings for uncached texts
+        texts_to_embed = [processed_texts[i] for i in indices_to_embed]
+        try:
+            new_embeddings = self._encode_uncached(texts_to_embed)
+        except Exception as e:
+            logger.error(f"Failed to generate batch embeddings: {e}")
+            # Fill with zero vectors
+            matrix[indices_to_embed] = 0.0
+            return matrix
         
-        return embeddings
+        matrix[indices_to_embed] = new_embeddings
+        
+        # Cache the results in one write (one entry per distinct text); a
+        # cache failure must not discard the embeddings just computed
+        try:
+            self.cache.set_many(list(dict(zip(texts_to_embed, new_embeddings)).items()), self.config.model_name)
+        except Exception as e:
+            logger.warning(f"Failed to cache batch embeddings: {e}")
+        
+        return self._track_normalized(matrix)
     
-    async def encode_batch_async(self, texts: List[str], use_cache: bool = True) -> List[List[float]]:
+    def encode_batch(self, texts: List[str], use_cache: bool = True) -> List[EmbeddingVector]:
         """
-        Asynchronously generate embeddings for multiple texts.
+        Generate embeddings for multiple texts efficiently.
         
         Args:
             texts: List of input texts
             use_cache: Whether to use caching
             
         Returns:
-            List of embedding vectors
+            List of embedding vectors (row views of one float32 matrix)
+        """
+        if not texts:
+            return []
+        return list(self.encode_batch_as_matrix(texts, use_cache))
+    
+    async def encode_batch_as_matrix_async(self, texts: List[str], use_cache: bool = True) -> np.ndarray:
+        """
+        Asynchronously generate embeddings for multiple texts as a float32 matrix.
+        
+        Args:
+            texts: List of input texts
+            use_cache: Whether to use caching
+            
+        Returns:
+            Array of shape (len(texts), embedding_dimension)
         """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embed")
+        
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(
             self._executor, 
-            self.encode_batch, 
+            self.encode_batch_as_matrix, 
             texts, 
             use_cache
         )
     
+    async def encode_batch_async(self, texts: List[str], use_cache: bool = True) -> List[EmbeddingVector]:
+        """
+        Asynchronously generate embeddings for multiple texts.
+        
+        Args:
+            texts: List of input texts
+            use_cache: Whether to use caching
+            
+        Returns:
+            List of embedding vectors
+        """
+        if not texts:
+            return []
+        return list(await self.encode_batch_as_matrix_async(texts, use_cache))
+    
     def embed_chunks(self, chunks: List[ContentChunk], use_cache: bool = True) -> List[ContentChunk]:
         """
         Generate embeddings for content chunks.
@@ -342,18 +644,13 @@ class EmbeddingManager:
         
         logger.info(f"Generating embeddings for {len(chunks)} chunks")
         
-        # Extract texts for embedding
-        texts = []
-        for chunk in chunks:
-            # Use processed content if available, otherwise original content
-            text = chunk.processed_content or chunk.content
-            texts.append(text)
-        
-        # Generate embeddings
-        embeddings = self.encode_batch(texts, use_cache)
+        # Use processed content if available, otherwise original content
+        matrix = self.encode_batch_as_matrix(
+            [chunk.processed_content or chunk.content for chunk in chunks], use_cache
+        )
         
-        # Assign embeddings to chunks
-        for chunk, embedding in zip(chunks, embeddings):
+        # Each chunk gets a row view of the matrix (no copy)
+        for chunk, embedding in zip(chunks, matrix):
             chunk.embedding = embedding
         
         logger.info("Embedding generation completed")
@@ -375,23 +672,18 @@ class EmbeddingManager:
         
         logger.info(f"Generating embeddings for {len(chunks)} chunks (async)")
         
-        # Extract texts for embedding
-        texts = []
-        for chunk in chunks:
-            text = chunk.processed_content or chunk.content
-            texts.append(text)
-        
-        # Generate embeddings asynchronously
-        embeddings = await self.encode_batch_async(texts, use_cache)
+        matrix = await self.encode_batch_as_matrix_async(
+            [chunk.processed_content or chunk.content for chunk in chunks], use_cache
+        )
         
-        # Assign embeddings to chunks
-        for chunk, embedding in zip(chunks, embeddings):
+        # Each chunk gets a row view of the matrix (no copy)
+        for chunk, embedding in zip(chunks, matrix):
             chunk.embedding = embedding
         
         logger.info("Async embedding generation completed")
         return chunks
     
-    def calculate_similarity(self, embedding1: List[float], embedding2: List[float]) -> float:
+    def calculate_similarity(self, embedding1: EmbeddingVector, embedding2: EmbeddingVector) -> float:
         """
         Calculate cosine similarity between two embeddings.
         
@@ -402,14 +694,26 @@ class EmbeddingManager:
         Returns:
             Cosine similarity score (0-1)
         """
+        if self._is_tracked(embedding1) and self._is_tracked(embedding2):
+            return float(np.dot(embedding1, embedding2))
+        
+        if SIMSIMD_AVAILABLE:
+            # SimSIMD returns cosine distance from SIMD-specialized kernels
+            a = np.ascontiguousarray(embedding1, dtype=np.float32)
+            b = np.ascontiguousarray(embedding2, dtype=np.float32)
+            # SimSIMD puts zero vectors (failed encodings) at distance 0; they match nothing
+            if not a.any() or not b.any():
+                return 0.0
+            return 1.0 - float(simsimd.cosine(a, b))
+        
         if not SKLEARN_AVAILABLE:
             # Fallback to manual cosine similarity
             return self._cosine_similarity_manual(embedding1, embedding2)
         
         try:
             # Reshape for sklearn
-            emb1 = np.array(embedding1).reshape(1, -1)
-            emb2 = np.array(embedding2).reshape(1, -1)
+            emb1 = np.asarray(embedding1, dtype=np.float32).reshape(1, -1)
+            emb2 = np.asarray(embedding2, dtype=np.float32).reshape(1, -1)
             
             similarity = cosine_similarity(emb1, emb2)[0][0]
             return float(similarity)
@@ -418,29 +722,22 @@ class EmbeddingManager:
             logger.error(f"Failed to calculate similarity: {e}")
             return 0.0
     
-    def _cosine_similarity_manual(self, vec1: List[float], vec2: List[float]) -> float:
+    def _cosine_similarity_manual(self, vec1: EmbeddingVector, vec2: EmbeddingVector) -> float:
         """Manual cosine similarity calculation."""
-        try:
-            # Convert to numpy arrays
-            a = np.array(vec1)
-            b = np.array(vec2)
-            
-            # Calculate cosine similarity
-            dot_product = np.dot(a, b)
-            norm_a = np.linalg.norm(a)
-            norm_b = np.linalg.norm(b)
-            
-            if norm_a == 0 or norm_b == 0:
-                return 0.0
-            
-            similarity = dot_product / (norm_a * norm_b)
-            return float(similarity)
-            
-        except Exception as e:
-            logger.error(f"Manual similarity calculation failed: {e}")
+        a = np.ascontiguousarray(vec1, dtype=np.float32)
+        b = np.ascontiguousarray(vec2, dtype=np.float32)
+        
+        # A single sqrt over the product of squared norms avoids two
+        # np.linalg.norm dispatches per pair
+        dot_product = float(np.dot(a, b))
+        squared_norms = float(np.vdot(a, a)) * float(np.vdot(b, b))
+        
+        if squared_norms == 0.0:
             return 0.0
+        
+        return dot_product / math.sqrt(squared_norms)
     
-    def calculate_similarity_matrix(self, embeddings: List[List[float]]) -> np.ndarray:
+    def calculate_similarity_matrix(self, embeddings: List[EmbeddingVector]) -> np.ndarray:
         """
         Calculate pairwise similarity matrix for a list of embeddings.
         
@@ -450,25 +747,43 @@ class EmbeddingManager:
         Returns:
             Similarity matrix as numpy array
         """
-        if not embeddings:
+        if len(embeddings) == 0:
             return np.array([])
         
+        if self._normalized:
+            if isinstance(embeddings, np.ndarray):
+                tracked = self._is_tracked(embeddings)
+            else:
+                tracked = all(self._is_tracked(embedding) for embedding in embeddings)
+            if tracked:
+                embeddings_array = np.ascontiguousarray(embeddings, dtype=np.float32)
+            else:
+                # Vectors from elsewhere are renormalized on a private copy
+                embeddings_array = _normalize_rows(np.array(embeddings, dtype=np.float32))
+            return embeddings_array @ embeddings_array.T
+        
+        # Single float32 copy shared by every backend below
+        embeddings_array = np.ascontiguousarray(embeddings, dtype=np.float32)
+        
+        if SIMSIMD_AVAILABLE:
+            try:
+                distances = simsimd.cdist(embeddings_array, embeddings_array, metric="cosine")
+                similarities = 1.0 - np.asarray(distances)
+                # SimSIMD puts zero vectors (failed encodings) at distance 0; they match nothing
+                zero_rows = ~embeddings_array.any(axis=1)
+                if zero_rows.any():
+                    similarities[zero_rows, :] = 0.0
+                    similarities[:, zero_rows] = 0.0
+                return similarities
+            except Exception as e:
+                logger.warning(f"SimSIMD similarity matrix failed, falling back: {e}")
+        
         if not SKLEARN_AVAILABLE:
             # Manual calculation
-            n = len(embeddings)
-            similarity_matrix = np.zeros((n, n))
-            
-            for i in range(n):
-                for j in range(i, n):
-                    similarity = self._cosine_similarity_manual(embeddings[i], embeddings[j])
-                    similarity_matrix[i][j] = similarity
-                    similarity_matrix[j][i] = similarity
-            
-            return similarity_matrix
+            return _cosine_similarity_matrix_float32(embeddings_array)
         
         try:
             # Use sklearn for efficient calculation
-            embeddings_array = np.array(embeddings)
             return cosine_similarity(embeddings_array)
             
         except Exception as e:
@@ -490,30 +805,40 @@ class EmbeddingManager:
         Returns:
             List of (chunk, similarity_score) tuples, sorted by similarity
         """
-        if not target_chunk.embedding or not candidate_chunks:
+        if not target_chunk.has_embedding or not candidate_chunks:
+            return []
+        
+        candidates = [
+            chunk for chunk in candidate_chunks
+            if chunk.has_embedding and chunk.id != target_chunk.id
+        ]
+        if not candidates:
             return []
         
-        similar_chunks = []
+        # Score all candidates with a single matrix-vector product
+        tracked = self._is_tracked(target_chunk.embedding) and all(
+            self._is_tracked(chunk.embedding) for chunk in candidates
+        )
+        candidate_matrix = np.asarray([chunk.embedding for chunk in candidates], dtype=np.float32)
+        target = np.asarray(target_chunk.embedding, dtype=np.float32)
+        scores = candidate_matrix @ target
         
-        for chunk in candidate_chunks:
-            if not chunk.embedding or chunk.id == target_chunk.id:
-                continue
-            
-            similarity = self.calculate_similarity(target_chunk.embedding, chunk.embedding)
-            
-            if similarity >= threshold:
-                similar_chunks.append((chunk, similarity))
+        if not tracked:
+            norms = np.linalg.norm(candidate_matrix, axis=1) * np.linalg.norm(target)
+            scores = np.divide(scores, norms, out=np.zeros_like(scores), where=norms > 0)
         
-        # Sort by similarity (descending)
-        similar_chunks.sort(key=lambda x: x[1], reverse=True)
+        indices = np.flatnonzero(scores >= threshold)
         
-        # Limit results if requested
-        if top_k:
-            similar_chunks = similar_chunks[:top_k]
+        # Select top-k in linear time before sorting the survivors
+        if top_k and top_k < len(indices):
+            indices = indices[np.argpartition(-scores[indices], top_k - 1)[:top_k]]
         
-        return similar_chunks
+        # Sort by similarity (descending)
+        indices = indices[np.argsort(-scores[indices], kind="stable")]
+        
+        return [(candidates[i], float(scores[i])) for i in indices]
     
-    def compute_centroid(self, embeddings: List[List[float]]) -> List[float]:
+    def compute_centroid(self, embeddings: List[EmbeddingVector]) -> EmbeddingVector:
         """
         Compute the centroid of a list of embeddings.
         
@@ -521,21 +846,43 @@ class EmbeddingManager:
             embeddings: List of embedding vectors
             
         Returns:
-            Centroid embedding vector
+            Centroid embedding vector (unit-normalized when embeddings are,
+            so dot-product similarity against it remains cosine similarity)
         """
-        if not embeddings:
-            return [0.0] * self.embedding_dimension
+        if len(embeddings) == 0:
+            return self._zero_vector()
         
         try:
-            embeddings_array = np.array(embeddings)
-            centroid = np.mean(embeddings_array, axis=0)
-            return centroid.tolist()
+            if isinstance(embeddings, np.ndarray):
+                centroid = embeddings.mean(axis=0, dtype=np.float32)
+            else:
+                # Running sum avoids materializing an N x D copy of the inputs
+                dimension = len(embeddings[0])
+                centroid = np.zeros(dimension, dtype=np.float32)
+                for embedding in embeddings:
+                    if len(embedding) != dimension:
+                        raise ValueError("embeddings have inconsistent dimensions")
+                    centroid += embedding
+                centroid /= len(embeddings)
+            if self._normalized:
+                _normalize_rows(centroid)
+            return self._track_normalized(centroid)
             
         except Exception as e:
             logger.error(f"Failed to compute centroid: {e}")
-            return [0.0] * self.embedding_dimension
+            return self._zero_vector()
     
-    def __del__(self):
-        """Cleanup resources."""
-        if hasattr(self, '_executor'):
+    def close(self):
+        """Release the executor and close the embedding cache."""
+        if getattr(self, '_executor', None) is not None:
             self._executor.shutdown(wait=False)
+            self._executor = None
+        if getattr(self, 'cache', None) is not None:
+            atexit.unregister(self.cache.close)
+            self.cache.close()
+    
+    def __enter__(self) -> 'EmbeddingManager':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -9,8 +9,11 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any, Union
 from datetime import datetime
 from enum import Enum
+import hashlib
 import uuid
 
+import numpy as np
+
 
 class SourceType(Enum):
     """Enumeration of different source types for content classification."""
@@ -81,6 +84,15 @@ class ChunkMetadata:
         """Get numerical reliability score for this source."""
         return RELIABILITY_SCORES[self.reliability_tier]
     
+    @property
+    def title_lower(self) -> str:
+        """Lowercased title, cached until the title is reassigned."""
+        cached = self.__dict__.get('_title_lower')
+        if cached is None or cached[0] is not self.title:
+            cached = (self.title, self.title.lower())
+            self.__dict__['_title_lower'] = cached
+        return cached[1]
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert metadata to dictionary for JSON serialization."""
         return {
@@ -110,14 +122,14 @@ class ContentChunk:
         id: Unique identifier for the chunk
         content: The actual text content
         metadata: Associated metadata
-        embedding: Semantic embedding vector (384-dimensional for SentenceTransformers)
+        embedding: Semantic embedding vector as a float32 array (384-dimensional for SentenceTransformers)
         processed_content: Cleaned and normalized version of content
         cluster_id: ID of the cluster this chunk belongs to (if assigned)
     """
     id: str
     content: str
     metadata: ChunkMetadata
-    embedding: Optional[List[float]] = None
+    embedding: Optional[np.ndarray] = None
     processed_content: Optional[str] = None
     cluster_id: Optional[str] = None
     
@@ -126,10 +138,35 @@ class ContentChunk:
         if not self.id:
             self.id = str(uuid.uuid4())
     
+    @property
+    def has_embedding(self) -> bool:
+        """Whether a non-empty embedding vector is attached."""
+        return self.embedding is not None and len(self.embedding) > 0
+    
     @property
     def embedding_dimension(self) -> Optional[int]:
         """Get the dimension of the embedding vector."""
-        return len(self.embedding) if self.embedding else None
+        return len(self.embedding) if self.has_embedding else None
+    
+    @property
+    def content_hash(self) -> str:
+        """SHA-256 hex digest of the processed (or raw) content, cached until the text is reassigned."""
+        text = self.processed_content or self.content
+        cached = self.__dict__.get('_content_hash')
+        if cached is None or cached[0] is not text:
+            cached = (text, hashlib.sha256(text.encode()).hexdigest())
+            self.__dict__['_content_hash'] = cached
+        return cached[1]
+    
+    @property
+    def content_lower(self) -> str:
+        """Lowercased processed (or raw) content, cached until the text is reassigned."""
+        text = self.processed_content or self.content
+        cached = self.__dict__.get('_content_lower')
+        if cached is None or cached[0] is not text:
+            cached = (text, text.lower())
+            self.__dict__['_content_lower'] = cached
+        return cached[1]
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert chunk to dictionary for JSON serialization."""
@@ -138,7 +175,7 @@ class ContentChunk:
             "content": self.content,
             "processed_content": self.processed_content,
             "metadata": self.metadata.to_dict(),
-            "embedding": self.embedding,
+            "embedding": self.embedding.tolist() if isinstance(self.embedding, np.ndarray) else self.embedding,
             "cluster_id": self.cluster_id
         }
 
@@ -188,6 +225,8 @@ class ClusterMetadata:
         confidence_score: Confidence in cluster coherence (0-1)
         cluster_size: Number of chunks in the cluster
         dominant_language: Primary language of cluster content
+        final_score: Score assigned by ClusterScorer (None until scored)
+        score_components: ClusterScorer's per-factor breakdown from its latest pass
     """
     confidence_score: float
     cluster_size: int
@@ -196,6 +235,25 @@ class ClusterMetadata:
     time_range: Optional[tuple] = None
     source_types: List[SourceType] = field(default_factory=list)
     dominant_language: str = "en"
+    final_score: Optional[float] = field(default=None, compare=False)
+    score_components: Optional[tuple] = field(default=None, repr=False, compare=False)
+    
+    @property
+    def primary_ticker_upper(self) -> Optional[str]:
+        """Uppercased primary ticker, cached until the ticker is reassigned."""
+        ticker = self.primary_ticker
+        if not ticker:
+            return None
+        cached = self.__dict__.get('_primary_ticker_upper')
+        if cached is None or cached[0] is not ticker:
+            cached = (ticker, ticker.upper())
+            self.__dict__['_primary_ticker_upper'] = cached
+        return cached[1]
+    
+    @property
+    def topics_set(self) -> frozenset:
+        """Topics as a frozenset, rebuilt on each read so in-place edits are seen."""
+        return frozenset(self.topics)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert cluster metadata to dictionary."""
@@ -227,16 +285,108 @@ class ContentCluster:
     id: str
     chunks: List[ContentChunk]
     metadata: ClusterMetadata
-    centroid: Optional[List[float]] = None
+    centroid: Optional[np.ndarray] = None
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
     summary: Optional['ClusterSummary'] = None
+    _array_cache: Dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Generate UUID if no ID provided."""
         if not self.id:
             self.id = str(uuid.uuid4())
     
+    def _cached_per_chunk(self, name: str, build):
+        """
+        Return a per-chunk column, rebuilding every column when the chunks change.
+        
+        Keyed on the identity of each chunk, so adding, removing or replacing
+        chunks (in place or by assigning a new list) is picked up. Chunk
+        metadata is treated as immutable; call clear_chunk_cache() after
+        editing it in place.
+        """
+        key = tuple(map(id, self.chunks))
+        cache = self._array_cache
+        if cache.get('_chunk_ids') != key:
+            cache.clear()
+            cache['_chunk_ids'] = key
+            # Holding the chunks keeps their ids from being reused by new objects
+            cache['_chunks'] = tuple(self.chunks)
+        if name not in cache:
+            cache[name] = build()
+        return cache[name]
+    
+    def clear_chunk_cache(self):
+        """Drop the cached per-chunk columns (needed after editing chunk metadata in place)."""
+        self._array_cache.clear()
+    
+    @property
+    def timestamp_array(self) -> np.ndarray:
+        """Chunk timestamps as datetime64[us], cached for scoring."""
+        return self._cached_per_chunk(
+            'timestamps',
+            lambda: np.array([chunk.metadata.timestamp for chunk in self.chunks], dtype='datetime64[us]')
+        )
+    
+    @property
+    def latest_timestamp_us(self) -> Optional[int]:
+        """Most recent chunk timestamp as integer microseconds since the epoch (None if empty)."""
+        if not self.chunks:
+            return None
+        return self._cached_per_chunk(
+            'latest_timestamp_us', lambda: int(self.timestamp_array.max().astype(np.int64))
+        )
+    
+    @property
+    def reliability_array(self) -> np.ndarray:
+        """Chunk source reliability scores as float64, cached for scoring."""
+        return self._cached_per_chunk(
+            'reliability',
+            lambda: np.fromiter(
+                (chunk.metadata.source_reliability_score for chunk in self.chunks),
+                dtype=np.float64, count=len(self.chunks)
+            )
+        )
+    
+    @property
+    def reliability_stats(self) -> tuple:
+        """(mean reliability, count of chunks with reliability >= 0.8), cached for scoring."""
+        def build():
+            scores = self.reliability_array
+            if not len(scores):
+                return (0.0, 0)
+            return (float(scores.mean()), int(np.count_nonzero(scores >= 0.8)))
+        return self._cached_per_chunk('reliability_stats', build)
+    
+    @property
+    def chunk_sources(self) -> tuple:
+        """Source name of each chunk, cached for scoring."""
+        return self._cached_per_chunk(
+            'sources', lambda: tuple(chunk.metadata.source for chunk in self.chunks)
+        )
+    
+    @property
+    def chunk_source_types(self) -> tuple:
+        """SourceType of each chunk, cached for scoring."""
+        return self._cached_per_chunk(
+            'source_types', lambda: tuple(chunk.metadata.source_type for chunk in self.chunks)
+        )
+    
+    @property
+    def titles_lower(self) -> tuple:
+        """Lowercased title of each chunk, cached for keyword matching."""
+        return self._cached_per_chunk(
+            'titles_lower', lambda: tuple(chunk.metadata.title_lower for chunk in self.chunks)
+        )
+    
+    @property
+    def contents_lower(self) -> tuple:
+        """Lowercased processed (or raw) content of each chunk, cached for keyword matching."""
+        return self._cached_per_chunk(
+            'contents_lower',
+            lambda: tuple(chunk.content_lower for chunk in self.chunks)
+        )
+    
     @property
     def chunk_count(self) -> int:
         """Number of chunks in this cluster."""
@@ -368,6 +518,6 @@ class AggregatorOutput:
 
 
 # Type aliases for convenience
-EmbeddingVector = List[float]
+EmbeddingVector = np.ndarray
 ChunkList = List[ContentChunk]
 ClusterList = List[ContentCluster]
@@ -7,7 +7,11 @@ including HTML removal, boilerplate detection, language detection, and content c
 
 import re
 import logging
-from typing import List, Optional, Tuple, Dict, Any
+import threading
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Optional, Tuple, Dict, Any, Union, Iterator
 from urllib.parse import urlparse
 from datetime import datetime
 
@@ -17,6 +21,15 @@ try:
 except ImportError:
     BS4_AVAILABLE = False
 
+try:
+    import lxml  # noqa: F401  (C-backed parser for BeautifulSoup)
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# Prefer lxml's compiled tokenizer over the pure-Python html.parser
+BS4_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
+
 try:
     from langdetect import detect, DetectorFactory
     # Set seed for consistent language detection
@@ -26,16 +39,81 @@ except ImportError:
     LANGDETECT_AVAILABLE = False
 
 try:
-    from fuzzywuzzy import fuzz
-    FUZZYWUZZY_AVAILABLE = True
+    from rapidfuzz import fuzz  # C++ drop-in for fuzzywuzzy
+    FUZZ_AVAILABLE = True
 except ImportError:
-    FUZZYWUZZY_AVAILABLE = False
+    try:
+        from fuzzywuzzy import fuzz
+        FUZZ_AVAILABLE = True
+    except ImportError:
+        FUZZ_AVAILABLE = False
 
 from .models import ContentChunk, ChunkMetadata, SourceType, ReliabilityTier
 from .config import PreprocessingConfig
 
 logger = logging.getLogger(__name__)
 
+# Ticker candidates (e.g., AAPL, TSLA); single letters are never accepted
+_TICKER_RE = re.compile(r'\b[A-Z]{2,5}\b')
+
+# Sentence terminator followed by whitespace (excludes e.g. '3.5', 'U.S.A')
+_SENTENCE_END_RE = re.compile(r'[.!?](?=\s)')
+
+# Whitespace that str patterns match with \s but bytes patterns do not
+_STR_ONLY_SPACE_RE = re.compile(rb'[\x1c-\x1f]')
+
+# Accepted timestamp layouts: '%Y-%m-%d', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M:%S'
+# (fields after the year may drop their leading zero, as strptime allows), optionally followed by fractional seconds or a '+HH:MM' offset, which are ignored
+_DATE_RE = re.compile(
+    r'(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})'
+    r'(?:[T ](?P<hour>\d{1,2}):(?P<minute>\d{1,2}):(?P<second>\d{1,2}))?'
+    r'(?:[.+].*)?',
+    re.DOTALL
+)
+
+# Common words that match the ticker pattern
+_TICKER_STOPWORDS = frozenset({
+    'THE', 'AND', 'FOR', 'ARE', 'BUT', 'NOT', 'YOU', 'ALL', 'CAN', 'HAD', 'HER', 'WAS',
+    'ONE', 'OUR', 'OUT', 'DAY', 'GET', 'HAS', 'HIM', 'HOW', 'ITS', 'MAY', 'NEW', 'NOW',
+    'OLD', 'SEE', 'TWO', 'WHO', 'BOY', 'DID', 'LET', 'PUT', 'SAY', 'SHE', 'TOO', 'USE'
+})
+
+
+def _extract_domain(url: str) -> str:
+    """Return the URL's netloc, splitting on '/' for plain 'scheme://host/...' URLs."""
+    parts = url.split('/', 3)
+    if len(parts) >= 3 and parts[0].endswith(':') and parts[1] == '':
+        netloc = parts[2]
+        # Query, fragment or credentials in the authority need the full parser
+        if not any(c in netloc for c in '?#@'):
+            return netloc
+    
+    try:
+        return urlparse(url).netloc
+    except Exception:
+        return ""
+
+
+# langdetect draws from the global random module and loads its profiles
+# lazily, so concurrent calls are neither deterministic nor safe
+_LANGDETECT_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=4096)
+def _detect_lang_cached(sample: str) -> str:
+    """Memoized langdetect call; wire stories recur across planner categories."""
+    with _LANGDETECT_LOCK:
+        return detect(sample)
+
+
+@lru_cache(maxsize=4096)
+def _extract_ticker_cached(prefix: str) -> Optional[str]:
+    """Memoized ticker scan over a content prefix."""
+    for ticker in _TICKER_RE.findall(prefix):
+        if ticker not in _TICKER_STOPWORDS:
+            return ticker
+    return None
+
 
 class TextPreprocessor:
     """
@@ -51,6 +129,9 @@ class TextPreprocessor:
     - Duplicate detection and removal
     """
     
+    # Below this many items a batch is processed inline; pool dispatch isn't worth it
+    PARALLEL_MIN_ITEMS = 8
+    
     def __init__(self, config: PreprocessingConfig):
         """
         Initialize the text preprocessor.
@@ -59,8 +140,10 @@ class TextPreprocessor:
             config: Preprocessing configuration parameters
         """
         self.config = config
+        self._executor: Optional[ThreadPoolExecutor] = None
         self._setup_regex_patterns()
         self._setup_boilerplate_patterns()
+        self._setup_cleaning_passes()
         
         if not BS4_AVAILABLE and config.remove_html:
             logger.warning("BeautifulSoup not available, HTML removal will use regex fallback")
@@ -68,15 +151,15 @@ class TextPreprocessor:
         if not LANGDETECT_AVAILABLE and config.language_detection:
             logger.warning("langdetect not available, language detection disabled")
         
-        if not FUZZYWUZZY_AVAILABLE:
-            logger.warning("fuzzywuzzy not available, fuzzy matching disabled")
+        if not FUZZ_AVAILABLE:
+            logger.warning("rapidfuzz/fuzzywuzzy not available, fuzzy matching disabled")
     
     def _setup_regex_patterns(self):
         """Setup compiled regex patterns for efficient text processing."""
         # URL pattern
-        self.url_pattern = re.compile(
-            r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-        )
+        # Single character class equivalent to the old nested alternation
+        # ('$-_' is a range covering digits, uppercase, '%', '/', ':', '?', ...)
+        self.url_pattern = re.compile(r'https?://[a-zA-Z0-9!$-_]+')
         
         # Email pattern
         self.email_pattern = re.compile(
@@ -98,12 +181,60 @@ class TextPreprocessor:
         self.hashtag_pattern = re.compile(r'#\w+')
         self.mention_pattern = re.compile(r'@\w+')
         
-        # Common noise patterns
+        # Common noise phrases, matched as whole words in one alternation
+        self._noise_phrases = frozenset({
+            'click here', 'read more', 'learn more', 'see more',
+            'advertisement', 'sponsored', 'ad',
+            'subscribe', 'newsletter', 'unsubscribe',
+        })
+        noise_alternation = '|'.join(
+            re.escape(phrase) for phrase in sorted(self._noise_phrases, key=lambda p: (-len(p), p))
+        )
         self.noise_patterns = [
-            re.compile(r'\b(click here|read more|learn more|see more)\b', re.IGNORECASE),
-            re.compile(r'\b(advertisement|sponsored|ad)\b', re.IGNORECASE),
-            re.compile(r'\b(subscribe|newsletter|unsubscribe)\b', re.IGNORECASE),
+            re.compile(rf'\b(?:{noise_alternation})\b', re.IGNORECASE),
         ]
+        
+        # Ticker candidates (e.g., AAPL, TSLA)
+        self.ticker_pattern = _TICKER_RE
+        
+        # Source type keywords, one alternation per category (matched on lowercased text)
+        self._sec_re = self._keyword_regex(['sec.gov', 'edgar'])
+        self._breaking_re = self._keyword_regex(
+            ['breaking', 'urgent', 'developing', 'just in', 'live update', 'alert']
+        )
+        self._financial_re = self._keyword_regex(
+            ['earnings', 'quarterly', 'financial results', 'revenue', 'profit', 'stock', 'market']
+        )
+        self._social_re = self._keyword_regex(
+            ['twitter.com', 'facebook.com', 'instagram.com', 'linkedin.com', 'reddit.com']
+        )
+        self._blog_re = self._keyword_regex(['blog', 'medium.com', 'substack.com', 'wordpress'])
+        self._pr_re = self._keyword_regex(
+            ['press release', 'pr newswire', 'business wire', 'marketwatch']
+        )
+        
+        # Reliability tier domains
+        self._tier1_re = self._keyword_regex([
+            'sec.gov', 'investor.gov', 'treasury.gov', 'federalreserve.gov',
+            'nyse.com', 'nasdaq.com'
+        ])
+        self._tier2_re = self._keyword_regex([
+            'reuters.com', 'bloomberg.com', 'ap.org', 'apnews.com',
+            'marketwatch.com', 'barrons.com'
+        ])
+        self._tier3_re = self._keyword_regex([
+            'cnn.com', 'cnbc.com', 'wsj.com', 'nytimes.com', 'ft.com',
+            'economist.com', 'forbes.com', 'fortune.com'
+        ])
+        self._tier4_re = self._keyword_regex([
+            'yahoo.com', 'msn.com', 'businessinsider.com', 'techcrunch.com',
+            'seekingalpha.com', 'motleyfool.com'
+        ])
+    
+    @staticmethod
+    def _keyword_regex(keywords: List[str]) -> 're.Pattern':
+        """Compile literal substrings into one alternation for a single scan."""
+        return re.compile('|'.join(map(re.escape, keywords)))
     
     def _setup_boilerplate_patterns(self):
         """Setup patterns for common boilerplate content."""
@@ -128,12 +259,36 @@ class TextPreprocessor:
             re.compile(r'share\s+tweet\s+email', re.IGNORECASE),
         ]
     
-    def clean_html(self, text: str) -> str:
+    def _setup_cleaning_passes(self):
+        """Build the ordered list of patterns clean_content removes, from the enabled options."""
+        self._boilerplate_passes = self.boilerplate_patterns + self.noise_patterns
+        
+        clean_patterns = []
+        if self.config.remove_urls:
+            clean_patterns.append(self.url_pattern)
+        if self.config.remove_email:
+            clean_patterns.append(self.email_pattern)
+        if self.config.remove_phone:
+            clean_patterns.append(self.phone_pattern)
+        if self.config.remove_boilerplate:
+            clean_patterns.extend(self._boilerplate_passes)
+        self._clean_passes = clean_patterns
+        
+        # Bytes twins for ASCII-only text skip the Unicode tables in every pass.
+        # On ASCII input \w, \d, \b and IGNORECASE agree with the str patterns;
+        # \s does too unless the text holds \x1c-\x1f (see clean_content). A
+        # non-ASCII literal like '©' becomes UTF-8 bytes ASCII text never contains.
+        self._clean_passes_ascii = [
+            re.compile(pattern.pattern.encode('utf-8'), pattern.flags & ~re.UNICODE)
+            for pattern in clean_patterns
+        ]
+    
+    def clean_html(self, text: Union[str, bytes]) -> str:
         """
         Remove HTML tags and extract clean text.
         
         Args:
-            text: Raw text potentially containing HTML
+            text: Raw text potentially containing HTML (bytes are decoded as UTF-8)
             
         Returns:
             Clean text with HTML removed
@@ -141,9 +296,22 @@ class TextPreprocessor:
         if not text:
             return ""
         
+        # Bound parse cost on huge or pathological pages; downstream only reads a few KB
+        limit = self.config.max_html_bytes
+        if limit and len(text) > limit:
+            if isinstance(text, bytes):
+                # Back off to a UTF-8 character boundary
+                while limit > 0 and (text[limit] & 0xC0) == 0x80:
+                    limit -= 1
+            text = text[:limit]
+        
         if BS4_AVAILABLE:
             try:
-                soup = BeautifulSoup(text, 'html.parser')
+                if isinstance(text, bytes):
+                    # Declaring the encoding skips the charset sniffing pass
+                    soup = BeautifulSoup(text, BS4_PARSER, from_encoding='utf-8')
+                else:
+                    soup = BeautifulSoup(text, BS4_PARSER)
                 
                 # Remove script and style elements
                 for script in soup(["script", "style", "meta", "link"]):
@@ -162,6 +330,8 @@ class TextPreprocessor:
                 logger.warning(f"BeautifulSoup failed, using regex fallback: {e}")
         
         # Fallback to regex-based HTML removal
+        if isinstance(text, bytes):
+            text = text.decode('utf-8', errors='replace')
         clean_text = self.html_pattern.sub(' ', text)
         return clean_text
     
@@ -180,12 +350,8 @@ class TextPreprocessor:
         
         clean_text = text
         
-        # Remove known boilerplate patterns
-        for pattern in self.boilerplate_patterns:
-            clean_text = pattern.sub(' ', clean_text)
-        
-        # Remove noise patterns
-        for pattern in self.noise_patterns:
+        # Remove known boilerplate patterns, then noise patterns
+        for pattern in self._boilerplate_passes:
             clean_text = pattern.sub(' ', clean_text)
         
         return clean_text
@@ -209,25 +375,20 @@ class TextPreprocessor:
         if self.config.remove_html:
             clean_text = self.clean_html(clean_text)
         
-        # Remove URLs if enabled
-        if self.config.remove_urls:
-            clean_text = self.url_pattern.sub(' ', clean_text)
-        
-        # Remove emails if enabled
-        if self.config.remove_email:
-            clean_text = self.email_pattern.sub(' ', clean_text)
-        
-        # Remove phone numbers if enabled
-        if self.config.remove_phone:
-            clean_text = self.phone_pattern.sub(' ', clean_text)
-        
-        # Remove boilerplate if enabled
-        if self.config.remove_boilerplate:
-            clean_text = self.remove_boilerplate(clean_text)
+        # Remove enabled URLs, emails, phone numbers, then boilerplate
+        encoded = clean_text.encode('ascii') if clean_text.isascii() else None
+        if encoded is not None and not _STR_ONLY_SPACE_RE.search(encoded):
+            for pattern in self._clean_passes_ascii:
+                encoded = pattern.sub(b' ', encoded)
+            clean_text = encoded.decode('ascii')
+        else:
+            for pattern in self._clean_passes:
+                clean_text = pattern.sub(' ', clean_text)
         
         # Normalize whitespace if enabled
         if self.config.normalize_whitespace:
-            clean_text = self.whitespace_pattern.sub(' ', clean_text).strip()
+            # str.split() collapses any whitespace run in C, no regex needed
+            clean_text = ' '.join(clean_text.split())
         
         return clean_text
     
@@ -250,7 +411,7 @@ class TextPreprocessor:
             if len(sample) < 20:  # Too short for reliable detection
                 return "en"
             
-            detected_lang = detect(sample)
+            detected_lang = _detect_lang_cached(sample)
             
             # Validate against supported languages
             if detected_lang in self.config.supported_languages:
@@ -275,19 +436,38 @@ class TextPreprocessor:
         Returns:
             List of text chunks
         """
+        return list(self.iter_chunks(text, max_size, overlap))
+    
+    def iter_chunks(self, text: str, max_size: Optional[int] = None, overlap: Optional[int] = None) -> Iterator[str]:
+        """
+        Lazily split text into chunks, yielding each as it is cut.
+        
+        Streaming callers only hold one chunk at a time instead of the full list.
+        
+        Args:
+            text: Input text to chunk
+            max_size: Maximum chunk size (uses config if not provided)
+            overlap: Overlap between chunks (uses config if not provided)
+            
+        Yields:
+            Text chunks in document order
+        """
         if not text:
-            return []
+            return
         
         max_size = max_size or self.config.max_chunk_size
         overlap = overlap or self.config.chunk_overlap
         
-        # If text is smaller than max size, return as single chunk
+        # If text is smaller than max size, yield it as a single chunk
         if len(text) <= max_size:
-            return [text]
+            yield text
+            return
         
-        chunks = []
         start = 0
         
+        # Index every sentence boundary once; each chunk then bisects instead of rescanning
+        sentence_ends = [m.start() for m in _SENTENCE_END_RE.finditer(text)]
+        
         while start < len(text):
             # Find end position
             end = start + max_size
@@ -296,22 +476,16 @@ class TextPreprocessor:
             if end < len(text):
                 # Look for sentence ending in the last 100 characters
                 search_start = max(start, end - 100)
-                sentence_end = -1
-                
-                for i in range(end, search_start, -1):
-                    if text[i] in '.!?':
-                        # Make sure it's not an abbreviation
-                        if i < len(text) - 1 and text[i + 1].isspace():
-                            sentence_end = i + 1
-                            break
                 
-                if sentence_end > 0:
-                    end = sentence_end
+                # Last boundary in (search_start, end]
+                idx = bisect_right(sentence_ends, end) - 1
+                if idx >= 0 and sentence_ends[idx] > search_start:
+                    end = sentence_ends[idx] + 1
             
             # Extract chunk
             chunk = text[start:end].strip()
             if len(chunk) >= self.config.min_sentence_length:
-                chunks.append(chunk)
+                yield chunk
             
             # Move start position (with overlap)
             start = end - overlap
@@ -319,8 +493,6 @@ class TextPreprocessor:
             # Avoid infinite loop
             if start <= 0:
                 break
-        
-        return chunks
     
     def classify_source_type(self, url: str, title: str, content: str) -> SourceType:
         """
@@ -337,37 +509,47 @@ class TextPreprocessor:
         if not url:
             return SourceType.GENERAL_NEWS
         
-        url_lower = url.lower()
-        title_lower = title.lower() if title else ""
-        content_lower = content[:500].lower() if content else ""  # First 500 chars
+        return self._classify_source_type_prepared(
+            url.lower(),
+            title.lower() if title else "",
+            content[:500].lower() if content else ""  # First 500 chars
+        )
+    
+    def _classify_source_type_prepared(self, url_lower: str, title_lower: str,
+                                       content_lower: str) -> SourceType:
+        """
+        Classify source type from already-lowercased inputs.
         
+        Args:
+            url_lower: Lowercased source URL (non-empty)
+            title_lower: Lowercased title
+            content_lower: Lowercased first 500 chars of content
+            
+        Returns:
+            Classified source type
+        """
         # SEC filings
-        if any(domain in url_lower for domain in ['sec.gov', 'edgar']):
+        if self._sec_re.search(url_lower):
             return SourceType.SEC_FILING
         
         # Breaking news indicators
-        breaking_indicators = ['breaking', 'urgent', 'developing', 'just in', 'live update', 'alert']
-        if any(indicator in title_lower or indicator in content_lower for indicator in breaking_indicators):
+        if self._breaking_re.search(title_lower) or self._breaking_re.search(content_lower):
             return SourceType.BREAKING_NEWS
         
         # Financial news indicators
-        financial_indicators = ['earnings', 'quarterly', 'financial results', 'revenue', 'profit', 'stock', 'market']
-        if any(indicator in title_lower or indicator in content_lower for indicator in financial_indicators):
+        if self._financial_re.search(title_lower) or self._financial_re.search(content_lower):
             return SourceType.FINANCIAL_NEWS
         
         # Social media
-        social_domains = ['twitter.com', 'facebook.com', 'instagram.com', 'linkedin.com', 'reddit.com']
-        if any(domain in url_lower for domain in social_domains):
+        if self._social_re.search(url_lower):
             return SourceType.SOCIAL_MEDIA
         
         # Blog posts
-        blog_indicators = ['blog', 'medium.com', 'substack.com', 'wordpress']
-        if any(indicator in url_lower for indicator in blog_indicators):
+        if self._blog_re.search(url_lower):
             return SourceType.BLOG_POST
         
         # Press releases
-        pr_indicators = ['press release', 'pr newswire', 'business wire', 'marketwatch']
-        if any(indicator in url_lower or indicator in title_lower for indicator in pr_indicators):
+        if self._pr_re.search(url_lower) or self._pr_re.search(title_lower):
             return SourceType.PRESS_RELEASE
         
         return SourceType.GENERAL_NEWS
@@ -388,35 +570,19 @@ class TextPreprocessor:
         domain = source_domain.lower()
         
         # Tier 1: Official sources
-        tier_1_domains = [
-            'sec.gov', 'investor.gov', 'treasury.gov', 'federalreserve.gov',
-            'nyse.com', 'nasdaq.com'
-        ]
-        if any(d in domain for d in tier_1_domains):
+        if self._tier1_re.search(domain):
             return ReliabilityTier.TIER_1
         
         # Tier 2: Major news agencies
-        tier_2_domains = [
-            'reuters.com', 'bloomberg.com', 'ap.org', 'apnews.com',
-            'marketwatch.com', 'barrons.com'
-        ]
-        if any(d in domain for d in tier_2_domains):
+        if self._tier2_re.search(domain):
             return ReliabilityTier.TIER_2
         
         # Tier 3: Established media
-        tier_3_domains = [
-            'cnn.com', 'cnbc.com', 'wsj.com', 'nytimes.com', 'ft.com',
-            'economist.com', 'forbes.com', 'fortune.com'
-        ]
-        if any(d in domain for d in tier_3_domains):
+        if self._tier3_re.search(domain):
             return ReliabilityTier.TIER_3
         
         # Tier 4: Smaller outlets
-        tier_4_domains = [
-            'yahoo.com', 'msn.com', 'businessinsider.com', 'techcrunch.com',
-            'seekingalpha.com', 'motleyfool.com'
-        ]
-        if any(d in domain for d in tier_4_domains):
+        if self._tier4_re.search(domain):
             return ReliabilityTier.TIER_4
         
         # Default to Tier 5
@@ -456,15 +622,18 @@ class TextPreprocessor:
             language = self.detect_language(processed_content) if self.config.language_detection else "en"
             
             # Extract domain for reliability classification
-            source_domain = ""
-            try:
-                parsed_url = urlparse(url)
-                source_domain = parsed_url.netloc
-            except Exception:
-                pass
+            source_domain = _extract_domain(url)
             
-            # Classify source type and reliability
-            source_type = self.classify_source_type(url, title, processed_content)
+            # Classify source type and reliability (lowercase each input once)
+            if url:
+                url_lower = url.lower()
+                title_lower = (title or '').lower()
+                content_prefix_lower = processed_content[:500].lower()
+                source_type = self._classify_source_type_prepared(
+                    url_lower, title_lower, content_prefix_lower
+                )
+            else:
+                source_type = SourceType.GENERAL_NEWS
             reliability_tier = self.classify_reliability_tier(source_domain)
             
             # Parse timestamp (if available)
@@ -473,19 +642,23 @@ class TextPreprocessor:
                 try:
                     date_str = item.get('published_date') or item.get('timestamp')
                     if isinstance(date_str, str):
-                        # Try common date formats
-                        for fmt in ['%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M:%S', '%Y-%m-%d']:
-                            try:
-                                timestamp = datetime.strptime(date_str.split('.')[0].split('+')[0], fmt)
-                                break
-                            except ValueError:
-                                continue
+                        # One regex match for all common formats, no exception per miss
+                        match = _DATE_RE.fullmatch(date_str)
+                        if match:
+                            timestamp = datetime(*(int(g) for g in match.groups(default='0')))
                 except Exception as e:
                     logger.debug(f"Failed to parse timestamp: {e}")
             
             # Extract ticker from content or metadata
             ticker = self._extract_ticker(processed_content, item)
             
+            # Normalized text is single-space separated and stripped, so count separators
+            # instead of materializing a token list
+            if self.config.normalize_whitespace:
+                word_count = processed_content.count(' ') + 1
+            else:
+                word_count = len(processed_content.split())
+            
             # Create metadata
             metadata = ChunkMetadata(
                 timestamp=timestamp,
@@ -499,7 +672,7 @@ class TextPreprocessor:
                 ticker=ticker,
                 author=item.get('author'),
                 language=language,
-                word_count=len(processed_content.split()),
+                word_count=word_count,
                 image_urls=item.get('image_urls', [])
             )
             
@@ -519,22 +692,13 @@ class TextPreprocessor:
     
     def _extract_ticker(self, content: str, item: Dict[str, Any]) -> Optional[str]:
         """Extract stock ticker from content or metadata."""
-        # Check if ticker is in metadata
-        if 'ticker' in item:
-            return item['ticker']
-        
-        # Look for ticker patterns in content (e.g., AAPL, TSLA, etc.)
-        ticker_pattern = re.compile(r'\b[A-Z]{1,5}\b')
-        potential_tickers = ticker_pattern.findall(content[:500])  # First 500 chars
-        
-        # Filter out common words that might match pattern
-        common_words = {'THE', 'AND', 'FOR', 'ARE', 'BUT', 'NOT', 'YOU', 'ALL', 'CAN', 'HAD', 'HER', 'WAS', 'ONE', 'OUR', 'OUT', 'DAY', 'GET', 'HAS', 'HIM', 'HOW', 'ITS', 'MAY', 'NEW', 'NOW', 'OLD', 'SEE', 'TWO', 'WHO', 'BOY', 'DID', 'HAS', 'LET', 'PUT', 'SAY', 'SHE', 'TOO', 'USE'}
+        # Check if ticker is in metadata; only scan content when it's absent
+        ticker = item.get('ticker')
+        if ticker:
+            return ticker
         
-        for ticker in potential_tickers:
-            if ticker not in common_words and len(ticker) >= 2:
-                return ticker
-        
-        return None
+        # Look for ticker patterns in the first 500 chars (e.g., AAPL, TSLA, etc.)
+        return _extract_ticker_cached(content[:500])
     
     def _extract_topic(self, content: str, source_category: str) -> str:
         """Extract main topic from content."""
@@ -548,6 +712,38 @@ class TextPreprocessor:
         else:
             return 'general_news'
     
+    def _process_items(self, items: List[Dict[str, Any]], category: str) -> List[ContentChunk]:
+        """
+        Process a batch of planner items, fanning out to a thread pool when configured.
+        
+        lxml parsing releases the GIL, so HTML-heavy batches overlap across threads;
+        language detection is serialized behind a lock. Results keep the input order.
+        
+        Args:
+            items: Items from a single PlannerAgent category
+            category: Source category for the items
+            
+        Returns:
+            Successfully processed ContentChunks
+        """
+        workers = self.config.max_workers
+        if workers <= 1 or len(items) < self.PARALLEL_MIN_ITEMS:
+            results = [self.process_planner_result_item(item, category) for item in items]
+        else:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="preprocess")
+            results = self._executor.map(
+                lambda item: self.process_planner_result_item(item, category), items
+            )
+        
+        return [chunk for chunk in results if chunk]
+    
+    def close(self):
+        """Shut down the worker pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+    
     def process_planner_results(self, planner_results: Dict[str, Any]) -> List[ContentChunk]:
         """
         Process complete PlannerAgent results into ContentChunks.
@@ -583,11 +779,11 @@ class TextPreprocessor:
 
                 logger.info(f"Processing {len(results)} items from {retriever_name} as {category}")
 
-                for item in results:
-                    if isinstance(item, dict) and ('content' in item or 'body' in item or 'title' in item):
-                        chunk = self.process_planner_result_item(item, category)
-                        if chunk:
-                            chunks.append(chunk)
+                valid_items = [
+                    item for item in results
+                    if isinstance(item, dict) and ('content' in item or 'body' in item or 'title' in item)
+                ]
+                chunks.extend(self._process_items(valid_items, category))
 
             logger.info(f"Successfully processed {len(chunks)} content chunks from retriever format")
             return chunks
@@ -608,10 +804,7 @@ class TextPreprocessor:
 
             logger.info(f"Processing {len(items)} items from {category}")
 
-            for item in items:
-                chunk = self.process_planner_result_item(item, category)
-                if chunk:
-                    chunks.append(chunk)
+            chunks.extend(self._process_items(items, category))
 
         logger.info(f"Successfully processed {len(chunks)} content chunks")
         return chunks
@@ -11,15 +11,132 @@ This module implements multi-factor scoring for content clusters based on:
 
 import logging
 import math
-from typing import List, Dict, Any, Optional, Set
+import re
+from functools import lru_cache
+from typing import List, Dict, Any, NamedTuple, Optional, Sequence, Set, Tuple
 from datetime import datetime, timedelta
 from collections import Counter, defaultdict
 
+import numpy as np
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 from .models import ContentCluster, ContentChunk, SourceType, ReliabilityTier
 from .config import ScoringConfig
 
 logger = logging.getLogger(__name__)
 
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Simple keyword-based sector matching
+# In a real system, this would use more sophisticated entity recognition
+SECTOR_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    'technology': ('tech', 'software', 'ai', 'artificial intelligence', 'cloud', 'saas'),
+    'healthcare': ('health', 'medical', 'pharma', 'biotech', 'drug', 'treatment'),
+    'finance': ('bank', 'financial', 'fintech', 'payment', 'loan', 'credit'),
+    'energy': ('oil', 'gas', 'renewable', 'solar', 'wind', 'energy', 'power'),
+    'retail': ('retail', 'consumer', 'shopping', 'ecommerce', 'store'),
+    'automotive': ('auto', 'car', 'vehicle', 'tesla', 'ford', 'gm'),
+}
+
+# Breaking news indicators (substring match on lowercased title/content)
+BREAKING_INDICATORS_RE = re.compile('|'.join(map(re.escape, (
+    'breaking', 'urgent', 'developing', 'just in', 'live update',
+    'alert', 'flash', 'emergency', 'immediate'
+))))
+
+
+class _PreparedPreferences(NamedTuple):
+    """User preferences normalized once per scoring pass."""
+    watchlist_upper: frozenset
+    topics: frozenset
+    topic_count: int  # len() of the original topics list, the overlap denominator
+    keywords: Sequence[str]
+    sectors: Sequence[str]
+
+
+class _ScoreComponents(NamedTuple):
+    """Score components cached on cluster metadata by a scoring pass."""
+    version: int  # ClusterScorer._score_version that produced these values
+    chunk_key: Tuple[int, int]  # (id, len) of the chunk list when scored
+    user_preferences: Optional[Dict[str, Any]]
+    recency: float
+    reliability: float
+    relevance: float
+    base: float
+    is_breaking: bool
+    diversity_bonus: float
+    final: float
+
+
+@lru_cache(maxsize=256)
+def _keyword_automaton(keywords_lower: Tuple[str, ...]) -> Tuple[Optional[Any], int]:
+    """
+    Build an Aho-Corasick automaton over lowercased keywords.
+    
+    Args:
+        keywords_lower: Lowercased keywords (duplicates allowed)
+        
+    Returns:
+        Tuple of (automaton or None, count of empty keywords). Automaton values are
+        (keyword, multiplicity) so repeated keywords keep their weight.
+    """
+    counts = Counter(keywords_lower)
+    empty_count = counts.pop('', 0)
+    if not counts:
+        return None, empty_count
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, count in counts.items():
+        automaton.add_word(keyword, (keyword, count))
+    automaton.make_automaton()
+    return automaton, empty_count
+
+
+@lru_cache(maxsize=256)
+def _sector_automaton(sectors_lower: Tuple[str, ...]) -> Tuple[Optional[Any], Tuple[int, ...], Tuple[int, ...]]:
+    """
+    Build one Aho-Corasick automaton over the keywords of several sectors.
+    
+    Args:
+        sectors_lower: Lowercased sector names (duplicates allowed); unknown
+            sectors use their own name as the only keyword
+        
+    Returns:
+        Tuple of (automaton or None, keyword count per sector, empty keyword
+        count per sector). Automaton values are (keyword, ((sector_index,
+        multiplicity), ...)) so each hit can be attributed back to its sectors.
+    """
+    sector_weights: Dict[str, Counter] = defaultdict(Counter)
+    keyword_counts = []
+    empty_counts = []
+    for index, sector in enumerate(sectors_lower):
+        keywords = SECTOR_KEYWORDS.get(sector, (sector,))
+        keyword_counts.append(len(keywords))
+        empty_counts.append(keywords.count(''))
+        for keyword in keywords:
+            if keyword:
+                sector_weights[keyword][index] += 1
+    
+    if not sector_weights:
+        return None, tuple(keyword_counts), tuple(empty_counts)
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, weights in sector_weights.items():
+        automaton.add_word(keyword, (keyword, tuple(weights.items())))
+    automaton.make_automaton()
+    return automaton, tuple(keyword_counts), tuple(empty_counts)
+
+
+def _utc_now_us() -> int:
+    """Current UTC time as integer microseconds since the epoch."""
+    return (datetime.utcnow() - _EPOCH) // _MICROSECOND
+
 
 class ClusterScorer:
     """
@@ -43,6 +160,9 @@ class ClusterScorer:
         """
         self.config = config
         
+        # Bumped on every scoring pass; cached components from older passes are ignored
+        self._score_version = 0
+        
         # Validate configuration
         if not self._validate_config():
             raise ValueError("Invalid scoring configuration")
@@ -62,13 +182,15 @@ class ClusterScorer:
         return True
     
     def score_clusters(self, clusters: List[ContentCluster], 
-                      user_preferences: Optional[Dict[str, Any]] = None) -> List[ContentCluster]:
+                      user_preferences: Optional[Dict[str, Any]] = None,
+                      top_k: Optional[int] = None) -> List[ContentCluster]:
         """
         Score all clusters and sort by relevance.
         
         Args:
             clusters: List of content clusters to score
             user_preferences: Optional user preferences for relevance scoring
+            top_k: Only return the k best clusters (None for all)
             
         Returns:
             List of clusters sorted by score (highest first)
@@ -79,29 +201,130 @@ class ClusterScorer:
         logger.info(f"Scoring {len(clusters)} clusters")
         
         # Calculate scores for all clusters
-        scored_clusters = []
+        score_array = self._score_batch(clusters, user_preferences)
+        scores = score_array.tolist()
         
-        for cluster in clusters:
-            score = self.calculate_cluster_score(cluster, user_preferences)
-            
-            # Store score in cluster metadata for later use
-            cluster.metadata.__dict__['final_score'] = score
-            
-            scored_clusters.append((score, cluster))
+        # Store score in cluster metadata for later use
+        for cluster, score in zip(clusters, scores):
+            cluster.metadata.final_score = score
         
-        # Sort by score (descending)
-        scored_clusters.sort(key=lambda x: x[0], reverse=True)
+        # Rank indices by score (descending); ties keep input order
+        order = self._rank_indices(score_array, top_k).tolist()
         
         # Extract clusters and log top scores
-        result_clusters = [cluster for score, cluster in scored_clusters]
+        result_clusters = [clusters[i] for i in order]
         
         logger.info("Top cluster scores:")
-        for i, (score, cluster) in enumerate(scored_clusters[:5]):
-            logger.info(f"  {i+1}. Score: {score:.3f}, Chunks: {cluster.chunk_count}, "
+        for rank, i in enumerate(order[:5]):
+            cluster = clusters[i]
+            logger.info(f"  {rank+1}. Score: {scores[i]:.3f}, Chunks: {cluster.chunk_count}, "
                        f"Primary topic: {cluster.metadata.topics[0] if cluster.metadata.topics else 'N/A'}")
         
         return result_clusters
     
+    @staticmethod
+    def _rank_indices(scores: np.ndarray, top_k: Optional[int] = None) -> np.ndarray:
+        """
+        Indices of scores in descending order, stable on ties.
+        
+        For top_k, an O(n) partition finds the k-th score and only candidates at or
+        above it are sorted.
+        
+        Args:
+            scores: Score array
+            top_k: Only rank the k best (None for all)
+            
+        Returns:
+            Index array, best first
+        """
+        n = len(scores)
+        if top_k is None or top_k >= n:
+            return np.argsort(-scores, kind='stable')
+        if top_k <= 0:
+            return np.empty(0, dtype=np.intp)
+        
+        # Keep every index tied with the k-th score so ties resolve by input order
+        kth_score = -np.partition(-scores, top_k - 1)[top_k - 1]
+        candidates = np.flatnonzero(scores >= kth_score)
+        return candidates[np.argsort(-scores[candidates], kind='stable')[:top_k]]
+    
+    def _score_batch(self, clusters: List[ContentCluster],
+                     user_preferences: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        """
+        Score many clusters, combining the per-cluster components in one array pass.
+        
+        Matches calculate_cluster_score element for element; only the component
+        extraction (which scans chunk text) stays per cluster.
+        
+        Args:
+            clusters: Clusters to score
+            user_preferences: Optional user preferences
+            
+        Returns:
+            Array of final scores in [0, 1], aligned with clusters
+        """
+        n = len(clusters)
+        
+        # Preference lookups are invariant across clusters
+        prepared = self._prepare_preferences(user_preferences) if user_preferences else None
+        
+        # One clock snapshot shared by the recency and breaking-news checks
+        now_us = _utc_now_us()
+        recency = self._recency_scores(clusters, now_us)
+        
+        def components(cluster: ContentCluster) -> Tuple[float, float, bool, float]:
+            breaking = self._is_breaking_news_cluster(cluster, now_us)
+            return (
+                self._calculate_reliability_score(cluster),
+                self._calculate_relevance_score(cluster, user_preferences, breaking, prepared),
+                breaking,
+                self._calculate_source_diversity_bonus(cluster)
+            )
+        
+        rows = [components(cluster) for cluster in clusters]
+        
+        reliability = np.fromiter((row[0] for row in rows), dtype=np.float64, count=n)
+        relevance = np.fromiter((row[1] for row in rows), dtype=np.float64, count=n)
+        is_breaking = np.fromiter((row[2] for row in rows), dtype=bool, count=n)
+        diversity = np.fromiter((row[3] for row in rows), dtype=np.float64, count=n)
+        
+        base = (
+            recency * self.config.recency_weight +
+            reliability * self.config.reliability_weight +
+            relevance * self.config.relevance_weight
+        )
+        final = np.where(is_breaking, base * self.config.breaking_news_boost, base)
+        final += diversity
+        np.clip(final, 0.0, 1.0, out=final)
+        
+        # Keep the components so stats and breakdowns don't rescan the clusters
+        self._score_version += 1
+        version = self._score_version
+        for cluster, *values in zip(clusters, recency.tolist(), reliability.tolist(),
+                                    relevance.tolist(), base.tolist(), is_breaking.tolist(),
+                                    diversity.tolist(), final.tolist()):
+            cluster.metadata.score_components = _ScoreComponents(
+                version, (id(cluster.chunks), len(cluster.chunks)), user_preferences, *values
+            )
+        
+        return final
+    
+    def _cached_components(self, cluster: ContentCluster) -> Optional[_ScoreComponents]:
+        """
+        Return components from this scorer's latest pass if the cluster is unchanged since.
+        
+        Args:
+            cluster: Cluster to look up
+            
+        Returns:
+            Cached components, or None if missing or stale
+        """
+        components = cluster.metadata.score_components
+        if (components is None or components.version != self._score_version
+                or components.chunk_key != (id(cluster.chunks), len(cluster.chunks))):
+            return None
+        return components
+    
     def calculate_cluster_score(self, cluster: ContentCluster, 
                               user_preferences: Optional[Dict[str, Any]] = None) -> float:
         """
@@ -114,10 +337,12 @@ class ClusterScorer:
         Returns:
             Normalized score between 0 and 1
         """
-        # Calculate component scores
-        recency_score = self._calculate_recency_score(cluster)
+        # Calculate component scores against a single clock snapshot
+        now_us = _utc_now_us()
+        is_breaking = self._is_breaking_news_cluster(cluster, now_us)
+        recency_score = self._calculate_recency_score(cluster, now_us)
         reliability_score = self._calculate_reliability_score(cluster)
-        relevance_score = self._calculate_relevance_score(cluster, user_preferences)
+        relevance_score = self._calculate_relevance_score(cluster, user_preferences, is_breaking)
         
         # Calculate base score using configured weights
         base_score = (
@@ -130,7 +355,7 @@ class ClusterScorer:
         final_score = base_score
         
         # Breaking news boost
-        if self._is_breaking_news_cluster(cluster):
+        if is_breaking:
             final_score *= self.config.breaking_news_boost
             logger.debug(f"Applied breaking news boost to cluster {cluster.id}")
         
@@ -139,16 +364,17 @@ class ClusterScorer:
         final_score += diversity_bonus
         
         # Ensure score stays within [0, 1] range
-        final_score = max(0.0, min(1.0, final_score))
+        final_score = 0.0 if final_score < 0.0 else (final_score if final_score < 1.0 else 1.0)
         
         return final_score
     
-    def _calculate_recency_score(self, cluster: ContentCluster) -> float:
+    def _calculate_recency_score(self, cluster: ContentCluster, now_us: Optional[int] = None) -> float:
         """
         Calculate recency score based on cluster timestamps.
         
         Args:
             cluster: Content cluster
+            now_us: Current UTC time in epoch microseconds (read from the clock if omitted)
             
         Returns:
             Recency score between 0 and 1
@@ -156,20 +382,50 @@ class ClusterScorer:
         if not cluster.chunks:
             return 0.0
         
-        # Get the most recent timestamp from cluster chunks
-        most_recent = max(chunk.metadata.timestamp for chunk in cluster.chunks)
+        if now_us is None:
+            now_us = _utc_now_us()
         
-        # Calculate age in hours
-        age_hours = (datetime.utcnow() - most_recent).total_seconds() / 3600
+        # Calculate age in hours from the most recent chunk timestamp
+        age_hours = (now_us - cluster.latest_timestamp_us) / 1e6 / 3600
         
         # Apply exponential decay
         decay_factor = math.exp(-age_hours / self.config.time_decay_hours)
         
         # Ensure minimum score
-        recency_score = max(self.config.max_time_decay, decay_factor)
+        floor = self.config.max_time_decay
+        recency_score = decay_factor if decay_factor > floor else floor
         
         return recency_score
     
+    def _recency_scores(self, clusters: List[ContentCluster], now_us: Optional[int] = None) -> np.ndarray:
+        """
+        Vectorized _calculate_recency_score over many clusters.
+        
+        Reads the clock once and applies one np.exp over all cluster ages.
+        
+        Args:
+            clusters: Clusters to score
+            now_us: Current UTC time in epoch microseconds (read from the clock if omitted)
+            
+        Returns:
+            Recency scores aligned with clusters (0 for empty clusters)
+        """
+        if now_us is None:
+            now_us = _utc_now_us()
+        n = len(clusters)
+        has_chunks = np.fromiter((bool(c.chunks) for c in clusters), dtype=bool, count=n)
+        most_recent = np.fromiter(
+            (c.latest_timestamp_us if c.chunks else now_us for c in clusters),
+            dtype=np.int64, count=n
+        )
+        
+        # Calculate age in hours and apply exponential decay with a floor
+        age_hours = (now_us - most_recent) / 1e6 / 3600
+        decay_factor = np.exp(-age_hours / self.config.time_decay_hours)
+        recency = np.maximum(self.config.max_time_decay, decay_factor)
+        
+        return np.where(has_chunks, recency, 0.0)
+    
     def _calculate_reliability_score(self, cluster: ContentCluster) -> float:
         """
         Calculate reliability score based on source quality.
@@ -183,79 +439,105 @@ class ClusterScorer:
         if not cluster.chunks:
             return 0.0
         
-        # Collect reliability scores from all chunks
-        reliability_scores = []
-        
-        for chunk in cluster.chunks:
-            score = chunk.metadata.source_reliability_score
-            reliability_scores.append(score)
-        
-        # Calculate weighted average (could weight by content length, recency, etc.)
-        # For now, using simple average
-        avg_reliability = sum(reliability_scores) / len(reliability_scores)
+        # Mean reliability and high-quality source count, computed once per
+        # chunk list and cached on the cluster.
+        # (Could weight by content length, recency, etc.; for now a simple average.)
+        avg_reliability, high_quality_sources = cluster.reliability_stats
         
         # Bonus for having multiple high-quality sources
-        high_quality_sources = sum(1 for score in reliability_scores if score >= 0.8)
-        diversity_bonus = min(0.1, high_quality_sources * 0.02)
+        diversity_bonus = high_quality_sources * 0.02
+        if diversity_bonus > 0.1:
+            diversity_bonus = 0.1
         
-        reliability_score = min(1.0, avg_reliability + diversity_bonus)
+        reliability_score = avg_reliability + diversity_bonus
+        if reliability_score > 1.0:
+            reliability_score = 1.0
         
         return reliability_score
     
+    @staticmethod
+    def _prepare_preferences(user_preferences: Dict[str, Any]) -> _PreparedPreferences:
+        """
+        Normalize user preferences once so per-cluster scoring only does set lookups.
+        
+        Args:
+            user_preferences: User preferences dictionary
+            
+        Returns:
+            Prepared preferences
+        """
+        topics = user_preferences.get('topics', [])
+        return _PreparedPreferences(
+            watchlist_upper=frozenset(ticker.upper() for ticker in user_preferences.get('watchlist', [])),
+            topics=frozenset(topics),
+            topic_count=len(topics),
+            keywords=user_preferences.get('keywords', []),
+            sectors=user_preferences.get('sectors', [])
+        )
+    
     def _calculate_relevance_score(self, cluster: ContentCluster, 
-                                 user_preferences: Optional[Dict[str, Any]]) -> float:
+                                 user_preferences: Optional[Dict[str, Any]],
+                                 is_breaking: Optional[bool] = None,
+                                 prepared: Optional[_PreparedPreferences] = None) -> float:
         """
         Calculate relevance score based on user preferences.
         
         Args:
             cluster: Content cluster
             user_preferences: User preferences dictionary
+            is_breaking: Precomputed breaking-news flag, to avoid rescanning the cluster
+            prepared: Preferences from _prepare_preferences, reused across clusters
             
         Returns:
             Relevance score between 0 and 1
         """
         if not user_preferences:
             # Default relevance for general users
-            return self._calculate_default_relevance(cluster)
+            return self._calculate_default_relevance(cluster, is_breaking)
+        
+        if prepared is None:
+            prepared = self._prepare_preferences(user_preferences)
         
         relevance_score = 0.0
         
         # Ticker relevance
-        watchlist = user_preferences.get('watchlist', [])
-        if watchlist and cluster.metadata.primary_ticker:
-            if cluster.metadata.primary_ticker.upper() in [ticker.upper() for ticker in watchlist]:
+        if prepared.watchlist_upper and cluster.metadata.primary_ticker:
+            if cluster.metadata.primary_ticker_upper in prepared.watchlist_upper:
                 relevance_score += 0.5
                 logger.debug(f"Ticker match: {cluster.metadata.primary_ticker}")
         
         # Topic relevance
-        preferred_topics = user_preferences.get('topics', [])
-        if preferred_topics and cluster.metadata.topics:
-            topic_overlap = set(cluster.metadata.topics) & set(preferred_topics)
+        if prepared.topics and cluster.metadata.topics:
+            topic_overlap = prepared.topics & cluster.metadata.topics_set
             if topic_overlap:
-                relevance_score += 0.3 * len(topic_overlap) / len(preferred_topics)
+                relevance_score += 0.3 * len(topic_overlap) / prepared.topic_count
                 logger.debug(f"Topic overlap: {topic_overlap}")
         
         # Keyword relevance
-        keywords = user_preferences.get('keywords', [])
+        keywords = prepared.keywords
         if keywords:
             keyword_score = self._calculate_keyword_relevance(cluster, keywords)
             relevance_score += keyword_score * 0.2
         
         # Industry/sector relevance
-        sectors = user_preferences.get('sectors', [])
+        sectors = prepared.sectors
         if sectors:
             sector_score = self._calculate_sector_relevance(cluster, sectors)
             relevance_score += sector_score * 0.1
         
         # Cap at 1.0
-        return min(1.0, relevance_score)
+        return relevance_score if relevance_score < 1.0 else 1.0
     
-    def _calculate_default_relevance(self, cluster: ContentCluster) -> float:
+    def _calculate_default_relevance(self, cluster: ContentCluster,
+                                     is_breaking: Optional[bool] = None) -> float:
         """Calculate default relevance for general users."""
         relevance_score = 0.5  # Base relevance
         
+        if is_breaking is None:
+            is_breaking = self._is_breaking_news_cluster(cluster)
+        
         # Boost for breaking news
-        if self._is_breaking_news_cluster(cluster):
+        if is_breaking:
             relevance_score += 0.2
         
         # Boost for financial news
@@ -267,9 +549,9 @@ class ClusterScorer:
         if cluster.metadata.primary_ticker:
             relevance_score += 0.1
         
-        return min(1.0, relevance_score)
+        return relevance_score if relevance_score < 1.0 else 1.0
     
-    def _calculate_keyword_relevance(self, cluster: ContentCluster, keywords: List[str]) -> float:
+    def _calculate_keyword_relevance(self, cluster: ContentCluster, keywords: Sequence[str]) -> float:
         """Calculate relevance based on keyword matching."""
         if not keywords or not cluster.chunks:
             return 0.0
@@ -277,10 +559,26 @@ class ClusterScorer:
         total_matches = 0
         total_possible = len(keywords) * len(cluster.chunks)
         
-        for chunk in cluster.chunks:
-            content = (chunk.processed_content or chunk.content).lower()
-            title = chunk.metadata.title.lower()
+        if AHOCORASICK_AVAILABLE:
+            # One automaton pass per string finds every keyword present (overlaps included)
+            automaton, empty_count = _keyword_automaton(tuple(k.lower() for k in keywords))
             
+            for title, content in zip(cluster.titles_lower, cluster.contents_lower):
+                # Empty keywords match every title
+                total_matches += 2 * empty_count
+                if automaton is None:
+                    continue
+                
+                # Weight title matches more than content matches
+                title_hits = {value for _, value in automaton.iter(title)}
+                content_hits = {value for _, value in automaton.iter(content)} - title_hits
+                total_matches += 2 * sum(count for _, count in title_hits)
+                total_matches += sum(count for _, count in content_hits)
+            
+            ratio = total_matches / (total_possible if total_possible > 1 else 1)
+            return ratio if ratio < 1.0 else 1.0
+        
+        for title, content in zip(cluster.titles_lower, cluster.contents_lower):
             for keyword in keywords:
                 keyword_lower = keyword.lower()
                 # Weight title matches more than content matches
@@ -289,67 +587,97 @@ class ClusterScorer:
                 elif keyword_lower in content:
                     total_matches += 1
         
-        return min(1.0, total_matches / max(1, total_possible))
+        ratio = total_matches / (total_possible if total_possible > 1 else 1)
+        return ratio if ratio < 1.0 else 1.0
     
     def _calculate_sector_relevance(self, cluster: ContentCluster, sectors: List[str]) -> float:
         """Calculate relevance based on sector/industry matching."""
-        # Simple keyword-based sector matching
-        # In a real system, this would use more sophisticated entity recognition
-        
-        sector_keywords = {
-            'technology': ['tech', 'software', 'ai', 'artificial intelligence', 'cloud', 'saas'],
-            'healthcare': ['health', 'medical', 'pharma', 'biotech', 'drug', 'treatment'],
-            'finance': ['bank', 'financial', 'fintech', 'payment', 'loan', 'credit'],
-            'energy': ['oil', 'gas', 'renewable', 'solar', 'wind', 'energy', 'power'],
-            'retail': ['retail', 'consumer', 'shopping', 'ecommerce', 'store'],
-            'automotive': ['auto', 'car', 'vehicle', 'tesla', 'ford', 'gm']
-        }
+        if AHOCORASICK_AVAILABLE and sectors:
+            return self._calculate_sector_relevance_automaton(cluster, sectors)
         
         relevance = 0.0
         
         for sector in sectors:
             sector_lower = sector.lower()
-            keywords = sector_keywords.get(sector_lower, [sector_lower])
+            keywords = SECTOR_KEYWORDS.get(sector_lower, (sector_lower,))
             
             sector_score = self._calculate_keyword_relevance(cluster, keywords)
             relevance += sector_score
         
-        return min(1.0, relevance / len(sectors)) if sectors else 0.0
+        if not sectors:
+            return 0.0
+        relevance /= len(sectors)
+        return relevance if relevance < 1.0 else 1.0
     
-    def _is_breaking_news_cluster(self, cluster: ContentCluster) -> bool:
+    def _calculate_sector_relevance_automaton(self, cluster: ContentCluster, sectors: Sequence[str]) -> float:
+        """
+        Sector relevance with a single automaton pass per title/content.
+        
+        Matches _calculate_sector_relevance: each sector is scored like
+        _calculate_keyword_relevance over its keywords, capped at 1.0, and the
+        sector scores are averaged.
+        """
+        chunk_count = len(cluster.chunks)
+        if not chunk_count:
+            return 0.0
+        
+        automaton, keyword_counts, empty_counts = _sector_automaton(tuple(s.lower() for s in sectors))
+        
+        # Empty keywords match every title
+        matches = [2 * empty * chunk_count for empty in empty_counts]
+        if automaton is not None:
+            for title, content in zip(cluster.titles_lower, cluster.contents_lower):
+                # Weight title matches more than content matches
+                title_hits = {value for _, value in automaton.iter(title)}
+                content_hits = {value for _, value in automaton.iter(content)} - title_hits
+                for _, weights in title_hits:
+                    for index, count in weights:
+                        matches[index] += 2 * count
+                for _, weights in content_hits:
+                    for index, count in weights:
+                        matches[index] += count
+        
+        relevance = 0.0
+        for total_matches, keyword_count in zip(matches, keyword_counts):
+            total_possible = keyword_count * chunk_count
+            ratio = total_matches / (total_possible if total_possible > 1 else 1)
+            relevance += ratio if ratio < 1.0 else 1.0
+        
+        relevance /= len(sectors)
+        return relevance if relevance < 1.0 else 1.0
+    
+    def _is_breaking_news_cluster(self, cluster: ContentCluster, now_us: Optional[int] = None) -> bool:
         """
         Determine if cluster represents breaking news.
         
         Args:
             cluster: Content cluster to check
+            now_us: Current UTC time in epoch microseconds (read from the clock if omitted)
             
         Returns:
             True if cluster is breaking news
         """
+        # Cheap checks first; the text scan below only runs if both fail
+        
         # Check if any chunks are classified as breaking news
         if SourceType.BREAKING_NEWS in cluster.metadata.source_types:
             return True
         
-        # Check for breaking news indicators in titles/content
-        breaking_indicators = [
-            'breaking', 'urgent', 'developing', 'just in', 'live update', 
-            'alert', 'flash', 'emergency', 'immediate'
-        ]
-        
-        for chunk in cluster.chunks:
-            title_lower = chunk.metadata.title.lower()
-            content_lower = (chunk.processed_content or chunk.content)[:200].lower()
-            
-            if any(indicator in title_lower or indicator in content_lower 
-                   for indicator in breaking_indicators):
-                return True
+        if not cluster.chunks:
+            return False
         
         # Check recency - very recent clusters might be breaking
-        if cluster.chunks:
-            most_recent = max(chunk.metadata.timestamp for chunk in cluster.chunks)
-            age_minutes = (datetime.utcnow() - most_recent).total_seconds() / 60
-            
-            if age_minutes < 30:  # Less than 30 minutes old
+        if now_us is None:
+            now_us = _utc_now_us()
+        age_minutes = (now_us - cluster.latest_timestamp_us) / 1e6 / 60
+        
+        if age_minutes < 30:  # Less than 30 minutes old
+            return True
+        
+        # Check for breaking news indicators in titles/content
+        for title_lower, content_lower in zip(cluster.titles_lower, cluster.contents_lower):
+            if (BREAKING_INDICATORS_RE.search(title_lower)
+                    or BREAKING_INDICATORS_RE.search(content_lower, 0, 200)):
                 return True
         
         return False
@@ -368,22 +696,27 @@ class ClusterScorer:
             return 0.0
         
         # Count unique sources
-        sources = set(chunk.metadata.source for chunk in cluster.chunks)
+        sources = set(cluster.chunk_sources)
         unique_sources = len(sources)
         
         # Count different source types
-        source_types = set(chunk.metadata.source_type for chunk in cluster.chunks)
+        source_types = set(cluster.chunk_source_types)
         type_diversity = len(source_types)
         
         # Calculate diversity score
         # Bonus for having multiple sources and source types
-        source_bonus = min(0.05, (unique_sources - 1) * 0.01)
-        type_bonus = min(0.05, (type_diversity - 1) * 0.02)
+        source_bonus = (unique_sources - 1) * 0.01
+        if source_bonus > 0.05:
+            source_bonus = 0.05
+        type_bonus = (type_diversity - 1) * 0.02
+        if type_bonus > 0.05:
+            type_bonus = 0.05
         
         total_bonus = source_bonus + type_bonus
         
         # Apply configured maximum
-        return min(self.config.source_diversity_bonus, total_bonus)
+        cap = self.config.source_diversity_bonus
+        return total_bonus if total_bonus < cap else cap
     
     def get_top_clusters(self, clusters: List[ContentCluster], 
                         count: Optional[int] = None, 
@@ -399,12 +732,7 @@ class ClusterScorer:
         Returns:
             Top clusters sorted by score
         """
-        scored_clusters = self.score_clusters(clusters, user_preferences)
-        
-        if count is None:
-            return scored_clusters
-        
-        return scored_clusters[:count]
+        return self.score_clusters(clusters, user_preferences, top_k=count)
     
     def get_cluster_score_breakdown(self, cluster: ContentCluster, 
                                   user_preferences: Optional[Dict[str, Any]] = None) -> Dict[str, float]:
@@ -418,9 +746,18 @@ class ClusterScorer:
         Returns:
             Dictionary with score components
         """
-        recency_score = self._calculate_recency_score(cluster)
+        cached = self._cached_components(cluster)
+        if cached is not None and cached.user_preferences is user_preferences:
+            return self._format_breakdown(
+                cached.recency, cached.reliability, cached.relevance, cached.base,
+                cached.is_breaking, cached.diversity_bonus, cached.final
+            )
+        
+        now_us = _utc_now_us()
+        is_breaking = self._is_breaking_news_cluster(cluster, now_us)
+        recency_score = self._calculate_recency_score(cluster, now_us)
         reliability_score = self._calculate_reliability_score(cluster)
-        relevance_score = self._calculate_relevance_score(cluster, user_preferences)
+        relevance_score = self._calculate_relevance_score(cluster, user_preferences, is_breaking)
         
         base_score = (
             recency_score * self.config.recency_weight +
@@ -428,15 +765,23 @@ class ClusterScorer:
             relevance_score * self.config.relevance_weight
         )
         
-        is_breaking = self._is_breaking_news_cluster(cluster)
         diversity_bonus = self._calculate_source_diversity_bonus(cluster)
         
         final_score = base_score
         if is_breaking:
             final_score *= self.config.breaking_news_boost
         final_score += diversity_bonus
-        final_score = max(0.0, min(1.0, final_score))
+        final_score = 0.0 if final_score < 0.0 else (final_score if final_score < 1.0 else 1.0)
         
+        return self._format_breakdown(
+            recency_score, reliability_score, relevance_score, base_score,
+            is_breaking, diversity_bonus, final_score
+        )
+    
+    def _format_breakdown(self, recency_score: float, reliability_score: float,
+                          relevance_score: float, base_score: float, is_breaking: bool,
+                          diversity_bonus: float, final_score: float) -> Dict[str, Any]:
+        """Assemble the score breakdown dictionary."""
         return {
             'recency_score': recency_score,
             'reliability_score': reliability_score,
@@ -470,28 +815,46 @@ class ClusterScorer:
         breaking_count = 0
         source_diversity_scores = []
         
+        now_us = _utc_now_us()
         for cluster in clusters:
-            if hasattr(cluster.metadata, 'final_score'):
-                scores.append(cluster.metadata.__dict__['final_score'])
+            final_score = cluster.metadata.final_score
+            if final_score is not None:
+                scores.append(final_score)
+            
+            cached = self._cached_components(cluster)
+            if cached is not None:
+                is_breaking = cached.is_breaking
+                diversity_bonus = cached.diversity_bonus
+            else:
+                is_breaking = self._is_breaking_news_cluster(cluster, now_us)
+                diversity_bonus = self._calculate_source_diversity_bonus(cluster)
             
-            if self._is_breaking_news_cluster(cluster):
+            if is_breaking:
                 breaking_count += 1
             
-            diversity_bonus = self._calculate_source_diversity_bonus(cluster)
             source_diversity_scores.append(diversity_bonus)
         
+        score_stats = {'min': 0, 'max': 0, 'mean': 0, 'median': 0}
+        if scores:
+            score_array = np.asarray(scores, dtype=np.float64)
+            mid = len(scores) // 2
+            score_stats = {
+                'min': float(score_array.min()),
+                'max': float(score_array.max()),
+                'mean': float(score_array.mean()),
+                # Upper median via O(n) selection instead of a full sort
+                'median': float(np.partition(score_array, mid)[mid])
+            }
+        
+        diversity_array = np.asarray(source_diversity_scores, dtype=np.float64)
+        
         return {
             'total_clusters': len(clusters),
             'breaking_news_clusters': breaking_count,
-            'score_stats': {
-                'min': min(scores) if scores else 0,
-                'max': max(scores) if scores else 0,
-                'mean': sum(scores) / len(scores) if scores else 0,
-                'median': sorted(scores)[len(scores) // 2] if scores else 0
-            },
+            'score_stats': score_stats,
             'diversity_bonus_stats': {
-                'min': min(source_diversity_scores),
-                'max': max(source_diversity_scores),
-                'mean': sum(source_diversity_scores) / len(source_diversity_scores)
+                'min': float(diversity_array.min()),
+                'max': float(diversity_array.max()),
+                'mean': float(diversity_array.mean())
             }
         }
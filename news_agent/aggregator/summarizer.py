@@ -8,11 +8,20 @@ key point extraction, and batch processing.
 
 import logging
 import asyncio
+import hashlib
 import json
-from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime
+import random
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
+from functools import lru_cache
+from typing import Callable, List, Dict, Any, Optional, Tuple, TypedDict
+from datetime import datetime, timedelta, timezone
 import time
 import re
+
+import numpy as np
 from google.api_core.exceptions import ResourceExhausted, ServiceUnavailable
 
 try:
@@ -21,12 +30,322 @@ try:
 except ImportError:
     GEMINI_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from .models import ContentCluster, ClusterSummary, SourceReference
 from .config import SummarizerConfig
 
 logger = logging.getLogger(__name__)
 
 
+def _dumps(obj: Any) -> bytes:
+    """Serialize to canonical (key-sorted) JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True).encode()
+
+
+def _loads(data: str) -> Any:
+    """Parse JSON text, raising ValueError on malformed input."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Static instructions shared by every cluster prompt (sent once per request)
+_PROMPT_INSTRUCTIONS = (
+    "\n"
+    "Please analyze these articles and provide:\n"
+    "1. A comprehensive summary (2-3 paragraphs)\n"
+    "2. Key points (3-5 bullet points)\n"
+    "3. Focus on factual information and avoid speculation\n"
+)
+
+# Text used when Gemini could not produce a summary for a cluster
+_FALLBACK_TMPL = ("This cluster contains {n} related articles{ticker_part}{topics_part}. "
+                  "Recent articles include: {titles}.")
+
+# Instructions for multi-cluster requests; kept ahead of the cluster sections so
+# input truncation only ever drops trailing clusters
+_BATCH_PROMPT_HEADER = (
+    "BATCH CLUSTER SUMMARY REQUEST\n"
+    "Each section below starts with ===CLUSTER id=<id>=== and is an independent cluster summary request.\n"
+    "Return a JSON array with one object per CLUSTER id, each with fields "
+    "\"cluster_id\" (the id from the section header), \"summary\" (the comprehensive summary) "
+    "and \"key_points\" (the key points as a list of strings).\n"
+)
+
+# Response parsing
+_KEYPOINTS_MARKER_RE = re.compile(r'key points|main points|highlights', re.IGNORECASE)
+_BULLET_PREFIXES = ('•', '-', '*', '1.', '2.', '3.', '4.', '5.')
+_BULLET_STRIP_RE = re.compile(r'^[•\-\*\d\.]+\s*')
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+_GENERIC_RE = re.compile(r'according to reports|it is reported|sources say', re.IGNORECASE)
+
+
+class _SummarySchema(TypedDict):
+    """Structured-output schema for a single cluster summary."""
+    summary: str
+    key_points: List[str]
+
+
+class _BatchSummaryItem(TypedDict):
+    """Structured-output schema for one cluster in a multi-cluster request."""
+    cluster_id: str
+    summary: str
+    key_points: List[str]
+
+
+def _now_utc() -> datetime:
+    """Current time as a timezone-aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
+_GENAI_LOCK = threading.Lock()
+_configured_key_hash: Optional[str] = None
+
+
+def _configure_genai(api_key: str) -> str:
+    """
+    Configure the (process-global) Gemini client unless it already uses this key.
+    
+    Args:
+        api_key: Gemini API key
+        
+    Returns:
+        SHA-256 hex digest of the key, used to key the model cache
+    """
+    global _configured_key_hash
+    key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+    with _GENAI_LOCK:
+        if key_hash != _configured_key_hash:
+            genai.configure(api_key=api_key)
+            _configured_key_hash = key_hash
+    return key_hash
+
+
+@lru_cache(maxsize=16)
+def _get_model(api_key_hash: str, model_name: str, temperature: float, max_output_tokens: int):
+    """
+    Build (once per process and settings) the Gemini model used for summaries.
+    
+    Args:
+        api_key_hash: Hash of the configured API key; only partitions the cache
+        model_name: Gemini model name
+        temperature: Sampling temperature
+        max_output_tokens: Output token limit per response
+        
+    Returns:
+        genai.GenerativeModel configured for structured summary output
+    """
+    return genai.GenerativeModel(
+        model_name=model_name,
+        generation_config=genai.types.GenerationConfig(
+            temperature=temperature,
+            max_output_tokens=max_output_tokens,
+            response_mime_type="application/json",
+            response_schema=_SummarySchema
+        )
+    )
+
+
+def _retry_after_seconds(error: Exception) -> float:
+    """
+    Extract a server-suggested retry delay from an API exception.
+    
+    Args:
+        error: Exception raised by the Gemini client
+        
+    Returns:
+        Suggested delay in seconds (0 if the exception carries none)
+    """
+    hints = [getattr(error, 'retry_delay', None)]
+    # gRPC errors carry google.rpc.RetryInfo among their details
+    hints.extend(getattr(detail, 'retry_delay', None) for detail in (getattr(error, 'details', None) or ()))
+    
+    delay = 0.0
+    for hint in hints:
+        if isinstance(hint, timedelta):
+            seconds = hint.total_seconds()
+        elif isinstance(hint, (int, float)):
+            seconds = float(hint)
+        elif hasattr(hint, 'seconds'):  # protobuf Duration
+            seconds = hint.seconds + getattr(hint, 'nanos', 0) / 1e9
+        else:
+            continue
+        delay = max(delay, seconds)
+    return delay
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter.
+    
+    Tokens refill continuously at ``rate`` per second up to ``capacity``;
+    ``acquire`` only blocks when the bucket is empty.
+    """
+    
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize the bucket full.
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens held (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self, n: float) -> float:
+        """Take n tokens, returning how long the caller must wait before using them."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= n
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+    
+    def acquire(self, n: float = 1):
+        """Block until n tokens are available and consume them."""
+        delay = self._reserve(n)
+        if delay > 0:
+            time.sleep(delay)
+    
+    async def acquire_async(self, n: float = 1):
+        """Wait (without blocking the event loop) until n tokens are available and consume them."""
+        delay = self._reserve(n)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class SummaryCache:
+    """
+    In-memory LRU cache of generated summaries keyed by cluster content.
+    
+    Thread-safe, since the async path summarizes clusters on executor threads.
+    Tracks hit/miss counts in ``stats``.
+    """
+    
+    def __init__(self, max_entries: int = 1024):
+        """Initialize summary cache."""
+        self.max_entries = max_entries
+        self.stats = {"hits": 0, "misses": 0}
+        self._entries: "OrderedDict[str, ClusterSummary]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[ClusterSummary]:
+        """Get a cached summary, marking it most recently used."""
+        with self._lock:
+            summary = self._entries.get(key)
+            if summary is None:
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return summary
+    
+    def set(self, key: str, summary: ClusterSummary):
+        """Store a summary, evicting the least recently used entries past max_entries."""
+        with self._lock:
+            self._entries[key] = summary
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Drop all cached summaries."""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SemanticSummaryCache:
+    """
+    In-memory cache of summaries looked up by cosine similarity of cluster fingerprints.
+    
+    Vectors are stored L2-normalized in one matrix, so a lookup is a single
+    matrix-vector product. The oldest entries are dropped past ``max_entries``.
+    """
+    
+    def __init__(self, threshold: float = 0.92, max_entries: int = 1024):
+        """Initialize semantic summary cache."""
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.stats = {"hits": 0, "misses": 0}
+        self._matrix: Optional[np.ndarray] = None
+        self._summaries: List[ClusterSummary] = []
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _normalize(vector: np.ndarray) -> Optional[np.ndarray]:
+        """Return vector as a unit-length float32 row, or None if it has no direction."""
+        vector = np.asarray(vector, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(vector))
+        if not norm:
+            return None
+        return vector / norm
+    
+    def get(self, vector: np.ndarray) -> Optional[Tuple[ClusterSummary, float]]:
+        """
+        Find the most similar cached summary.
+        
+        Args:
+            vector: Fingerprint embedding of the cluster being summarized
+            
+        Returns:
+            Tuple of (summary, cosine similarity) if the best match clears the threshold
+        """
+        query = self._normalize(vector)
+        with self._lock:
+            if query is None or self._matrix is None or self._matrix.shape[1] != query.shape[0]:
+                self.stats["misses"] += 1
+                return None
+            similarities = self._matrix @ query
+            best = int(np.argmax(similarities))
+            similarity = float(similarities[best])
+            if similarity < self.threshold:
+                self.stats["misses"] += 1
+                return None
+            self.stats["hits"] += 1
+            return self._summaries[best], similarity
+    
+    def set(self, vector: np.ndarray, summary: ClusterSummary):
+        """Store a summary under its fingerprint embedding."""
+        row = self._normalize(vector)
+        if row is None:
+            return
+        with self._lock:
+            if self._matrix is None or self._matrix.shape[1] != row.shape[0]:
+                self._matrix = row[np.newaxis, :]
+                self._summaries = [summary]
+                return
+            self._matrix = np.vstack((self._matrix, row))
+            self._summaries.append(summary)
+            excess = len(self._summaries) - self.max_entries
+            if excess > 0:
+                self._matrix = self._matrix[excess:]
+                del self._summaries[:excess]
+    
+    def clear(self):
+        """Drop all cached summaries."""
+        with self._lock:
+            self._matrix = None
+            self._summaries = []
+    
+    def __len__(self) -> int:
+        return len(self._summaries)
+
+
 class GeminiSummarizer:
     """
     Gemini API-based summarization engine for content clusters.
@@ -39,41 +358,114 @@ class GeminiSummarizer:
     - Batch processing support
     - Error handling and retries
     - Token limit management
+    - Exact-match and semantic (near-duplicate) summary caches
     """
     
-    def __init__(self, config: SummarizerConfig, api_key: Optional[str] = None):
+    # Per-article content limits when splitting the input budget across a cluster
+    MIN_CHUNK_CHARS = 300
+    MAX_CHUNK_CHARS = 2000
+    # Characters reserved for the prompt header
+    PROMPT_HEADER_CHARS = 400
+    # Inputs are measured with count_tokens only when the 4 chars/token estimate
+    # lands within this fraction of max_input_tokens; otherwise the estimate decides
+    TOKEN_COUNT_MARGIN = 0.2
+    
+    def __init__(self, config: SummarizerConfig, api_key: Optional[str] = None,
+                 embedding_fn: Optional[Callable[[str], np.ndarray]] = None,
+                 vector_store: Optional[SemanticSummaryCache] = None):
         """
         Initialize the Gemini summarizer.
         
         Args:
             config: Summarizer configuration
             api_key: Gemini API key (if not in config)
+            embedding_fn: Text embedding function; enables the semantic cache
+            vector_store: Semantic cache to use instead of a fresh in-memory one
         """
         self.config = config
         
         if not GEMINI_AVAILABLE:
             raise ImportError("google-generativeai is required for Gemini summarization")
-       
-        print(f"API KEY!!!!{api_key}")
         
         # Configure API
         api_key = api_key or getattr(config, 'api_key', None)
         if not api_key:
             raise ValueError("Gemini API key is required")
         
-        genai.configure(api_key=api_key)
+        api_key_hash = _configure_genai(api_key)
+        # Fingerprint only; never log the key itself
+        logger.debug(f"Gemini API key sha256 prefix: {api_key_hash[:8]}")
+        
+        # Initialize model (shared with other summarizers using the same settings)
+        self.model = _get_model(api_key_hash, config.model_name, config.temperature, config.max_output_tokens)
+        
+        # Paces Gemini requests (including retries) to the configured quota
+        self._bucket = TokenBucket(rate=config.requests_per_minute / 60.0, capacity=config.requests_per_minute)
         
-        # Initialize model
-        self.model = genai.GenerativeModel(
-            model_name=config.model_name,
-            generation_config=genai.types.GenerationConfig(
-                temperature=config.temperature,
-                max_output_tokens=config.max_output_tokens
+        # Summaries for clusters whose content was already summarized
+        self._cache = SummaryCache(config.cache_max_entries) if config.cache_enabled else None
+        
+        # Summaries for near-duplicate clusters, matched by fingerprint embedding
+        self._embedding_fn = embedding_fn
+        # Embedding models are not thread-safe; async lookups run on worker threads
+        self._embedding_lock = threading.Lock()
+        self._semantic_cache = None
+        if config.cache_enabled and embedding_fn is not None:
+            self._semantic_cache = vector_store or SemanticSummaryCache(
+                config.semantic_threshold, config.cache_max_entries
             )
-        )
+        
+        # Builds the next batch prompt while the current request is in flight
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
         
         logger.info(f"Gemini summarizer initialized with model: {config.model_name}")
     
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Summary cache hit/miss counts (exact cache, plus semantic_* for the semantic cache)."""
+        stats = dict(self._cache.stats) if self._cache is not None else {"hits": 0, "misses": 0}
+        if self._semantic_cache is not None:
+            stats["semantic_hits"] = self._semantic_cache.stats["hits"]
+            stats["semantic_misses"] = self._semantic_cache.stats["misses"]
+        return stats
+    
+    def _cluster_fingerprint(self, cluster: ContentCluster) -> str:
+        """Canonical text describing a cluster's story, embedded for the semantic cache."""
+        titles = sorted(chunk.metadata.title for chunk in cluster.chunks)
+        return (" || ".join(titles) +
+                f" [{cluster.metadata.primary_ticker or ''}] [{', '.join(cluster.metadata.topics)}]")
+    
+    def _embed_fingerprint(self, cluster: ContentCluster) -> Optional[np.ndarray]:
+        """Embed the cluster fingerprint, or None if the embedding function fails."""
+        fingerprint = self._cluster_fingerprint(cluster)
+        try:
+            with self._embedding_lock:
+                return self._embedding_fn(fingerprint)
+        except Exception as e:
+            logger.warning(f"Failed to embed fingerprint for cluster {cluster.id}: {e}")
+            return None
+    
+    def _cache_key(self, cluster: ContentCluster) -> str:
+        """
+        Build a deterministic cache key for a cluster's summarization request.
+        
+        Args:
+            cluster: Content cluster
+            
+        Returns:
+            SHA-256 hex digest over the model settings and the cluster's content
+        """
+        chunks = sorted((chunk.id, chunk.content_hash) for chunk in cluster.chunks)
+        payload = {
+            "model": self.config.model_name,
+            "temp": self.config.temperature,
+            "max_out": self.config.max_output_tokens,
+            "ticker": cluster.metadata.primary_ticker,
+            "topics": cluster.metadata.topics,
+            "chunks": chunks,
+        }
+        return hashlib.sha256(_dumps(payload)).hexdigest()
+    
     def summarize_cluster(self, cluster: ContentCluster) -> ClusterSummary:
         """
         Generate a summary for a single content cluster.
@@ -84,39 +476,100 @@ class GeminiSummarizer:
         Returns:
             ClusterSummary object
         """
+        try:
+            cached, cache_key, fingerprint_vector = self._lookup_cached_summary(cluster)
+            if cached is not None:
+                return cached
+        except Exception as e:
+            logger.error(f"Failed to generate summary for cluster {cluster.id}: {e}")
+            return self._create_fallback_summary(cluster)
+        
+        return self._summarize_uncached(cluster, cache_key, fingerprint_vector)
+    
+    def _lookup_cached_summary(self, cluster: ContentCluster
+                               ) -> Tuple[Optional[ClusterSummary], Optional[str], Optional[np.ndarray]]:
+        """
+        Look a cluster up in the exact and semantic summary caches.
+        
+        Args:
+            cluster: Content cluster
+            
+        Returns:
+            Tuple of (summary for this cluster on a hit, exact cache key,
+            fingerprint embedding); the key and embedding are reused to store
+            the summary once it is generated
+        """
+        cache_key = None
+        if self._cache is not None:
+            cache_key = self._cache_key(cluster)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Summary cache hit for cluster {cluster.id}")
+                return (replace(cached, id="", cluster_id=cluster.id, generated_at=_now_utc(),
+                                key_points=list(cached.key_points)),
+                        cache_key, None)
+        
+        fingerprint_vector = None
+        if self._semantic_cache is not None:
+            fingerprint_vector = self._embed_fingerprint(cluster)
+            match = self._semantic_cache.get(fingerprint_vector) if fingerprint_vector is not None else None
+            if match is not None:
+                similar, similarity = match
+                logger.info(f"Semantic summary cache hit for cluster {cluster.id} "
+                            f"(similarity {similarity:.3f})")
+                return (replace(similar, id="", cluster_id=cluster.id, generated_at=_now_utc(),
+                                key_points=list(similar.key_points),
+                                confidence=similar.confidence * similarity,
+                                model_used=f"{similar.model_used}+semcache"),
+                        cache_key, fingerprint_vector)
+        
+        return None, cache_key, fingerprint_vector
+    
+    def _store_cached_summary(self, cache_key: Optional[str], fingerprint_vector: Optional[np.ndarray],
+                              summary: ClusterSummary):
+        """Remember a freshly generated summary in the enabled caches."""
+        if cache_key is not None:
+            self._cache.set(cache_key, summary)
+        if fingerprint_vector is not None:
+            self._semantic_cache.set(fingerprint_vector, summary)
+    
+    def _build_summary(self, cluster: ContentCluster, summary_text: str, key_points: List[str]) -> ClusterSummary:
+        """Create the ClusterSummary for generated summary text and key points."""
+        word_count = len(summary_text.split())
+        return ClusterSummary(
+            id="",  # Will be generated
+            cluster_id=cluster.id,
+            summary=summary_text,
+            key_points=key_points,
+            generated_at=_now_utc(),
+            model_used=self.config.model_name,
+            confidence=self._calculate_summary_confidence(summary_text, word_count, cluster),
+            word_count=word_count
+        )
+    
+    def _summarize_uncached(self, cluster: ContentCluster, cache_key: Optional[str] = None,
+                            fingerprint_vector: Optional[np.ndarray] = None) -> ClusterSummary:
+        """
+        Generate a summary for a cluster with one Gemini request.
+        
+        Args:
+            cluster: Content cluster to summarize
+            cache_key: Exact cache key to store the result under
+            fingerprint_vector: Fingerprint embedding to store the result under
+            
+        Returns:
+            ClusterSummary object (fallback summary on failure)
+        """
         try:
             logger.info(f"Generating summary for cluster {cluster.id} with {cluster.chunk_count} chunks")
             
             # Prepare input content
-            input_text = self._prepare_cluster_input(cluster)
+            input_text = self._build_prompt(cluster)
             
             # Generate summary using Gemini
             summary_response = self._generate_summary(input_text, cluster)
             
-            # Check for API error string
-            if summary_response.startswith("API_ERROR:"):
-                logger.error(f"Gemini API failed for cluster {cluster.id}: {summary_response}")
-                return self._create_fallback_summary(cluster, error_message=summary_response)
-
-            # Parse response
-            summary_text, key_points = self._parse_summary_response(summary_response)
-            
-            # Create ClusterSummary object
-            cluster_summary = ClusterSummary(
-                id="",  # Will be generated
-                cluster_id=cluster.id,
-                summary=summary_text,
-                key_points=key_points,
-                generated_at=datetime.datetime.now(datetime.timezone.utc),
-                model_used=self.config.model_name,
-                confidence=self._calculate_summary_confidence(summary_text, cluster),
-                word_count=len(summary_text.split())
-            )
-            
-            logger.info(f"Summary generated successfully: {cluster_summary.word_count} words, "
-                       f"{len(key_points)} key points")
-            
-            return cluster_summary
+            return self._summary_from_response(cluster, summary_response, cache_key, fingerprint_vector)
             
         except Exception as e:
             logger.error(f"Failed to generate summary for cluster {cluster.id}: {e}")
@@ -124,10 +577,54 @@ class GeminiSummarizer:
             # Return fallback summary
             return self._create_fallback_summary(cluster)
     
+    def _summary_from_response(self, cluster: ContentCluster, summary_response: str,
+                               cache_key: Optional[str] = None,
+                               fingerprint_vector: Optional[np.ndarray] = None) -> ClusterSummary:
+        """
+        Turn a Gemini response for one cluster into a ClusterSummary and cache it.
+        
+        Args:
+            cluster: Summarized cluster
+            summary_response: Raw response text (or an "API_ERROR: ..." string)
+            cache_key: Exact cache key to store the result under
+            fingerprint_vector: Fingerprint embedding to store the result under
+            
+        Returns:
+            ClusterSummary object
+        """
+        # Check for API error string
+        if summary_response.startswith("API_ERROR:"):
+            logger.error(f"Gemini API failed for cluster {cluster.id}: {summary_response}")
+            return self._create_fallback_summary(cluster)
+
+        # Structured JSON response, or free text if the model ignored the schema
+        fields = None
+        try:
+            fields = self._structured_fields(_loads(summary_response))
+        except ValueError:
+            pass
+        if fields is None:
+            fields = self._parse_summary_response(summary_response)
+        summary_text, key_points = fields
+        
+        # Create ClusterSummary object
+        cluster_summary = self._build_summary(cluster, summary_text, key_points)
+        
+        logger.info(f"Summary generated successfully: {cluster_summary.word_count} words, "
+                   f"{len(key_points)} key points")
+        
+        self._store_cached_summary(cache_key, fingerprint_vector, cluster_summary)
+        
+        return cluster_summary
+    
     def summarize_clusters_batch(self, clusters: List[ContentCluster]) -> List[ClusterSummary]:
         """
         Generate summaries for multiple clusters efficiently.
         
+        Clusters missing from the caches are summarized batch_size at a time
+        with one structured-output Gemini request per batch; any cluster the
+        response does not cover falls back to its own request.
+        
         Args:
             clusters: List of content clusters
             
@@ -139,33 +636,55 @@ class GeminiSummarizer:
         
         logger.info(f"Generating summaries for {len(clusters)} clusters")
         
-        summaries = []
-        batch_size = self.config.batch_size
-        
-        # Process in batches to respect API limits
-        for i in range(0, len(clusters), batch_size):
-            batch = clusters[i:i + batch_size]
-            batch_summaries = []
-            
-            for cluster in batch:
-                try:
-                    summary = self.summarize_cluster(cluster)
-                    batch_summaries.append(summary)
-                    
-                    # Add delay to respect rate limits
-                    time.sleep(0.5)
-                    
-                except Exception as e:
-                    logger.error(f"Failed to summarize cluster {cluster.id}: {e}")
-                    # Add fallback summary
-                    fallback = self._create_fallback_summary(cluster)
-                    batch_summaries.append(fallback)
-            
-            summaries.extend(batch_summaries)
-            
-            # Longer delay between batches
-            if i + batch_size < len(clusters):
-                time.sleep(2.0)
+        summaries: List[Optional[ClusterSummary]] = [None] * len(clusters)
+        pending = []  # (index, cluster, cache_key, fingerprint_vector)
+        
+        for index, cluster in enumerate(clusters):
+            try:
+                cached, cache_key, fingerprint_vector = self._lookup_cached_summary(cluster)
+            except Exception as e:
+                logger.error(f"Failed to summarize cluster {cluster.id}: {e}")
+                summaries[index] = self._create_fallback_summary(cluster)
+                continue
+            if cached is not None:
+                summaries[index] = cached
+            else:
+                pending.append((index, cluster, cache_key, fingerprint_vector))
+        
+        # One request per batch; API pacing is handled by the token bucket
+        batch_size = max(1, self.config.batch_size)
+        batches = [pending[start:start + batch_size] for start in range(0, len(pending), batch_size)]
+        
+        # Overlap building the next batch's prompt with the current request
+        prompts: List[Optional[Future]] = [None] * len(batches)
+        if len(batches) > 1:
+            if self._prefetch_executor is None:
+                self._prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="summarize")
+        
+        def prefetch(position: int):
+            if self._prefetch_executor is None or position >= len(batches) or len(batches[position]) < 2:
+                return
+            prompts[position] = self._prefetch_executor.submit(
+                self._format_multi_cluster_prompt, [cluster for _, cluster, _, _ in batches[position]]
+            )
+        
+        prefetch(0)
+        for position, batch in enumerate(batches):
+            prefetch(position + 1)
+            generated = self._generate_batch_summaries([cluster for _, cluster, _, _ in batch], prompts[position])
+            prompts[position] = None
+            
+            for index, cluster, cache_key, fingerprint_vector in batch:
+                item = generated.get(cluster.id)
+                if item is not None:
+                    try:
+                        summary = self._build_summary(cluster, *item)
+                        self._store_cached_summary(cache_key, fingerprint_vector, summary)
+                        summaries[index] = summary
+                        continue
+                    except Exception as e:
+                        logger.error(f"Failed to summarize cluster {cluster.id}: {e}")
+                summaries[index] = self._summarize_uncached(cluster, cache_key, fingerprint_vector)
         
         logger.info(f"Batch summarization completed: {len(summaries)} summaries generated")
         return summaries
@@ -185,21 +704,15 @@ class GeminiSummarizer:
         
         logger.info(f"Generating summaries asynchronously for {len(clusters)} clusters")
         
-        # Create tasks for each cluster
-        tasks = []
-        for cluster in clusters:
-            task = self._summarize_cluster_async(cluster)
-            tasks.append(task)
-        
-        # Execute with semaphore to limit concurrency
+        # Limit concurrency; each coroutine is only created once a slot is free
         semaphore = asyncio.Semaphore(self.config.batch_size)
         
-        async def bounded_task(task):
+        async def run(cluster):
             async with semaphore:
-                return await task
+                return await self._summarize_cluster_async(cluster)
         
-        bounded_tasks = [bounded_task(task) for task in tasks]
-        summaries = await asyncio.gather(*bounded_tasks, return_exceptions=True)
+        summaries = await asyncio.gather(*(run(cluster) for cluster in clusters),
+                                         return_exceptions=True)
         
         # Handle exceptions
         result_summaries = []
@@ -215,90 +728,246 @@ class GeminiSummarizer:
         return result_summaries
     
     async def _summarize_cluster_async(self, cluster: ContentCluster) -> ClusterSummary:
-        """Async wrapper for cluster summarization."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.summarize_cluster, cluster)
+        """Summarize a cluster on the event loop using Gemini's native async client."""
+        try:
+            if self._semantic_cache is not None:
+                # The semantic lookup embeds the fingerprint synchronously; keep it off the loop
+                cached, cache_key, fingerprint_vector = await asyncio.to_thread(
+                    self._lookup_cached_summary, cluster
+                )
+            else:
+                cached, cache_key, fingerprint_vector = self._lookup_cached_summary(cluster)
+            if cached is not None:
+                return cached
+            
+            logger.info(f"Generating summary for cluster {cluster.id} with {cluster.chunk_count} chunks")
+            
+            input_text = self._build_prompt(cluster)
+            summary_response = await self._generate_content_async(input_text, f"cluster {cluster.id}")
+            
+            return self._summary_from_response(cluster, summary_response, cache_key, fingerprint_vector)
+            
+        except Exception as e:
+            logger.error(f"Failed to generate summary for cluster {cluster.id}: {e}")
+            return self._create_fallback_summary(cluster)
     
-    def _prepare_cluster_input(self, cluster: ContentCluster) -> str:
+    def _chunk_char_budget(self, chunk_count: int, total_chars: Optional[int] = None) -> int:
         """
-        Prepare input text for summarization from cluster content.
+        Split a prompt's character budget evenly across a cluster's articles.
+        
+        Args:
+            chunk_count: Number of articles in the cluster
+            total_chars: Characters available for the whole prompt (defaults to
+                the max_input_tokens estimate of 4 characters per token)
+            
+        Returns:
+            Content characters per article, clamped to [MIN_CHUNK_CHARS, MAX_CHUNK_CHARS]
+        """
+        if total_chars is None:
+            total_chars = self.config.max_input_tokens * 4
+        budget = max(500, total_chars - self.PROMPT_HEADER_CHARS) // max(1, chunk_count)
+        return min(self.MAX_CHUNK_CHARS, max(self.MIN_CHUNK_CHARS, budget))
+    
+    def _build_prompt(self, cluster: ContentCluster, total_chars: Optional[int] = None,
+                      include_instructions: bool = True) -> str:
+        """
+        Build the summarization prompt for a cluster.
         
         Args:
             cluster: Content cluster
+            total_chars: Character budget for this prompt (defaults to the whole input budget)
+            include_instructions: Add the instruction block (multi-cluster prompts carry one shared copy)
             
         Returns:
             Formatted input text for the model
         """
-        # Collect content from all chunks
-        chunk_contents = []
+        # Most recent articles first
+        sorted_chunks = sorted(cluster.chunks, key=lambda chunk: chunk.metadata.timestamp, reverse=True)
+        content_chars = self._chunk_char_budget(len(sorted_chunks), total_chars)
+        
+        # Create context about the cluster
+        lines = [
+            "CLUSTER SUMMARY REQUEST",
+            f"Cluster contains {len(sorted_chunks)} news articles on related topics.",
+        ]
+        
+        if cluster.metadata.primary_ticker:
+            lines.append(f"Primary ticker: {cluster.metadata.primary_ticker}")
+        
+        if cluster.metadata.topics:
+            lines.append(f"Topics: {', '.join(cluster.metadata.topics)}")
+        
+        if include_instructions:
+            lines.append(_PROMPT_INSTRUCTIONS)
+        lines.append("ARTICLES:")
+        
+        # One string per article; content is limited to this cluster's per-article budget
+        for i, chunk in enumerate(sorted_chunks, 1):
+            metadata = chunk.metadata
+            lines.append(
+                f"\n--- Article {i} ---\n"
+                f"Title: {metadata.title}\n"
+                f"Source: {metadata.source}\n"
+                f"Published: {metadata.timestamp.date().isoformat()}\n"
+                f"Content: {(chunk.processed_content or chunk.content)[:content_chars]}\n"
+            )
+        
+        return "\n".join(lines)
+    
+    def _format_multi_cluster_prompt(self, clusters: List[ContentCluster]) -> str:
+        """
+        Format several clusters into one structured-output request.
         
-        for chunk in cluster.chunks:
-            content = chunk.processed_content or chunk.content
+        Args:
+            clusters: Content clusters to summarize together
             
-            # Add metadata context
-            chunk_info = {
-                'title': chunk.metadata.title,
-                'source': chunk.metadata.source,
-                'timestamp': chunk.metadata.timestamp.isoformat(),
-                'content': content[:500]  # Limit content length
-            }
+        Returns:
+            Prompt with one ===CLUSTER id=...=== section per cluster
+        """
+        # Clusters share the input budget
+        per_cluster_chars = self.config.max_input_tokens * 4 // max(1, len(clusters))
+        # One copy of the instructions covers every section
+        sections = [_BATCH_PROMPT_HEADER + _PROMPT_INSTRUCTIONS]
+        for cluster in clusters:
+            sections.append(f"===CLUSTER id={cluster.id}===")
+            sections.append(self._build_prompt(cluster, per_cluster_chars, include_instructions=False))
+        return "\n".join(sections)
+    
+    def _generate_batch_summaries(self, clusters: List[ContentCluster],
+                                  prompt: Optional[Future] = None) -> Dict[str, Tuple[str, List[str]]]:
+        """
+        Summarize several clusters with a single Gemini request.
+        
+        Args:
+            clusters: Content clusters to summarize together
+            prompt: Future for the prefetched multi-cluster prompt (built here if omitted)
             
-            chunk_contents.append(chunk_info)
+        Returns:
+            Mapping of cluster id to (summary_text, key_points) for every cluster
+            the response covered; empty if the request or parsing failed
+        """
+        if len(clusters) < 2:
+            return {}
+        
+        try:
+            generation_config = genai.types.GenerationConfig(
+                temperature=self.config.temperature,
+                max_output_tokens=self.config.max_output_tokens * len(clusters),
+                response_mime_type="application/json",
+                response_schema=List[_BatchSummaryItem]
+            )
+            input_text = prompt.result() if prompt is not None else self._format_multi_cluster_prompt(clusters)
+            response_text = self._generate_content(
+                input_text,
+                f"batch of {len(clusters)} clusters",
+                generation_config=generation_config
+            )
+            if response_text.startswith("API_ERROR:"):
+                logger.error(f"Gemini API failed for batch of {len(clusters)} clusters: {response_text}")
+                return {}
+            items = _loads(response_text)
+        except Exception as e:
+            logger.warning(f"Batch summarization of {len(clusters)} clusters failed, "
+                           f"falling back to per-cluster requests: {e}")
+            return {}
         
-        # Sort by timestamp (most recent first)
-        chunk_contents.sort(key=lambda x: x['timestamp'], reverse=True)
+        if not isinstance(items, list):
+            logger.warning("Batch summarization response was not a JSON array")
+            return {}
         
-        # Format for model input
-        formatted_input = self._format_input_for_model(chunk_contents, cluster)
+        wanted = {cluster.id for cluster in clusters}
+        results = {}
+        for item in items:
+            fields = self._structured_fields(item)
+            if fields is None:
+                continue
+            cluster_id = str(item.get("cluster_id", ""))
+            if cluster_id in wanted:
+                results[cluster_id] = fields
         
-        return formatted_input
+        missing = len(wanted) - len(results)
+        if missing:
+            logger.info(f"Batch response missed {missing} of {len(wanted)} clusters")
+        return results
     
-    def _format_input_for_model(self, chunk_contents: List[Dict[str, Any]], 
-                               cluster: ContentCluster) -> str:
+    def _truncate_to_token_budget(self, input_text: str, context: str) -> str:
         """
-        Format cluster content for Gemini model input.
+        Truncate input to max_input_tokens, measuring with the model's tokenizer
+        when the character estimate is close to the budget.
         
         Args:
-            chunk_contents: List of chunk content dictionaries
-            cluster: Content cluster
+            input_text: Formatted input text
+            context: What is being summarized (for log messages)
             
         Returns:
-            Formatted input string
+            Input text that fits the token budget
         """
-        # Create context about the cluster
-        context_lines = [
-            "CLUSTER SUMMARY REQUEST",
-            f"Cluster contains {len(chunk_contents)} news articles on related topics.",
-        ]
+        if not self._needs_token_count(input_text):
+            return self._apply_token_budget(input_text, None, context)
         
-        if cluster.metadata.primary_ticker:
-            context_lines.append(f"Primary ticker: {cluster.metadata.primary_ticker}")
+        try:
+            # count_tokens is an API request too, so it waits for quota like generation
+            self._bucket.acquire()
+            token_count = self.model.count_tokens(input_text).total_tokens
+        except Exception as e:
+            logger.debug(f"Token count failed for {context}, using character estimate: {e}")
+            token_count = None
+        return self._apply_token_budget(input_text, token_count, context)
+    
+    async def _truncate_to_token_budget_async(self, input_text: str, context: str) -> str:
+        """Async variant of _truncate_to_token_budget."""
+        if not self._needs_token_count(input_text):
+            return self._apply_token_budget(input_text, None, context)
         
-        if cluster.metadata.topics:
-            context_lines.append(f"Topics: {', '.join(cluster.metadata.topics)}")
-        
-        context_lines.extend([
-            "",
-            "Please analyze these articles and provide:",
-            "1. A comprehensive summary (2-3 paragraphs)",
-            "2. Key points (3-5 bullet points)",
-            "3. Focus on factual information and avoid speculation",
-            "",
-            "ARTICLES:"
-        ])
-        
-        # Add article contents
-        for i, chunk_info in enumerate(chunk_contents, 1):
-            context_lines.extend([
-                f"\n--- Article {i} ---",
-                f"Title: {chunk_info['title']}",
-                f"Source: {chunk_info['source']}",
-                f"Published: {chunk_info['timestamp'][:10]}",  # Just date
-                f"Content: {chunk_info['content']}",
-                ""
-            ])
-        
-        return "\n".join(context_lines)
+        try:
+            await self._bucket.acquire_async()
+            token_count = (await self.model.count_tokens_async(input_text)).total_tokens
+        except Exception as e:
+            logger.debug(f"Token count failed for {context}, using character estimate: {e}")
+            token_count = None
+        return self._apply_token_budget(input_text, token_count, context)
+    
+    def _needs_token_count(self, input_text: str) -> bool:
+        """
+        Whether the character estimate is too close to the token budget to trust.
+        
+        Args:
+            input_text: Formatted input text
+            
+        Returns:
+            True if input_text should be measured with the model's tokenizer
+        """
+        limit = self.config.max_input_tokens
+        # Text never has more tokens than characters, so short inputs need no count
+        if len(input_text) <= limit:
+            return False
+        return abs(len(input_text) / 4 - limit) <= self.TOKEN_COUNT_MARGIN * limit
+    
+    def _apply_token_budget(self, input_text: str, token_count: Optional[int], context: str) -> str:
+        """
+        Cut input text down to the token budget.
+        
+        Args:
+            input_text: Formatted input text
+            token_count: Measured token count of input_text (None if unknown)
+            context: What is being summarized (for log messages)
+            
+        Returns:
+            Input text that fits the token budget
+        """
+        limit = self.config.max_input_tokens
+        if token_count is None:
+            max_chars = limit * 4  # Rough estimate
+        elif token_count <= limit:
+            return input_text
+        else:
+            # Scale by the measured characters per token, leaving some headroom
+            max_chars = int(len(input_text) * limit / token_count * 0.95)
+        
+        if len(input_text) <= max_chars:
+            return input_text
+        logger.warning(f"Truncated input for {context} due to token limit")
+        return input_text[:max_chars]
     
     def _generate_summary(self, input_text: str, cluster: ContentCluster) -> str:
         """
@@ -311,17 +980,33 @@ class GeminiSummarizer:
         Returns:
             Generated summary text
         """
+        return self._generate_content(input_text, f"cluster {cluster.id}")
+    
+    def _generate_content(self, input_text: str, context: str,
+                          generation_config: Optional[Any] = None) -> str:
+        """
+        Call Gemini with retry logic.
+        
+        Args:
+            input_text: Formatted input text
+            context: What is being summarized (for log messages)
+            generation_config: Per-request generation config overriding the model's
+            
+        Returns:
+            Generated response text, or an "API_ERROR: ..." string if the API
+            stayed rate limited or unavailable
+        """
+        request_kwargs = {'generation_config': generation_config} if generation_config is not None else {}
+        input_text = self._truncate_to_token_budget(input_text, context)
+        delay = self.config.retry_delay
         for attempt in range(self.config.retry_attempts):
             try:
-                # Check token limits
-                if len(input_text) > self.config.max_input_tokens * 4:  # Rough estimate
-                    input_text = input_text[:self.config.max_input_tokens * 4]
-                    logger.warning(f"Truncated input for cluster {cluster.id} due to token limit")
-                
-                # Generate content
+                # Wait for quota, then generate content
+                self._bucket.acquire()
                 response = self.model.generate_content(
                     input_text,
-                    request_options={'timeout': self.config.timeout}
+                    request_options={'timeout': self.config.timeout},
+                    **request_kwargs
                 )
                 
                 if response.text:
@@ -332,8 +1017,11 @@ class GeminiSummarizer:
             except (ResourceExhausted, ServiceUnavailable) as e:
                 logger.warning(f"Gemini API rate limit or unavailability encountered (attempt {attempt + 1}): {e}")
                 if attempt < self.config.retry_attempts - 1:
-                    delay = self.config.retry_delay * (2 ** attempt)
-                    time.sleep(delay)
+                    # Quota errors back off further and honor the server's retry hint
+                    cap = (self.config.resource_exhausted_max_delay if isinstance(e, ResourceExhausted)
+                           else self.config.retry_max_delay)
+                    delay = self._next_backoff(delay, cap)
+                    time.sleep(max(delay, _retry_after_seconds(e)))
                 else:
                     logger.error(f"All retry attempts failed for Gemini API: {e}")
                     return "API_ERROR: " + str(e) # Return a specific error string
@@ -342,14 +1030,108 @@ class GeminiSummarizer:
                 
                 if attempt < self.config.retry_attempts - 1:
                     # Exponential backoff
-                    delay = self.config.retry_delay * (2 ** attempt)
+                    delay = self._next_backoff(delay, self.config.retry_max_delay)
                     time.sleep(delay)
                 else:
                     raise e
     
+    async def _generate_content_async(self, input_text: str, context: str,
+                                      generation_config: Optional[Any] = None) -> str:
+        """
+        Async variant of _generate_content using generate_content_async.
+        
+        Args:
+            input_text: Formatted input text
+            context: What is being summarized (for log messages)
+            generation_config: Per-request generation config overriding the model's
+            
+        Returns:
+            Generated response text, or an "API_ERROR: ..." string if the API
+            stayed rate limited or unavailable
+        """
+        request_kwargs = {'generation_config': generation_config} if generation_config is not None else {}
+        input_text = await self._truncate_to_token_budget_async(input_text, context)
+        delay = self.config.retry_delay
+        for attempt in range(self.config.retry_attempts):
+            try:
+                # Wait for quota, then generate content
+                await self._bucket.acquire_async()
+                response = await self.model.generate_content_async(
+                    input_text,
+                    request_options={'timeout': self.config.timeout},
+                    **request_kwargs
+                )
+                
+                if response.text:
+                    return response.text.strip()
+                else:
+                    raise ValueError("Empty response from Gemini API")
+                
+            except (ResourceExhausted, ServiceUnavailable) as e:
+                logger.warning(f"Gemini API rate limit or unavailability encountered (attempt {attempt + 1}): {e}")
+                if attempt < self.config.retry_attempts - 1:
+                    # Quota errors back off further and honor the server's retry hint
+                    cap = (self.config.resource_exhausted_max_delay if isinstance(e, ResourceExhausted)
+                           else self.config.retry_max_delay)
+                    delay = self._next_backoff(delay, cap)
+                    await asyncio.sleep(max(delay, _retry_after_seconds(e)))
+                else:
+                    logger.error(f"All retry attempts failed for Gemini API: {e}")
+                    return "API_ERROR: " + str(e)
+            except Exception as e:
+                logger.warning(f"Summarization attempt {attempt + 1} failed: {e}")
+                
+                if attempt < self.config.retry_attempts - 1:
+                    # Exponential backoff
+                    delay = self._next_backoff(delay, self.config.retry_max_delay)
+                    await asyncio.sleep(delay)
+                else:
+                    raise e
+    
+    def _next_backoff(self, previous: float, cap: float) -> float:
+        """
+        Decorrelated-jitter exponential backoff.
+        
+        Args:
+            previous: Previous delay in seconds
+            cap: Maximum delay in seconds
+            
+        Returns:
+            Next delay, drawn uniformly between the base delay and 3x the previous one
+        """
+        base = self.config.retry_delay
+        return min(cap, random.uniform(base, max(base, previous * 3)))
+    
+    def _structured_fields(self, item: Any) -> Optional[Tuple[str, List[str]]]:
+        """
+        Extract summary and key points from a structured-output object.
+        
+        Args:
+            item: Decoded JSON object with "summary" and "key_points"
+            
+        Returns:
+            Tuple of (summary_text, key_points_list), or None if item has no usable summary
+        """
+        if not isinstance(item, dict):
+            return None
+        summary_text = item.get("summary")
+        if not isinstance(summary_text, str) or not summary_text.strip():
+            return None
+        
+        summary_text = summary_text.strip()
+        key_points = item.get("key_points")
+        if not isinstance(key_points, list):
+            key_points = []
+        key_points = [point.strip() for point in key_points if isinstance(point, str) and point.strip()]
+        if not key_points:
+            key_points = self._extract_key_points_from_summary(summary_text)
+        return summary_text, key_points
+    
     def _parse_summary_response(self, response_text: str) -> Tuple[str, List[str]]:
         """
-        Parse Gemini response to extract summary and key points.
+        Parse a free-text Gemini response to extract summary and key points.
+        
+        Fallback for responses that are not structured JSON.
         
         Args:
             response_text: Raw response from Gemini
@@ -357,34 +1139,30 @@ class GeminiSummarizer:
         Returns:
             Tuple of (summary_text, key_points_list)
         """
-        lines = response_text.strip().split('\n')
-        
         summary_lines = []
         key_points = []
-        current_section = "summary"
+        in_key_points = False
         
-        for line in lines:
+        for line in response_text.splitlines():
             line = line.strip()
             if not line:
                 continue
             
             # Detect key points section
-            if any(marker in line.lower() for marker in ['key points', 'main points', 'highlights']):
-                current_section = "key_points"
+            if _KEYPOINTS_MARKER_RE.search(line):
+                in_key_points = True
                 continue
             
-            if current_section == "summary":
+            if not in_key_points:
                 # Skip lines that look like headers
                 if not (line.startswith('#') or line.isupper()):
                     summary_lines.append(line)
             
-            elif current_section == "key_points":
-                # Extract bullet points
-                if line.startswith(('•', '-', '*', '1.', '2.', '3.', '4.', '5.')):
-                    # Clean up bullet point
-                    clean_point = re.sub(r'^[•\-\*\d\.]\s*', '', line).strip()
-                    if clean_point:
-                        key_points.append(clean_point)
+            elif line.startswith(_BULLET_PREFIXES):
+                # Extract bullet points, dropping the whole marker (e.g. "1. ")
+                clean_point = _BULLET_STRIP_RE.sub('', line, count=1).strip()
+                if clean_point:
+                    key_points.append(clean_point)
         
         # Join summary lines
         summary_text = ' '.join(summary_lines)
@@ -397,7 +1175,7 @@ class GeminiSummarizer:
     
     def _extract_key_points_from_summary(self, summary_text: str) -> List[str]:
         """Extract key points from summary text as fallback."""
-        sentences = re.split(r'[.!?]+', summary_text)
+        sentences = _SENTENCE_SPLIT_RE.split(summary_text)
         
         # Take first few meaningful sentences as key points
         key_points = []
@@ -408,12 +1186,14 @@ class GeminiSummarizer:
         
         return key_points[:3]  # Limit to 3 points
     
-    def _calculate_summary_confidence(self, summary_text: str, cluster: ContentCluster) -> float:
+    def _calculate_summary_confidence(self, summary_text: str, word_count: int,
+                                      cluster: ContentCluster) -> float:
         """
         Calculate confidence score for generated summary.
         
         Args:
             summary_text: Generated summary
+            word_count: Number of words in the summary
             cluster: Original cluster
             
         Returns:
@@ -422,7 +1202,6 @@ class GeminiSummarizer:
         confidence = 1.0
         
         # Reduce confidence for very short summaries
-        word_count = len(summary_text.split())
         if word_count < 50:
             confidence *= 0.7
         elif word_count < 100:
@@ -433,8 +1212,7 @@ class GeminiSummarizer:
             confidence *= 0.8
         
         # Reduce confidence if summary seems generic
-        generic_phrases = ['according to reports', 'it is reported', 'sources say']
-        generic_count = sum(1 for phrase in generic_phrases if phrase in summary_text.lower())
+        generic_count = len({match.lower() for match in _GENERIC_RE.findall(summary_text)})
         if generic_count > 2:
             confidence *= 0.8
         
@@ -453,15 +1231,14 @@ class GeminiSummarizer:
         # Create basic summary from titles and metadata
         titles = [chunk.metadata.title for chunk in cluster.chunks[:3]]
         
-        fallback_text = f"This cluster contains {cluster.chunk_count} related articles"
-        
-        if cluster.metadata.primary_ticker:
-            fallback_text += f" about {cluster.metadata.primary_ticker}"
-        
-        if cluster.metadata.topics:
-            fallback_text += f" covering {', '.join(cluster.metadata.topics[:2])}"
-        
-        fallback_text += f". Recent articles include: {'; '.join(titles[:2])}."
+        ticker = cluster.metadata.primary_ticker
+        topics = cluster.metadata.topics
+        fallback_text = _FALLBACK_TMPL.format(
+            n=cluster.chunk_count,
+            ticker_part=f" about {ticker}" if ticker else "",
+            topics_part=f" covering {', '.join(topics[:2])}" if topics else "",
+            titles='; '.join(titles[:2])
+        )
         
         # Extract key points from titles
         key_points = titles[:3] if len(titles) >= 3 else titles
@@ -471,12 +1248,18 @@ class GeminiSummarizer:
             cluster_id=cluster.id,
             summary=fallback_text,
             key_points=key_points,
-            generated_at=datetime.utcnow(),
+            generated_at=_now_utc(),
             model_used="fallback",
             confidence=0.3,  # Low confidence for fallback
             word_count=len(fallback_text.split())
         )
     
+    def close(self):
+        """Shut down the prompt prefetch thread, if one was started."""
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=False)
+            self._prefetch_executor = None
+    
     def create_structured_output(self, cluster: ContentCluster, 
                                summary: ClusterSummary) -> Dict[str, Any]:
         """
@@ -524,31 +1307,33 @@ class GeminiSummarizer:
         if not summaries:
             return {}
         
-        word_counts = [s.word_count for s in summaries]
-        confidence_scores = [s.confidence for s in summaries]
-        key_point_counts = [len(s.key_points) for s in summaries]
+        n = len(summaries)
+        word_counts = np.fromiter((s.word_count for s in summaries), dtype=np.int64, count=n)
+        confidence_scores = np.fromiter((s.confidence for s in summaries), dtype=np.float64, count=n)
+        key_point_counts = np.fromiter((len(s.key_points) for s in summaries), dtype=np.int64, count=n)
+        
+        models_used = dict(Counter(s.model_used for s in summaries))
         
-        models_used = {}
-        for summary in summaries:
-            models_used[summary.model_used] = models_used.get(summary.model_used, 0) + 1
+        # Upper median via O(n) selection instead of a full sort
+        mid = n // 2
         
         return {
-            'total_summaries': len(summaries),
+            'total_summaries': n,
             'word_count_stats': {
-                'min': min(word_counts),
-                'max': max(word_counts),
-                'mean': sum(word_counts) / len(word_counts),
-                'median': sorted(word_counts)[len(word_counts) // 2]
+                'min': int(word_counts.min()),
+                'max': int(word_counts.max()),
+                'mean': float(word_counts.mean()),
+                'median': int(np.partition(word_counts, mid)[mid])
             },
             'confidence_stats': {
-                'min': min(confidence_scores),
-                'max': max(confidence_scores),
-                'mean': sum(confidence_scores) / len(confidence_scores)
+                'min': float(confidence_scores.min()),
+                'max': float(confidence_scores.max()),
+                'mean': float(confidence_scores.mean())
             },
             'key_points_stats': {
-                'min': min(key_point_counts),
-                'max': max(key_point_counts),
-                'mean': sum(key_point_counts) / len(key_point_counts)
+                'min': int(key_point_counts.min()),
+                'max': int(key_point_counts.max()),
+                'mean': float(key_point_counts.mean())
             },
             'models_used': models_used
         }
@@ -7,10 +7,15 @@ for database passwords and connection strings.
 """
 
 import logging
+import asyncio
 import json
+import threading
 import uuid
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from collections import OrderedDict
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import datetime, timedelta
+
+import numpy as np
 
 try:
     from supabase import create_client, Client
@@ -18,10 +23,258 @@ try:
 except ImportError:
     SUPABASE_AVAILABLE = False
 
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    from sklearn.decomposition import IncrementalPCA
+    SKLEARN_AVAILABLE = True
+except ImportError:
+    SKLEARN_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401 - enables httpx's HTTP/2 support
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 from .models import ContentChunk, ContentCluster, ClusterSummary
 
 logger = logging.getLogger(__name__)
 
+# model_config row holding the fitted embedding projection
+_PROJECTION_CONFIG_NAME = 'embedding_pca'
+
+# Columns returned by get_chunks_by_cluster; the embedding is opt-in
+_CLUSTER_CHUNK_COLUMNS = 'id, content, processed_content, metadata, created_at'
+
+VECTOR_INDEX_TYPES = ("hnsw", "ivfflat")
+
+
+def configure_hnsw_params(vector_count: int) -> Dict[str, int]:
+    """
+    Choose HNSW build and search parameters for a table size.
+    
+    Args:
+        vector_count: Number of vectors in the indexed table
+        
+    Returns:
+        Dictionary with m, ef_construction and ef_search
+    """
+    if vector_count < 100_000:
+        return {'m': 16, 'ef_construction': 64, 'ef_search': 40}
+    if vector_count < 1_000_000:
+        return {'m': 16, 'ef_construction': 128, 'ef_search': 100}
+    if vector_count < 10_000_000:
+        return {'m': 24, 'ef_construction': 200, 'ef_search': 200}
+    return {'m': 32, 'ef_construction': 256, 'ef_search': 400}
+
+
+def _vector_to_list(vector) -> Optional[List[float]]:
+    """Convert an embedding or centroid to a JSON list at halfvec (FP16) precision."""
+    if vector is None:
+        return None
+    return np.asarray(vector, dtype=np.float16).tolist()
+
+
+def _similarity_cache_key(embedding, threshold: float, limit: int,
+                          exclude_ids: Optional[List[str]], title_prefilter: Optional[str] = None) -> Tuple:
+    """Key a similarity query by its embedding quantized to hundredths (int8) and its arguments."""
+    quantized = np.clip(np.rint(np.asarray(embedding, dtype=np.float32) * 100), -127, 127)
+    return (quantized.astype(np.int8).tobytes(), threshold, limit,
+            tuple(sorted(exclude_ids or ())), title_prefilter)
+
+
+class SimilarityQueryCache:
+    """
+    In-memory LRU cache of find_similar_chunks results.
+    
+    Near-identical query embeddings share an entry because keys use the
+    quantized embedding. Cleared whenever chunks are written, so cached
+    results never outlive the data they came from. Each clear starts a new
+    generation; a query records the generation before its RPC and its
+    results are dropped if a write cleared the cache in the meantime.
+    """
+    
+    def __init__(self, max_entries: int = 4096):
+        """Initialize similarity query cache."""
+        self.max_entries = max_entries
+        self.stats = {"hits": 0, "misses": 0}
+        self._entries: "OrderedDict[Tuple, List[Dict[str, Any]]]" = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def generation(self) -> int:
+        """Number of times the cache has been cleared."""
+        return self._generation
+    
+    def get(self, key: Tuple) -> Optional[List[Dict[str, Any]]]:
+        """Get cached results, marking them most recently used."""
+        with self._lock:
+            results = self._entries.get(key)
+            if results is None:
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return list(results)
+    
+    def set(self, key: Tuple, results: List[Dict[str, Any]], generation: Optional[int] = None):
+        """
+        Store results, evicting the least recently used entries past max_entries.
+        
+        Args:
+            key: Cache key from _similarity_cache_key
+            results: Query results to store
+            generation: Generation read before the query ran; the results are
+                discarded if the cache has been cleared since
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = list(results)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Drop all cached results and any results still being fetched."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class EmbeddingProjector:
+    """
+    PCA projection of embeddings onto fewer dimensions.
+    
+    Projected vectors are re-normalized so cosine search still applies.
+    Serializable to a JSON dict so every writer and reader shares one fit.
+    """
+    
+    def __init__(self, mean: np.ndarray, components: np.ndarray):
+        """
+        Initialize embedding projector.
+        
+        Args:
+            mean: Mean embedding subtracted before projecting
+            components: Principal axes, shape (target_dimension, input_dimension)
+        """
+        self.mean = np.asarray(mean, dtype=np.float32)
+        self.components = np.asarray(components, dtype=np.float32)
+    
+    @property
+    def output_dimension(self) -> int:
+        return self.components.shape[0]
+    
+    @classmethod
+    def fit(cls, embeddings: np.ndarray, target_dimension: int) -> "EmbeddingProjector":
+        """
+        Fit a projection on a sample of embeddings.
+        
+        Args:
+            embeddings: 2-D array of sample embeddings
+            target_dimension: Number of dimensions to keep
+            
+        Returns:
+            Fitted EmbeddingProjector
+        """
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        if matrix.ndim != 2 or min(matrix.shape) < target_dimension:
+            raise ValueError(f"Fitting a {target_dimension}-dimension projection needs at least "
+                             f"{target_dimension} embeddings, got {len(matrix)}")
+        
+        if SKLEARN_AVAILABLE:
+            pca = IncrementalPCA(n_components=target_dimension).fit(matrix)
+            return cls(pca.mean_, pca.components_)
+        
+        mean = matrix.mean(axis=0)
+        _, _, vt = np.linalg.svd(matrix - mean, full_matrices=False)
+        return cls(mean, vt[:target_dimension])
+    
+    def transform(self, vectors) -> np.ndarray:
+        """Project one vector or a 2-D array of vectors and L2-normalize the result."""
+        reduced = (np.asarray(vectors, dtype=np.float32) - self.mean) @ self.components.T
+        norms = np.linalg.norm(reduced, axis=-1, keepdims=True)
+        return reduced / np.where(norms == 0, 1, norms)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {'mean': self.mean.tolist(), 'components': self.components.tolist()}
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EmbeddingProjector":
+        """Rebuild a projector from to_dict output."""
+        return cls(data['mean'], data['components'])
+
+
+def _chunk_rows(chunks: List[ContentChunk],
+                projector: Optional[EmbeddingProjector] = None) -> List[Dict[str, Any]]:
+    """Build content_chunks rows, converting all embeddings with one FP16 cast."""
+    embedded = [chunk.embedding for chunk in chunks if chunk.embedding is not None]
+    matrix = np.vstack(embedded) if embedded else None
+    if matrix is not None and projector is not None:
+        matrix = projector.transform(matrix)
+    vectors = iter(matrix.astype(np.float16).tolist() if matrix is not None else ())
+    
+    return [
+        {
+            'id': chunk.id or str(uuid.uuid4()),
+            'content': chunk.content,
+            'processed_content': chunk.processed_content,
+            'embedding': next(vectors) if chunk.embedding is not None else None,
+            'metadata': chunk.metadata.to_dict(),
+            'cluster_id': chunk.cluster_id
+        }
+        for chunk in chunks
+    ]
+
+
+def _cluster_row(cluster: ContentCluster,
+                 projector: Optional[EmbeddingProjector] = None) -> Dict[str, Any]:
+    """Build the content_clusters row for a cluster."""
+    centroid = cluster.centroid
+    if centroid is not None and projector is not None:
+        centroid = projector.transform(centroid)
+    
+    return {
+        'id': cluster.id or str(uuid.uuid4()),
+        'centroid': _vector_to_list(centroid),
+        'metadata': cluster.metadata.to_dict(),
+        'chunk_count': cluster.chunk_count
+    }
+
+
+def _missing_projection_error(target_dimension: int) -> ValueError:
+    """Error raised when dimension reduction is on but no projection has been fitted."""
+    return ValueError(f"target_dimension={target_dimension} is set but no embedding projection "
+                      f"is stored; call fit_projection() with a sample of embeddings first")
+
+
+def _summary_row(summary: ClusterSummary) -> Dict[str, Any]:
+    """Build the cluster_summaries row for a summary."""
+    return {
+        'id': summary.id or str(uuid.uuid4()),
+        'cluster_id': summary.cluster_id,
+        'summary': summary.summary,
+        'key_points': summary.key_points,
+        'metadata': {
+            'generated_at': summary.generated_at.isoformat(),
+            'model_used': summary.model_used,
+            'confidence': summary.confidence
+        },
+        'model_used': summary.model_used,
+        'confidence': summary.confidence,
+        'word_count': summary.word_count
+    }
+
 
 class SupabaseManager:
     """
@@ -34,7 +287,14 @@ class SupabaseManager:
     - Built-in connection pooling and retry logic
     """
     
-    def __init__(self, supabase_url: str, supabase_key: str, vector_dimension: int = 384):
+    # Maximum chunk IDs sent in one assign_cluster call, to stay under request size limits
+    ASSIGN_BATCH_SIZE = 10000
+    
+    # Rows per chunk upsert request; larger batches add payload without speeding up loads
+    INSERT_BATCH_SIZE = 1000
+    
+    def __init__(self, supabase_url: str, supabase_key: str, vector_dimension: int = 384,
+                 index_type: str = "hnsw", target_dimension: Optional[int] = None):
         """
         Initialize Supabase manager.
         
@@ -42,6 +302,9 @@ class SupabaseManager:
             supabase_url: Supabase project URL
             supabase_key: Supabase API key (anon or service role)
             vector_dimension: Vector dimension for embeddings
+            index_type: Vector index type, "hnsw" or "ivfflat"
+            target_dimension: Store PCA-reduced vectors of this size (None keeps full embeddings);
+                requires a projection stored with fit_projection()
         """
         if not SUPABASE_AVAILABLE:
             raise ImportError("supabase-py is required for Supabase operations. Install with: pip install supabase")
@@ -49,26 +312,135 @@ class SupabaseManager:
         if not supabase_url or not supabase_key:
             raise ValueError("Both supabase_url and supabase_key are required")
         
+        if index_type not in VECTOR_INDEX_TYPES:
+            raise ValueError(f"index_type must be one of {VECTOR_INDEX_TYPES}, got {index_type!r}")
+        
+        if target_dimension is not None and not 0 < target_dimension < vector_dimension:
+            raise ValueError(f"target_dimension must be between 1 and {vector_dimension - 1}")
+        
         self.client: Client = create_client(supabase_url, supabase_key)
-        self.vector_dimension = vector_dimension
+        self.embedding_dimension = vector_dimension
+        self.target_dimension = target_dimension
+        self.vector_dimension = target_dimension or vector_dimension
+        self.index_type = index_type
+        self._projector: Optional[EmbeddingProjector] = None
+        self._projector_lock = threading.Lock()
+        self.hnsw_params = configure_hnsw_params(0)
+        self.similarity_cache = SimilarityQueryCache()
         
         logger.info("SupabaseManager initialized successfully")
     
+    def auto_configure_index(self) -> Dict[str, int]:
+        """
+        Size the HNSW parameters from the current number of stored chunks.
+        
+        A schema step: the parameters only feed the index and ef_search
+        statements of create_schema, so call this right before generating
+        the schema or a reindex migration. It runs an exact row count,
+        which scans the table.
+        
+        Returns:
+            The HNSW parameters now in use
+        """
+        try:
+            result = self.client.table('content_chunks').select('id', count='exact').limit(1).execute()
+            vector_count = result.count or 0
+            self.hnsw_params = configure_hnsw_params(vector_count)
+            logger.info(f"Vector index tuned for {vector_count} chunks: {self.hnsw_params}")
+        except Exception as e:
+            logger.warning(f"Failed to count chunks for index tuning, using defaults: {e}")
+        
+        return self.hnsw_params
+    
+    def fit_projection(self, sample) -> EmbeddingProjector:
+        """
+        Fit the embedding projection on a sample and store it for all writers and readers.
+        
+        Run once as a setup step before inserting when target_dimension is set.
+        Refitting replaces the stored projection, so vectors already stored
+        with the old one must be re-inserted.
+        
+        Args:
+            sample: Embeddings to fit on, at least target_dimension of them
+            
+        Returns:
+            The fitted projector
+        """
+        if self.target_dimension is None:
+            raise ValueError("fit_projection requires target_dimension to be set")
+        
+        projector = EmbeddingProjector.fit(np.vstack(sample), self.target_dimension)
+        with self._projector_lock:
+            self.client.table('model_config').upsert({
+                'name': _PROJECTION_CONFIG_NAME,
+                'config': projector.to_dict()
+            }).execute()
+            self._projector = projector
+        
+        self.similarity_cache.clear()
+        logger.info(f"Fitted {self.target_dimension}-dimension embedding projection "
+                    f"on {len(sample)} embeddings")
+        return projector
+    
+    def _get_projector(self) -> Optional[EmbeddingProjector]:
+        """
+        Load the stored embedding projection.
+        
+        Returns:
+            The projector, or None when dimension reduction is off
+            
+        Raises:
+            ValueError: If dimension reduction is on but no projection has been fitted
+        """
+        if self.target_dimension is None or self._projector is not None:
+            return self._projector
+        
+        with self._projector_lock:
+            if self._projector is None:
+                result = self.client.table('model_config').select('config').eq(
+                    'name', _PROJECTION_CONFIG_NAME
+                ).limit(1).execute()
+                
+                if not result.data:
+                    raise _missing_projection_error(self.target_dimension)
+                self._projector = EmbeddingProjector.from_dict(result.data[0]['config'])
+            
+            return self._projector
+    
+    def _vector_index_sql(self, column: str) -> str:
+        """Build the USING/WITH clause of a vector index for the configured index type."""
+        if self.index_type == "ivfflat":
+            return f"USING ivfflat ({column} halfvec_cosine_ops) WITH (lists = 100)"
+        return (f"USING hnsw ({column} halfvec_cosine_ops) "
+                f"WITH (m = {self.hnsw_params['m']}, ef_construction = {self.hnsw_params['ef_construction']})")
+    
+    def _search_settings_sql(self) -> str:
+        """Build the statement setting the database's default HNSW search breadth."""
+        if self.index_type != "hnsw":
+            return ""
+        return ("-- Default HNSW search breadth for new sessions; match_chunks stays\n"
+                "        -- inlinable, so it cannot set this per call\n"
+                "        DO $$ BEGIN\n"
+                "            EXECUTE format('ALTER DATABASE %I SET hnsw.ef_search = %s',\n"
+                f"                           current_database(), {self.hnsw_params['ef_search']});\n"
+                "        END $$;")
+    
     def create_schema(self):
         """
         Create database schema with pgvector extension and tables.
         Note: This should be run once through Supabase SQL editor or migration.
         """
         schema_sql = f"""
-        -- Enable pgvector extension
+        -- Enable pgvector extension (0.7+ for halfvec)
         CREATE EXTENSION IF NOT EXISTS vector;
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
         
         -- Create content_chunks table
         CREATE TABLE IF NOT EXISTS content_chunks (
             id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
             content TEXT NOT NULL,
             processed_content TEXT,
-            embedding vector({self.vector_dimension}),
+            embedding halfvec({self.vector_dimension}),
             metadata JSONB NOT NULL,
             cluster_id UUID,
             created_at TIMESTAMP DEFAULT NOW(),
@@ -78,7 +450,7 @@ class SupabaseManager:
         -- Create content_clusters table
         CREATE TABLE IF NOT EXISTS content_clusters (
             id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-            centroid vector({self.vector_dimension}),
+            centroid halfvec({self.vector_dimension}),
             metadata JSONB NOT NULL,
             chunk_count INTEGER DEFAULT 0,
             created_at TIMESTAMP DEFAULT NOW(),
@@ -98,14 +470,21 @@ class SupabaseManager:
             word_count INTEGER DEFAULT 0
         );
         
+        -- Create model_config table (persisted embedding projection, etc.)
+        CREATE TABLE IF NOT EXISTS model_config (
+            name TEXT PRIMARY KEY,
+            config JSONB NOT NULL,
+            updated_at TIMESTAMP DEFAULT NOW()
+        );
+        
         -- Create indexes for vector similarity search
         CREATE INDEX IF NOT EXISTS idx_chunks_embedding ON content_chunks 
-        USING ivfflat (embedding vector_cosine_ops) 
-        WITH (lists = 100);
+        {self._vector_index_sql('embedding')};
         
         CREATE INDEX IF NOT EXISTS idx_clusters_centroid ON content_clusters 
-        USING ivfflat (centroid vector_cosine_ops)
-        WITH (lists = 100);
+        {self._vector_index_sql('centroid')};
+        
+        {self._search_settings_sql()}
         
         -- Create other useful indexes
         CREATE INDEX IF NOT EXISTS idx_chunks_cluster_id ON content_chunks(cluster_id);
@@ -121,9 +500,15 @@ class SupabaseManager:
         CREATE INDEX IF NOT EXISTS idx_chunks_metadata_source ON content_chunks 
         USING GIN ((metadata->>'source'));
         
-        -- Function for vector similarity search
+        -- Trigram index for lexical prefiltering of near-duplicates
+        CREATE INDEX IF NOT EXISTS idx_chunks_content_trgm ON content_chunks 
+        USING GIN (content gin_trgm_ops);
+        
+        -- Function for vector similarity search. Plain SQL so the planner can inline
+        -- it and use the vector index for the ORDER BY; the threshold is applied as
+        -- a distance bound
         CREATE OR REPLACE FUNCTION match_chunks (
-            query_embedding vector({self.vector_dimension}),
+            query_embedding halfvec({self.vector_dimension}),
             similarity_threshold float DEFAULT 0.8,
             match_count int DEFAULT 10,
             exclude_ids uuid[] DEFAULT '{{}}'
@@ -136,10 +521,8 @@ class SupabaseManager:
             cluster_id uuid,
             similarity float
         )
-        LANGUAGE plpgsql
+        LANGUAGE sql STABLE PARALLEL SAFE
         AS $$
-        BEGIN
-            RETURN QUERY
             SELECT
                 content_chunks.id,
                 content_chunks.content,
@@ -150,9 +533,115 @@ class SupabaseManager:
             FROM content_chunks
             WHERE content_chunks.embedding IS NOT NULL
             AND content_chunks.id <> ALL(exclude_ids)
-            AND 1 - (content_chunks.embedding <=> query_embedding) >= similarity_threshold
+            AND (content_chunks.embedding <=> query_embedding) <= 1 - similarity_threshold
             ORDER BY content_chunks.embedding <=> query_embedding
             LIMIT match_count;
+        $$;
+        
+        -- Variant of match_chunks that first narrows candidates to chunks whose
+        -- content contains a stretch word-similar to title_prefilter (pg_trgm <%).
+        -- Plain similarity (%) compares against the whole content and never reaches
+        -- the threshold for a short title; <% is served by the gin_trgm_ops index.
+        CREATE OR REPLACE FUNCTION match_chunks (
+            query_embedding halfvec({self.vector_dimension}),
+            title_prefilter text,
+            similarity_threshold float DEFAULT 0.8,
+            match_count int DEFAULT 10,
+            exclude_ids uuid[] DEFAULT '{{}}'
+        )
+        RETURNS TABLE (
+            id uuid,
+            content text,
+            processed_content text,
+            metadata jsonb,
+            cluster_id uuid,
+            similarity float
+        )
+        LANGUAGE sql STABLE PARALLEL SAFE
+        AS $$
+            SELECT
+                content_chunks.id,
+                content_chunks.content,
+                content_chunks.processed_content,
+                content_chunks.metadata,
+                content_chunks.cluster_id,
+                1 - (content_chunks.embedding <=> query_embedding) as similarity
+            FROM content_chunks
+            WHERE title_prefilter <% content_chunks.content
+            AND content_chunks.embedding IS NOT NULL
+            AND content_chunks.id <> ALL(exclude_ids)
+            AND (content_chunks.embedding <=> query_embedding) <= 1 - similarity_threshold
+            ORDER BY content_chunks.embedding <=> query_embedding
+            LIMIT match_count;
+        $$;
+        
+        -- Function to assign many chunks to a cluster in one call
+        CREATE OR REPLACE FUNCTION assign_cluster (
+            chunk_ids uuid[],
+            new_cluster_id uuid
+        )
+        RETURNS integer
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            updated_count integer;
+        BEGIN
+            UPDATE content_chunks
+            SET cluster_id = new_cluster_id, updated_at = NOW()
+            WHERE id = ANY(chunk_ids);
+            GET DIAGNOSTICS updated_count = ROW_COUNT;
+            RETURN updated_count;
+        END;
+        $$;
+        
+        -- Function to get recent clusters with their latest summary in one query
+        CREATE OR REPLACE FUNCTION get_recent_clusters_with_summaries (
+            hours_back int DEFAULT 24,
+            limit_count int DEFAULT 10,
+            include_centroid boolean DEFAULT false
+        )
+        RETURNS TABLE (
+            id uuid,
+            centroid halfvec({self.vector_dimension}),
+            metadata jsonb,
+            chunk_count integer,
+            created_at timestamp,
+            updated_at timestamp,
+            summary text,
+            key_points jsonb,
+            confidence float,
+            model_used varchar
+        )
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            RETURN QUERY
+            SELECT
+                content_clusters.id,
+                CASE WHEN include_centroid THEN content_clusters.centroid END,
+                content_clusters.metadata,
+                content_clusters.chunk_count,
+                content_clusters.created_at,
+                content_clusters.updated_at,
+                latest.summary,
+                latest.key_points,
+                latest.confidence,
+                latest.model_used
+            FROM content_clusters
+            LEFT JOIN LATERAL (
+                SELECT
+                    cluster_summaries.summary,
+                    cluster_summaries.key_points,
+                    cluster_summaries.confidence,
+                    cluster_summaries.model_used
+                FROM cluster_summaries
+                WHERE cluster_summaries.cluster_id = content_clusters.id
+                ORDER BY cluster_summaries.generated_at DESC
+                LIMIT 1
+            ) latest ON true
+            WHERE content_clusters.created_at >= NOW() - INTERVAL '1 hour' * hours_back
+            ORDER BY content_clusters.updated_at DESC
+            LIMIT limit_count;
         END;
         $$;
         """
@@ -175,28 +664,14 @@ class SupabaseManager:
             ID of the inserted chunk
         """
         try:
-            chunk_id = chunk.id or str(uuid.uuid4())
-            
-            # Convert embedding to list if it's a numpy array
-            embedding = None
-            if chunk.embedding is not None:
-                if hasattr(chunk.embedding, 'tolist'):
-                    embedding = chunk.embedding.tolist()
-                else:
-                    embedding = list(chunk.embedding)
-            
-            data = {
-                'id': chunk_id,
-                'content': chunk.content,
-                'processed_content': chunk.processed_content,
-                'embedding': embedding,
-                'metadata': chunk.metadata.to_dict(),
-                'cluster_id': chunk.cluster_id
-            }
+            projector = self._get_projector()
+            data = _chunk_rows([chunk], projector)[0]
+            chunk_id = data['id']
             
             result = self.client.table('content_chunks').upsert(data).execute()
             
             if result.data:
+                self.similarity_cache.clear()
                 logger.debug(f"Successfully inserted chunk {chunk_id}")
                 return chunk_id
             else:
@@ -221,45 +696,28 @@ class SupabaseManager:
         
         try:
             chunk_ids = []
-            batch_data = []
+            projector = self._get_projector()
             
-            for chunk in chunks:
-                chunk_id = chunk.id or str(uuid.uuid4())
-                chunk_ids.append(chunk_id)
-                
-                # Convert embedding to list if it's a numpy array
-                embedding = None
-                if chunk.embedding is not None:
-                    if hasattr(chunk.embedding, 'tolist'):
-                        embedding = chunk.embedding.tolist()
-                    else:
-                        embedding = list(chunk.embedding)
+            # Upsert in fixed-size batches to stay under request size limits
+            for start in range(0, len(chunks), self.INSERT_BATCH_SIZE):
+                batch_data = _chunk_rows(chunks[start:start + self.INSERT_BATCH_SIZE], projector)
+                result = self.client.table('content_chunks').upsert(batch_data).execute()
                 
-                data = {
-                    'id': chunk_id,
-                    'content': chunk.content,
-                    'processed_content': chunk.processed_content,
-                    'embedding': embedding,
-                    'metadata': chunk.metadata.to_dict(),
-                    'cluster_id': chunk.cluster_id
-                }
-                batch_data.append(data)
+                if not result.data:
+                    raise Exception("No data returned from batch insert operation")
+                self.similarity_cache.clear()
+                chunk_ids.extend(data['id'] for data in batch_data)
             
-            # Use upsert for batch insert
-            result = self.client.table('content_chunks').upsert(batch_data).execute()
-            
-            if result.data:
-                logger.info(f"Successfully inserted {len(chunk_ids)} chunks")
-                return chunk_ids
-            else:
-                raise Exception("No data returned from batch insert operation")
+            logger.info(f"Successfully inserted {len(chunk_ids)} chunks")
+            return chunk_ids
             
         except Exception as e:
             logger.error(f"Failed to insert chunks batch: {e}")
             raise
     
     def find_similar_chunks(self, embedding: List[float], threshold: float = 0.8, 
-                           limit: int = 10, exclude_ids: List[str] = None) -> List[Dict[str, Any]]:
+                           limit: int = 10, exclude_ids: List[str] = None,
+                           title_prefilter: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Find similar chunks using vector similarity search.
         
@@ -268,29 +726,41 @@ class SupabaseManager:
             threshold: Minimum similarity threshold
             limit: Maximum number of results
             exclude_ids: Chunk IDs to exclude from results
+            title_prefilter: Only consider chunks whose content contains words trigram-similar to this text
             
         Returns:
             List of similar chunks with similarity scores
         """
         try:
+            cache_key = _similarity_cache_key(embedding, threshold, limit, exclude_ids, title_prefilter)
+            cached = self.similarity_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            # A write landing while the RPC runs makes its results stale
+            generation = self.similarity_cache.generation
+            
+            query_embedding = embedding
+            if self.target_dimension is not None:
+                query_embedding = self._get_projector().transform(embedding)
+            
             # Convert exclude_ids to UUID array format for PostgreSQL
             exclude_uuids = exclude_ids or []
             
+            params = {
+                'query_embedding': _vector_to_list(query_embedding),
+                'similarity_threshold': threshold,
+                'match_count': limit,
+                'exclude_ids': exclude_uuids
+            }
+            if title_prefilter:
+                params['title_prefilter'] = title_prefilter
+            
             # Call the database function for vector similarity
-            result = self.client.rpc(
-                'match_chunks',
-                {
-                    'query_embedding': embedding,
-                    'similarity_threshold': threshold,
-                    'match_count': limit,
-                    'exclude_ids': exclude_uuids
-                }
-            ).execute()
+            result = self.client.rpc('match_chunks', params).execute()
             
-            if result.data:
-                return result.data
-            else:
-                return []
+            matches = result.data if result.data else []
+            self.similarity_cache.set(cache_key, matches, generation)
+            return matches
             
         except Exception as e:
             logger.error(f"Failed to find similar chunks: {e}")
@@ -338,22 +808,9 @@ class SupabaseManager:
             ID of the inserted cluster
         """
         try:
-            cluster_id = cluster.id or str(uuid.uuid4())
-            
-            # Convert centroid to list if it's a numpy array
-            centroid = None
-            if cluster.centroid is not None:
-                if hasattr(cluster.centroid, 'tolist'):
-                    centroid = cluster.centroid.tolist()
-                else:
-                    centroid = list(cluster.centroid)
-            
-            data = {
-                'id': cluster_id,
-                'centroid': centroid,
-                'metadata': cluster.metadata.to_dict(),
-                'chunk_count': cluster.chunk_count
-            }
+            projector = self._get_projector()
+            data = _cluster_row(cluster, projector)
+            cluster_id = data['id']
             
             result = self.client.table('content_clusters').upsert(data).execute()
             
@@ -379,36 +836,49 @@ class SupabaseManager:
             return
         
         try:
-            # Update chunks one by one (Supabase doesn't support batch updates with WHERE IN through REST API)
-            for chunk_id in chunk_ids:
-                result = self.client.table('content_chunks').update({
-                    'cluster_id': cluster_id,
-                    'updated_at': datetime.utcnow().isoformat()
-                }).eq('id', chunk_id).execute()
-                
-                if not result.data:
-                    logger.warning(f"No result for updating chunk {chunk_id}")
+            # One assign_cluster RPC per batch instead of one PATCH per chunk
+            updated = 0
+            for start in range(0, len(chunk_ids), self.ASSIGN_BATCH_SIZE):
+                batch = chunk_ids[start:start + self.ASSIGN_BATCH_SIZE]
+                result = self.client.rpc(
+                    'assign_cluster',
+                    {
+                        'chunk_ids': batch,
+                        'new_cluster_id': cluster_id
+                    }
+                ).execute()
+                updated += result.data or 0
+            
+            if updated < len(chunk_ids):
+                logger.warning(f"Only {updated} of {len(chunk_ids)} chunks found for cluster {cluster_id}")
             
+            self.similarity_cache.clear()
             logger.info(f"Updated {len(chunk_ids)} chunks with cluster {cluster_id}")
             
         except Exception as e:
             logger.error(f"Failed to update chunk cluster assignments: {e}")
             raise
     
-    def get_chunks_by_cluster(self, cluster_id: str) -> List[Dict[str, Any]]:
+    def get_chunks_by_cluster(self, cluster_id: str,
+                              include_embedding: bool = False) -> List[Dict[str, Any]]:
         """
         Get all chunks belonging to a cluster.
         
         Args:
             cluster_id: Cluster ID
+            include_embedding: Whether to also return each chunk's embedding
             
         Returns:
             List of chunk data
         """
         try:
-            result = self.client.table('content_chunks').select(
-                'id, content, processed_content, embedding, metadata, created_at'
-            ).eq('cluster_id', cluster_id).order('created_at', desc=True).execute()
+            columns = _CLUSTER_CHUNK_COLUMNS
+            if include_embedding:
+                columns += ', embedding'
+            
+            result = self.client.table('content_chunks').select(columns).eq(
+                'cluster_id', cluster_id
+            ).order('created_at', desc=True).execute()
             
             return result.data if result.data else []
             
@@ -427,24 +897,8 @@ class SupabaseManager:
             ID of the inserted summary
         """
         try:
-            summary_id = summary.id or str(uuid.uuid4())
-            
-            metadata = {
-                'generated_at': summary.generated_at.isoformat(),
-                'model_used': summary.model_used,
-                'confidence': summary.confidence
-            }
-            
-            data = {
-                'id': summary_id,
-                'cluster_id': summary.cluster_id,
-                'summary': summary.summary,
-                'key_points': summary.key_points,
-                'metadata': metadata,
-                'model_used': summary.model_used,
-                'confidence': summary.confidence,
-                'word_count': summary.word_count
-            }
+            data = _summary_row(summary)
+            summary_id = data['id']
             
             result = self.client.table('cluster_summaries').upsert(data).execute()
             
@@ -458,29 +912,29 @@ class SupabaseManager:
             logger.error(f"Failed to insert cluster summary: {e}")
             raise
     
-    def get_recent_clusters(self, limit: int = 10, hours: int = 24) -> List[Dict[str, Any]]:
+    def get_recent_clusters(self, limit: int = 10, hours: int = 24,
+                            include_centroid: bool = False) -> List[Dict[str, Any]]:
         """
         Get recent clusters with their summaries.
         
         Args:
             limit: Maximum number of clusters
             hours: How many hours back to look
+            include_centroid: Whether to return cluster centroids (None otherwise)
             
         Returns:
-            List of cluster data with summaries
+            List of flat cluster rows with their latest summary fields
         """
         try:
-            # Calculate the timestamp for filtering
-            from datetime import datetime, timedelta
-            cutoff_time = (datetime.utcnow() - timedelta(hours=hours)).isoformat()
-            
-            # Get clusters with left join to summaries
-            result = self.client.table('content_clusters').select(
-                '''
-                id, centroid, metadata, chunk_count, created_at, updated_at,
-                cluster_summaries(summary, key_points, confidence, model_used)
-                '''
-            ).gte('created_at', cutoff_time).order('updated_at', desc=True).limit(limit).execute()
+            # Filter and summary join run server-side in one query
+            result = self.client.rpc(
+                'get_recent_clusters_with_summaries',
+                {
+                    'hours_back': hours,
+                    'limit_count': limit,
+                    'include_centroid': include_centroid
+                }
+            ).execute()
             
             return result.data if result.data else []
             
@@ -497,7 +951,6 @@ class SupabaseManager:
         """
         try:
             # Calculate cutoff timestamp
-            from datetime import datetime, timedelta
             cutoff_time = (datetime.utcnow() - timedelta(days=days)).isoformat()
             
             # Delete old chunks
@@ -506,6 +959,7 @@ class SupabaseManager:
             # Delete old clusters
             clusters_result = self.client.table('content_clusters').delete().lt('created_at', cutoff_time).execute()
             
+            self.similarity_cache.clear()
             logger.info(f"Cleaned up data older than {days} days")
             
         except Exception as e:
@@ -519,3 +973,477 @@ class SupabaseManager:
     def __del__(self):
         """Cleanup on destruction."""
         self.close()
+
+
+class AsyncSupabaseManager:
+    """
+    Asynchronous Supabase manager talking to PostgREST directly over httpx.
+    
+    Features:
+    - One long-lived pooled httpx.AsyncClient (keep-alive, HTTP/2 when available)
+    - Same tables and database functions as SupabaseManager
+    - Coroutine API so concurrent callers overlap network latency
+    """
+    
+    # Maximum chunk IDs sent in one assign_cluster call, to stay under request size limits
+    ASSIGN_BATCH_SIZE = SupabaseManager.ASSIGN_BATCH_SIZE
+    
+    # Rows per chunk upsert request, and how many of those requests may run at once
+    INSERT_BATCH_SIZE = SupabaseManager.INSERT_BATCH_SIZE
+    MAX_CONCURRENT_UPSERTS = 4
+    
+    def __init__(self, supabase_url: str, supabase_key: str, vector_dimension: int = 384,
+                 max_connections: int = 20, max_keepalive_connections: int = 10,
+                 timeout: float = 30.0, target_dimension: Optional[int] = None):
+        """
+        Initialize async Supabase manager.
+        
+        Args:
+            supabase_url: Supabase project URL
+            supabase_key: Supabase API key (anon or service role)
+            vector_dimension: Vector dimension for embeddings
+            max_connections: Maximum open connections in the pool
+            max_keepalive_connections: Maximum idle connections kept alive
+            timeout: Request timeout in seconds
+            target_dimension: Store PCA-reduced vectors of this size (None keeps full embeddings);
+                requires a projection stored with fit_projection()
+        """
+        if not HTTPX_AVAILABLE:
+            raise ImportError("httpx is required for async Supabase operations. Install with: pip install httpx")
+        
+        if not supabase_url or not supabase_key:
+            raise ValueError("Both supabase_url and supabase_key are required")
+        
+        if target_dimension is not None and not 0 < target_dimension < vector_dimension:
+            raise ValueError(f"target_dimension must be between 1 and {vector_dimension - 1}")
+        
+        self.base_url = f"{supabase_url.rstrip('/')}/rest/v1"
+        self.embedding_dimension = vector_dimension
+        self.target_dimension = target_dimension
+        self.vector_dimension = target_dimension or vector_dimension
+        self._projector: Optional[EmbeddingProjector] = None
+        self._projector_lock: Optional[asyncio.Lock] = None
+        self._headers = {
+            'apikey': supabase_key,
+            'Authorization': f"Bearer {supabase_key}"
+        }
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections
+        )
+        self._timeout = timeout
+        self._client: Optional["httpx.AsyncClient"] = None
+        self.similarity_cache = SimilarityQueryCache()
+        
+        logger.info("AsyncSupabaseManager initialized successfully")
+    
+    def _get_client(self) -> "httpx.AsyncClient":
+        """Return the shared HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self._headers,
+                limits=self._limits,
+                timeout=self._timeout,
+                http2=HTTP2_AVAILABLE
+            )
+        return self._client
+    
+    async def _request(self, method: str, path: str, params: Optional[Dict[str, Any]] = None,
+                       json_body: Any = None, prefer: Optional[str] = None) -> Any:
+        """
+        Send a PostgREST request and decode the JSON response.
+        
+        Args:
+            method: HTTP method
+            path: Path relative to /rest/v1 (e.g. "content_chunks" or "rpc/match_chunks")
+            params: Query string parameters
+            json_body: JSON request body
+            prefer: Value for PostgREST's Prefer header
+            
+        Returns:
+            Decoded response body, or None for empty responses
+        """
+        headers = {'Prefer': prefer} if prefer else None
+        response = await self._get_client().request(
+            method, path, params=params, json=json_body, headers=headers
+        )
+        response.raise_for_status()
+        if not response.content:
+            return None
+        return response.json()
+    
+    async def _upsert(self, table: str, rows: Any) -> Any:
+        """Upsert one row or a list of rows, returning the stored representation."""
+        return await self._request(
+            'POST', table, json_body=rows,
+            prefer='resolution=merge-duplicates,return=representation'
+        )
+    
+    async def _rpc(self, function: str, args: Dict[str, Any]) -> Any:
+        """Call a database function."""
+        return await self._request('POST', f"rpc/{function}", json_body=args)
+    
+    async def fit_projection(self, sample) -> EmbeddingProjector:
+        """
+        Fit the embedding projection on a sample and store it for all writers and readers.
+        
+        Run once as a setup step before inserting when target_dimension is set.
+        Refitting replaces the stored projection, so vectors already stored
+        with the old one must be re-inserted.
+        
+        Args:
+            sample: Embeddings to fit on, at least target_dimension of them
+            
+        Returns:
+            The fitted projector
+        """
+        if self.target_dimension is None:
+            raise ValueError("fit_projection requires target_dimension to be set")
+        
+        projector = EmbeddingProjector.fit(np.vstack(sample), self.target_dimension)
+        await self._upsert('model_config', {
+            'name': _PROJECTION_CONFIG_NAME,
+            'config': projector.to_dict()
+        })
+        self._projector = projector
+        
+        self.similarity_cache.clear()
+        logger.info(f"Fitted {self.target_dimension}-dimension embedding projection "
+                    f"on {len(sample)} embeddings")
+        return projector
+    
+    async def _get_projector(self) -> Optional[EmbeddingProjector]:
+        """
+        Load the stored embedding projection.
+        
+        Returns:
+            The projector, or None when dimension reduction is off
+            
+        Raises:
+            ValueError: If dimension reduction is on but no projection has been fitted
+        """
+        if self.target_dimension is None or self._projector is not None:
+            return self._projector
+        
+        if self._projector_lock is None:
+            self._projector_lock = asyncio.Lock()
+        
+        async with self._projector_lock:
+            if self._projector is None:
+                rows = await self._request('GET', 'model_config', params={
+                    'select': 'config',
+                    'name': f"eq.{_PROJECTION_CONFIG_NAME}",
+                    'limit': 1
+                })
+                
+                if not rows:
+                    raise _missing_projection_error(self.target_dimension)
+                self._projector = EmbeddingProjector.from_dict(rows[0]['config'])
+            
+            return self._projector
+    
+    async def insert_chunk(self, chunk: ContentChunk) -> str:
+        """
+        Insert a content chunk into the database.
+        
+        Args:
+            chunk: ContentChunk to insert
+            
+        Returns:
+            ID of the inserted chunk
+        """
+        try:
+            projector = await self._get_projector()
+            data = _chunk_rows([chunk], projector)[0]
+            result = await self._upsert('content_chunks', data)
+            
+            if result:
+                self.similarity_cache.clear()
+                logger.debug(f"Successfully inserted chunk {data['id']}")
+                return data['id']
+            else:
+                raise Exception("No data returned from insert operation")
+            
+        except Exception as e:
+            logger.error(f"Failed to insert chunk: {e}")
+            raise
+    
+    async def insert_chunks_batch(self, chunks: List[ContentChunk]) -> List[str]:
+        """
+        Insert multiple chunks efficiently.
+        
+        Args:
+            chunks: List of ContentChunk objects
+            
+        Returns:
+            List of inserted chunk IDs
+        """
+        if not chunks:
+            return []
+        
+        try:
+            projector = await self._get_projector()
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_UPSERTS)
+            
+            async def upsert_batch(batch: List[ContentChunk]) -> List[str]:
+                async with semaphore:
+                    batch_data = _chunk_rows(batch, projector)
+                    if not await self._upsert('content_chunks', batch_data):
+                        raise Exception("No data returned from batch insert operation")
+                    self.similarity_cache.clear()
+                    return [data['id'] for data in batch_data]
+            
+            batch_ids = await asyncio.gather(*(
+                upsert_batch(chunks[start:start + self.INSERT_BATCH_SIZE])
+                for start in range(0, len(chunks), self.INSERT_BATCH_SIZE)
+            ))
+            chunk_ids = [chunk_id for ids in batch_ids for chunk_id in ids]
+            
+            logger.info(f"Successfully inserted {len(chunk_ids)} chunks")
+            return chunk_ids
+            
+        except Exception as e:
+            logger.error(f"Failed to insert chunks batch: {e}")
+            raise
+    
+    async def find_similar_chunks(self, embedding: List[float], threshold: float = 0.8,
+                                  limit: int = 10, exclude_ids: List[str] = None,
+                                  title_prefilter: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Find similar chunks using vector similarity search.
+        
+        Args:
+            embedding: Query embedding vector
+            threshold: Minimum similarity threshold
+            limit: Maximum number of results
+            exclude_ids: Chunk IDs to exclude from results
+            title_prefilter: Only consider chunks whose content contains words trigram-similar to this text
+            
+        Returns:
+            List of similar chunks with similarity scores
+        """
+        try:
+            cache_key = _similarity_cache_key(embedding, threshold, limit, exclude_ids, title_prefilter)
+            cached = self.similarity_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            # A write landing while the RPC runs makes its results stale
+            generation = self.similarity_cache.generation
+            
+            query_embedding = embedding
+            if self.target_dimension is not None:
+                query_embedding = (await self._get_projector()).transform(embedding)
+            
+            params = {
+                'query_embedding': _vector_to_list(query_embedding),
+                'similarity_threshold': threshold,
+                'match_count': limit,
+                'exclude_ids': exclude_ids or []
+            }
+            if title_prefilter:
+                params['title_prefilter'] = title_prefilter
+            
+            result = await self._rpc('match_chunks', params)
+            matches = result or []
+            self.similarity_cache.set(cache_key, matches, generation)
+            return matches
+            
+        except Exception as e:
+            logger.error(f"Failed to find similar chunks: {e}")
+            return []
+    
+    async def get_recent_chunks_from_db(self, hours: int = 24, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Get recent chunks from database for duplicate checking.
+        
+        Args:
+            hours: How many hours back to look
+            limit: Maximum number of chunks to return
+            
+        Returns:
+            List of recent chunk data
+        """
+        try:
+            result = await self._rpc(
+                'get_recent_chunks',
+                {
+                    'hours_back': hours,
+                    'limit_count': limit
+                }
+            )
+            return result or []
+            
+        except Exception as e:
+            logger.error(f"Failed to get recent chunks: {e}")
+            return []
+    
+    async def insert_cluster(self, cluster: ContentCluster) -> str:
+        """
+        Insert a content cluster into the database.
+        
+        Args:
+            cluster: ContentCluster to insert
+            
+        Returns:
+            ID of the inserted cluster
+        """
+        try:
+            projector = await self._get_projector()
+            data = _cluster_row(cluster, projector)
+            result = await self._upsert('content_clusters', data)
+            
+            if result:
+                logger.debug(f"Successfully inserted cluster {data['id']}")
+                return data['id']
+            else:
+                raise Exception("No data returned from insert operation")
+            
+        except Exception as e:
+            logger.error(f"Failed to insert cluster: {e}")
+            raise
+    
+    async def update_chunk_cluster_assignment(self, chunk_ids: List[str], cluster_id: str):
+        """
+        Update cluster assignment for multiple chunks.
+        
+        Args:
+            chunk_ids: List of chunk IDs to update
+            cluster_id: New cluster ID
+        """
+        if not chunk_ids:
+            return
+        
+        try:
+            batches = [chunk_ids[start:start + self.ASSIGN_BATCH_SIZE]
+                       for start in range(0, len(chunk_ids), self.ASSIGN_BATCH_SIZE)]
+            results = await asyncio.gather(*(
+                self._rpc('assign_cluster', {'chunk_ids': batch, 'new_cluster_id': cluster_id})
+                for batch in batches
+            ))
+            updated = sum(result or 0 for result in results)
+            
+            if updated < len(chunk_ids):
+                logger.warning(f"Only {updated} of {len(chunk_ids)} chunks found for cluster {cluster_id}")
+            
+            self.similarity_cache.clear()
+            logger.info(f"Updated {len(chunk_ids)} chunks with cluster {cluster_id}")
+            
+        except Exception as e:
+            logger.error(f"Failed to update chunk cluster assignments: {e}")
+            raise
+    
+    async def get_chunks_by_cluster(self, cluster_id: str,
+                                    include_embedding: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get all chunks belonging to a cluster.
+        
+        Args:
+            cluster_id: Cluster ID
+            include_embedding: Whether to also return each chunk's embedding
+            
+        Returns:
+            List of chunk data
+        """
+        try:
+            columns = _CLUSTER_CHUNK_COLUMNS
+            if include_embedding:
+                columns += ', embedding'
+            
+            result = await self._request('GET', 'content_chunks', params={
+                'select': columns.replace(' ', ''),
+                'cluster_id': f"eq.{cluster_id}",
+                'order': 'created_at.desc'
+            })
+            return result or []
+            
+        except Exception as e:
+            logger.error(f"Failed to get chunks by cluster: {e}")
+            return []
+    
+    async def insert_cluster_summary(self, summary: ClusterSummary) -> str:
+        """
+        Insert a cluster summary into the database.
+        
+        Args:
+            summary: ClusterSummary to insert
+            
+        Returns:
+            ID of the inserted summary
+        """
+        try:
+            data = _summary_row(summary)
+            result = await self._upsert('cluster_summaries', data)
+            
+            if result:
+                logger.debug(f"Successfully inserted cluster summary {data['id']}")
+                return data['id']
+            else:
+                raise Exception("No data returned from insert operation")
+            
+        except Exception as e:
+            logger.error(f"Failed to insert cluster summary: {e}")
+            raise
+    
+    async def get_recent_clusters(self, limit: int = 10, hours: int = 24,
+                                  include_centroid: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get recent clusters with their summaries.
+        
+        Args:
+            limit: Maximum number of clusters
+            hours: How many hours back to look
+            include_centroid: Whether to return cluster centroids (None otherwise)
+            
+        Returns:
+            List of flat cluster rows with their latest summary fields
+        """
+        try:
+            result = await self._rpc(
+                'get_recent_clusters_with_summaries',
+                {
+                    'hours_back': hours,
+                    'limit_count': limit,
+                    'include_centroid': include_centroid
+                }
+            )
+            return result or []
+            
+        except Exception as e:
+            logger.error(f"Failed to get recent clusters: {e}")
+            return []
+    
+    async def cleanup_old_data(self, days: int = 30):
+        """
+        Clean up old data from the database.
+        
+        Args:
+            days: Number of days to keep
+        """
+        try:
+            cutoff_time = (datetime.utcnow() - timedelta(days=days)).isoformat()
+            params = {'created_at': f"lt.{cutoff_time}"}
+            
+            await asyncio.gather(
+                self._request('DELETE', 'content_chunks', params=params),
+                self._request('DELETE', 'content_clusters', params=params)
+            )
+            
+            self.similarity_cache.clear()
+            logger.info(f"Cleaned up data older than {days} days")
+            
+        except Exception as e:
+            logger.error(f"Failed to cleanup old data: {e}")
+    
+    async def close(self):
+        """Close the shared HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        logger.info("AsyncSupabaseManager closed")
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
@@ -1,15 +1,34 @@
 -- Supabase Database Schema for News Aggregator
 -- Run this SQL in your Supabase SQL editor to set up the required tables and functions
 
--- Enable pgvector extension
+-- Enable pgvector extension (0.7+ for halfvec)
 CREATE EXTENSION IF NOT EXISTS vector;
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Vector columns below are 384-dimensional (all-MiniLM-L6-v2). With
+-- SupabaseConfig.target_dimension set, replace 384 with that dimension;
+-- the fitted PCA projection is stored in model_config.
+
+-- Upgrading a database created with vector(384) columns: drop the old
+-- indexes and convert the columns before running the rest of this file.
+-- DROP INDEX IF EXISTS idx_chunks_embedding;
+-- DROP INDEX IF EXISTS idx_clusters_centroid;
+-- ALTER TABLE content_chunks ALTER COLUMN embedding TYPE halfvec(384) USING embedding::halfvec(384);
+-- ALTER TABLE content_clusters ALTER COLUMN centroid TYPE halfvec(384) USING centroid::halfvec(384);
+
+-- Remove earlier overloads of the search functions so PostgREST
+-- resolves RPC calls to the versions below
+DROP FUNCTION IF EXISTS match_chunks(vector, float, int, uuid[]);
+DROP FUNCTION IF EXISTS match_chunks(halfvec, float, int, uuid[], int);
+DROP FUNCTION IF EXISTS match_clusters(vector, float, int);
+DROP FUNCTION IF EXISTS get_recent_chunks(int, int);
 
 -- Create content_chunks table
 CREATE TABLE IF NOT EXISTS content_chunks (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     content TEXT NOT NULL,
     processed_content TEXT,
-    embedding vector(384),
+    embedding halfvec(384),
     metadata JSONB NOT NULL,
     cluster_id UUID,
     created_at TIMESTAMP DEFAULT NOW(),
@@ -19,7 +38,7 @@ CREATE TABLE IF NOT EXISTS content_chunks (
 -- Create content_clusters table
 CREATE TABLE IF NOT EXISTS content_clusters (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-    centroid vector(384),
+    centroid halfvec(384),
     metadata JSONB NOT NULL,
     chunk_count INTEGER DEFAULT 0,
     created_at TIMESTAMP DEFAULT NOW(),
@@ -39,14 +58,23 @@ CREATE TABLE IF NOT EXISTS cluster_summaries (
     word_count INTEGER DEFAULT 0
 );
 
+-- Create model_config table (persisted embedding projection, etc.)
+CREATE TABLE IF NOT EXISTS model_config (
+    name TEXT PRIMARY KEY,
+    config JSONB NOT NULL,
+    updated_at TIMESTAMP DEFAULT NOW()
+);
+
 -- Create indexes for vector similarity search
+-- HNSW parameters suit tables under 100k rows; SupabaseManager.create_schema
+-- prints values sized to the current table, or ivfflat if configured
 CREATE INDEX IF NOT EXISTS idx_chunks_embedding ON content_chunks 
-USING ivfflat (embedding vector_cosine_ops) 
-WITH (lists = 100);
+USING hnsw (embedding halfvec_cosine_ops) 
+WITH (m = 16, ef_construction = 64);
 
 CREATE INDEX IF NOT EXISTS idx_clusters_centroid ON content_clusters 
-USING ivfflat (centroid vector_cosine_ops)
-WITH (lists = 100);
+USING hnsw (centroid halfvec_cosine_ops)
+WITH (m = 16, ef_construction = 64);
 
 -- Create other useful indexes
 CREATE INDEX IF NOT EXISTS idx_chunks_cluster_id ON content_chunks(cluster_id);
@@ -62,9 +90,15 @@ USING GIN ((metadata->>'topic'));
 CREATE INDEX IF NOT EXISTS idx_chunks_metadata_source ON content_chunks 
 USING GIN ((metadata->>'source'));
 
--- Function for vector similarity search
+-- Trigram index for lexical prefiltering of near-duplicates
+CREATE INDEX IF NOT EXISTS idx_chunks_content_trgm ON content_chunks 
+USING GIN (content gin_trgm_ops);
+
+-- Function for vector similarity search. Plain SQL so the planner can inline
+-- it and use the vector index for the ORDER BY; the threshold is applied as
+-- a distance bound
 CREATE OR REPLACE FUNCTION match_chunks (
-    query_embedding vector(384),
+    query_embedding halfvec(384),
     similarity_threshold float DEFAULT 0.8,
     match_count int DEFAULT 10,
     exclude_ids uuid[] DEFAULT '{}'
@@ -77,10 +111,8 @@ RETURNS TABLE (
     cluster_id uuid,
     similarity float
 )
-LANGUAGE plpgsql
+LANGUAGE sql STABLE PARALLEL SAFE
 AS $$
-BEGIN
-    RETURN QUERY
     SELECT
         content_chunks.id,
         content_chunks.content,
@@ -91,9 +123,115 @@ BEGIN
     FROM content_chunks
     WHERE content_chunks.embedding IS NOT NULL
     AND content_chunks.id <> ALL(exclude_ids)
-    AND 1 - (content_chunks.embedding <=> query_embedding) >= similarity_threshold
+    AND (content_chunks.embedding <=> query_embedding) <= 1 - similarity_threshold
     ORDER BY content_chunks.embedding <=> query_embedding
     LIMIT match_count;
+$$;
+
+-- Variant of match_chunks that first narrows candidates to chunks whose
+-- content contains a stretch word-similar to title_prefilter (pg_trgm <%).
+-- Plain similarity (%) compares against the whole content and never reaches
+-- the threshold for a short title; <% is served by the gin_trgm_ops index.
+CREATE OR REPLACE FUNCTION match_chunks (
+    query_embedding halfvec(384),
+    title_prefilter text,
+    similarity_threshold float DEFAULT 0.8,
+    match_count int DEFAULT 10,
+    exclude_ids uuid[] DEFAULT '{}'
+)
+RETURNS TABLE (
+    id uuid,
+    content text,
+    processed_content text,
+    metadata jsonb,
+    cluster_id uuid,
+    similarity float
+)
+LANGUAGE sql STABLE PARALLEL SAFE
+AS $$
+    SELECT
+        content_chunks.id,
+        content_chunks.content,
+        content_chunks.processed_content,
+        content_chunks.metadata,
+        content_chunks.cluster_id,
+        1 - (content_chunks.embedding <=> query_embedding) as similarity
+    FROM content_chunks
+    WHERE title_prefilter <% content_chunks.content
+    AND content_chunks.embedding IS NOT NULL
+    AND content_chunks.id <> ALL(exclude_ids)
+    AND (content_chunks.embedding <=> query_embedding) <= 1 - similarity_threshold
+    ORDER BY content_chunks.embedding <=> query_embedding
+    LIMIT match_count;
+$$;
+
+-- Function to assign many chunks to a cluster in one call
+CREATE OR REPLACE FUNCTION assign_cluster (
+    chunk_ids uuid[],
+    new_cluster_id uuid
+)
+RETURNS integer
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    updated_count integer;
+BEGIN
+    UPDATE content_chunks
+    SET cluster_id = new_cluster_id, updated_at = NOW()
+    WHERE id = ANY(chunk_ids);
+    GET DIAGNOSTICS updated_count = ROW_COUNT;
+    RETURN updated_count;
+END;
+$$;
+
+-- Function to get recent clusters with their latest summary in one query
+CREATE OR REPLACE FUNCTION get_recent_clusters_with_summaries (
+    hours_back int DEFAULT 24,
+    limit_count int DEFAULT 10,
+    include_centroid boolean DEFAULT false
+)
+RETURNS TABLE (
+    id uuid,
+    centroid halfvec(384),
+    metadata jsonb,
+    chunk_count integer,
+    created_at timestamp,
+    updated_at timestamp,
+    summary text,
+    key_points jsonb,
+    confidence float,
+    model_used varchar
+)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    RETURN QUERY
+    SELECT
+        content_clusters.id,
+        CASE WHEN include_centroid THEN content_clusters.centroid END,
+        content_clusters.metadata,
+        content_clusters.chunk_count,
+        content_clusters.created_at,
+        content_clusters.updated_at,
+        latest.summary,
+        latest.key_points,
+        latest.confidence,
+        latest.model_used
+    FROM content_clusters
+    LEFT JOIN LATERAL (
+        SELECT
+            cluster_summaries.summary,
+            cluster_summaries.key_points,
+            cluster_summaries.confidence,
+            cluster_summaries.model_used
+        FROM cluster_summaries
+        WHERE cluster_summaries.cluster_id = content_clusters.id
+        ORDER BY cluster_summaries.generated_at DESC
+        LIMIT 1
+    ) latest ON true
+    WHERE content_clusters.created_at >= NOW() - INTERVAL '1 hour' * hours_back
+    ORDER BY content_clusters.updated_at DESC
+    LIMIT limit_count;
 END;
 $$;
 
@@ -106,7 +244,7 @@ RETURNS TABLE (
     id uuid,
     content text,
     processed_content text,
-    embedding vector(384),
+    embedding halfvec(384),
     metadata jsonb,
     cluster_id uuid,
     created_at timestamp
@@ -133,13 +271,13 @@ $$;
 
 -- Function to find similar clusters
 CREATE OR REPLACE FUNCTION match_clusters (
-    query_embedding vector(384),
+    query_embedding halfvec(384),
     similarity_threshold float DEFAULT 0.7,
     match_count int DEFAULT 5
 )
 RETURNS TABLE (
     id uuid,
-    centroid vector(384),
+    centroid halfvec(384),
     metadata jsonb,
     chunk_count integer,
     similarity float
@@ -0,0 +1,123 @@
+from unittest.mock import Mock, patch
+
+import numpy as np
+
+from news_agent.aggregator import embeddings as embeddings_module
+from news_agent.aggregator.config import EmbeddingConfig
+from news_agent.aggregator.embeddings import EmbeddingCache, EmbeddingManager
+
+
+def fake_encode(texts, normalize_embeddings=True, **kwargs):
+    single = isinstance(texts, str)
+    rows = np.array([[len(text) % 7 + 1, text.count("a") + 1, 1.0]
+                     for text in ([texts] if single else texts)], dtype=np.float32)
+    if normalize_embeddings:
+        rows /= np.linalg.norm(rows, axis=1, keepdims=True)
+    return rows[0] if single else rows
+
+
+def fake_simsimd_cosine(a, b):
+    # Mirrors SimSIMD: two zero vectors are at distance 0, one zero vector at distance 1
+    dot, norms = float(np.dot(a, b)), float(np.linalg.norm(a) * np.linalg.norm(b))
+    if norms == 0.0:
+        return 0.0 if not a.any() and not b.any() else 1.0
+    return 1.0 - dot / norms
+
+
+def get_fake_simsimd():
+    simsimd = Mock()
+    simsimd.cosine.side_effect = fake_simsimd_cosine
+    simsimd.cdist.side_effect = lambda a, b, metric: np.array(
+        [[fake_simsimd_cosine(x, y) for y in b] for x in a])
+    return simsimd
+
+
+def get_embedding_manager(cache_dir, **overrides):
+    model = Mock()
+    model.encode.side_effect = fake_encode
+    model.get_sentence_embedding_dimension.return_value = 3
+    config = EmbeddingConfig(device="cpu", cache_dir=str(cache_dir), **overrides)
+    with patch.object(embeddings_module, "SentenceTransformer", return_value=model):
+        manager = EmbeddingManager(config)
+    return manager, model
+
+
+def test_cache_get_many_set_many_round_trip(tmp_path):
+    rng = np.random.default_rng(0)
+    items = [(f"text {i}", rng.standard_normal(8).astype(np.float32)) for i in range(3)]
+    
+    with EmbeddingCache(str(tmp_path)) as cache:
+        cache.set_many(items, "model-a")
+        found = cache.get_many(["text 0", "text 2", "text 0", "missing"], "model-a")
+        
+        assert set(found) == {"text 0", "text 2"}
+        for text, vector in (items[0], items[2]):
+            # int8 quantization keeps every component within one quantization step
+            assert np.allclose(found[text], vector, atol=np.abs(vector).max() / 127)
+        # Entries are partitioned by model name
+        assert cache.get_many(["text 0"], "model-b") == {}
+
+
+def test_cache_get_many_spans_several_queries(tmp_path):
+    texts = [f"text {i}" for i in range(EmbeddingCache.MAX_QUERY_PARAMS * 2 + 7)]
+    
+    with EmbeddingCache(str(tmp_path)) as cache:
+        cache.set_many([(text, np.full(4, i + 1, dtype=np.float32)) for i, text in enumerate(texts)], "m")
+        found = cache.get_many(texts, "m")
+    
+    assert len(found) == len(texts)
+    assert np.allclose(found[texts[-1]], len(texts))
+
+
+def test_cache_round_trip_survives_reopen(tmp_path):
+    vector = np.array([0.5, -0.25, 1.0], dtype=np.float32)
+    with EmbeddingCache(str(tmp_path)) as cache:
+        cache.set_many([("persisted", vector)], "m")
+    
+    with EmbeddingCache(str(tmp_path)) as cache:
+        assert np.allclose(cache.get_many(["persisted"], "m")["persisted"], vector, atol=1 / 127)
+
+
+def test_encode_batch_only_embeds_uncached_texts(tmp_path):
+    manager, model = get_embedding_manager(tmp_path)
+    expected = manager.encode_batch_as_matrix(["alpha", "beta"])
+    model.encode.reset_mock()
+    
+    matrix = manager.encode_batch_as_matrix(["alpha", "gamma", "beta", "gamma"])
+    
+    # Only the one new distinct text reaches the model
+    assert model.encode.call_count == 1
+    assert list(model.encode.call_args.args[0]) == ["gamma"]
+    assert np.allclose(matrix[[0, 2]], expected, atol=0.02)
+    assert np.allclose(matrix[1], matrix[3])
+    assert np.allclose(np.linalg.norm(matrix, axis=1), 1.0)
+    manager.close()
+
+
+def test_encode_batch_keeps_embeddings_when_cache_write_fails(tmp_path):
+    manager, _ = get_embedding_manager(tmp_path)
+    manager.cache.set_many = Mock(side_effect=RuntimeError("database is locked"))
+    
+    matrix = manager.encode_batch_as_matrix(["alpha", "beta"])
+    
+    assert np.allclose(matrix, fake_encode(["alpha", "beta"]))
+    manager.close()
+
+
+def test_simsimd_similarity_treats_zero_vectors_as_dissimilar(tmp_path):
+    manager, _ = get_embedding_manager(tmp_path, normalize_embeddings=False)
+    zero = manager._zero_vector()
+    vector = np.array([1.0, 2.0, 2.0], dtype=np.float32)
+    
+    with patch.object(embeddings_module, "SIMSIMD_AVAILABLE", True), \
+         patch.object(embeddings_module, "simsimd", get_fake_simsimd(), create=True):
+        assert manager.calculate_similarity(zero, zero.copy()) == 0.0
+        assert manager.calculate_similarity(zero, vector) == 0.0
+        assert np.isclose(manager.calculate_similarity(vector, vector * 2), 1.0)
+        
+        matrix = manager.calculate_similarity_matrix([zero, vector, zero.copy(), vector * 2])
+    
+    expected = np.zeros((4, 4))
+    expected[np.ix_([1, 3], [1, 3])] = 1.0
+    assert np.allclose(matrix, expected)
+    manager.close()
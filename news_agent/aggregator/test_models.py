@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from news_agent.aggregator.models import ChunkMetadata, ClusterMetadata, ContentChunk, ContentCluster, ReliabilityTier, SourceType
+
+
+def get_chunk(chunk_id, hours_ago=0, tier=ReliabilityTier.TIER_2):
+    metadata = ChunkMetadata(
+        timestamp=datetime(2024, 3, 7, 12) - timedelta(hours=hours_ago), source="Reuters",
+        url=f"https://example.com/{chunk_id}", title=f"Title {chunk_id}", topic="energy",
+        source_type=SourceType.GENERAL_NEWS, reliability_tier=tier, source_retriever="test"
+    )
+    return ContentChunk(id=chunk_id, content=f"Content {chunk_id}", metadata=metadata)
+
+
+def get_cluster(chunks):
+    return ContentCluster(id="cluster", chunks=chunks,
+                          metadata=ClusterMetadata(confidence_score=0.8, cluster_size=len(chunks)))
+
+
+def test_chunk_columns_rebuild_when_a_chunk_is_replaced_in_place():
+    cluster = get_cluster([get_chunk("a", hours_ago=2), get_chunk("b", hours_ago=5)])
+    assert cluster.chunk_sources == ("Reuters", "Reuters")
+    before = cluster.latest_timestamp_us
+    
+    # Same list object, same length
+    cluster.chunks[1] = get_chunk("c", hours_ago=0)
+    
+    assert cluster.titles_lower == ("title a", "title c")
+    assert cluster.latest_timestamp_us > before
+    assert cluster.timestamp_array[1] == np.datetime64(datetime(2024, 3, 7, 12), 'us')
+
+
+def test_chunk_columns_rebuild_for_a_new_list_of_the_same_length():
+    chunks = [get_chunk("a"), get_chunk("b")]
+    cluster = get_cluster(chunks)
+    assert cluster.titles_lower == ("title a", "title b")
+    
+    cluster.chunks = [get_chunk("c"), get_chunk("d")]
+    
+    assert cluster.titles_lower == ("title c", "title d")
+
+
+def test_clear_chunk_cache_picks_up_metadata_edits():
+    cluster = get_cluster([get_chunk("a", tier=ReliabilityTier.TIER_3)])
+    before = cluster.reliability_stats
+    
+    cluster.chunks[0].metadata.reliability_tier = ReliabilityTier.TIER_1
+    cluster.clear_chunk_cache()
+    
+    assert cluster.reliability_stats[0] > before[0]
+
+
+def test_topics_set_follows_reassigned_and_edited_topics():
+    metadata = ClusterMetadata(confidence_score=0.8, cluster_size=1, topics=['energy'])
+    assert metadata.topics_set == {'energy'}
+    
+    metadata.topics = ['macro']
+    metadata.topics = ['tech']
+    assert metadata.topics_set == {'tech'}
+    
+    metadata.topics[0] = 'rates'
+    assert metadata.topics_set == {'rates'}
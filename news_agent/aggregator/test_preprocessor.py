@@ -0,0 +1,122 @@
+import random
+import re
+from datetime import datetime
+
+from news_agent.aggregator.config import PreprocessingConfig
+from news_agent.aggregator.preprocessor import TextPreprocessor
+
+
+# Inputs where a fused single-pass substitution diverges from the sequential passes
+TRICKY_INPUTS = [
+    "follow us on copyright 2020 foo. bar.",
+    "Contact foo@www.example.com today",
+    "copyright 2021 see https://example.com/a.b and more",
+    "© 2020 call (555) 123-4567 now. Then read more",
+    "privacy home about contact policy",
+    "if you like us on facebook you can unsubscribe. ok",
+    "to unsubscribe email me@news.example.org.",
+    "this email was sent to +1 555.123.4567\nsecond line",
+    "copyright 2019 trailing newline\n",
+    "Advertisement: click here, ad free. Subscribe!",
+    "Résumé ad ١٢٣٤ copyright ٢٠٢٠ x.",
+    "terms\x1cof\x1cservice and privacy policy",
+    "HTTP://EXAMPLE.COM and http://example.com",
+    "",
+]
+
+TOKENS = [
+    "copyright 2021", "© 2020", "to unsubscribe", "this email was sent", "if you",
+    "unsubscribe", "follow us on", "home about contact", "privacy policy", "privacy",
+    "policy", "terms of service", "like us on facebook", "share tweet email", "ad",
+    "click here", "read more", "subscribe", "http://a.com/x.y", "foo@bar.com",
+    "me@www.example.org", "(555) 123-4567", "+1 555.123.4567", "5551234567",
+    ".", "\n", "é", "word", "AAPL", "2024",
+]
+
+
+def get_preprocessor(**overrides):
+    return TextPreprocessor(PreprocessingConfig(remove_html=False, **overrides))
+
+
+def sequential_clean(preprocessor, text):
+    """The original one-pattern-at-a-time cleaning pipeline."""
+    config = preprocessor.config
+    if config.remove_urls:
+        text = preprocessor.url_pattern.sub(' ', text)
+    if config.remove_email:
+        text = preprocessor.email_pattern.sub(' ', text)
+    if config.remove_phone:
+        text = preprocessor.phone_pattern.sub(' ', text)
+    if config.remove_boilerplate:
+        for pattern in preprocessor.boilerplate_patterns + preprocessor.noise_patterns:
+            text = pattern.sub(' ', text)
+    if config.normalize_whitespace:
+        text = re.sub(r'\s+', ' ', text).strip()
+    return text
+
+
+def random_inputs(count, seed=0):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield ''.join(
+            rng.choice(TOKENS) + rng.choice(['', ' ', '  ', '.'])
+            for _ in range(rng.randint(0, 12))
+        )
+
+
+def test_clean_content_matches_sequential_passes_on_tricky_inputs():
+    preprocessor = get_preprocessor()
+    for text in TRICKY_INPUTS:
+        assert preprocessor.clean_content(text) == sequential_clean(preprocessor, text), repr(text)
+
+
+def test_clean_content_matches_sequential_passes_for_each_config():
+    for overrides in [{}, {'remove_urls': False}, {'remove_email': False},
+                      {'remove_phone': False}, {'remove_boilerplate': False},
+                      {'normalize_whitespace': False}]:
+        preprocessor = get_preprocessor(**overrides)
+        for text in random_inputs(500):
+            assert preprocessor.clean_content(text) == sequential_clean(preprocessor, text), (overrides, repr(text))
+
+
+def test_remove_boilerplate_matches_sequential_passes():
+    preprocessor = get_preprocessor()
+    for text in TRICKY_INPUTS + list(random_inputs(500, seed=1)):
+        expected = text
+        for pattern in preprocessor.boilerplate_patterns + preprocessor.noise_patterns:
+            expected = pattern.sub(' ', expected)
+        assert preprocessor.remove_boilerplate(text) == expected, repr(text)
+
+
+def test_clean_content_ascii_text_matches_sequential_passes():
+    # ASCII input takes the bytes patterns unless it holds \x1c-\x1f
+    ascii_tokens = [token for token in TOKENS if token.isascii()]
+    separators = ['', ' ', '\t', '\x0b', '\x1c', '\x1f', '\r\n']
+    preprocessor = get_preprocessor()
+    rng = random.Random(2)
+    for _ in range(2000):
+        text = ''.join(rng.choice(ascii_tokens) + rng.choice(separators) for _ in range(rng.randint(1, 10)))
+        assert preprocessor.clean_content(text) == sequential_clean(preprocessor, text), repr(text)
+
+
+def test_clean_content_leaves_clean_text_untouched():
+    preprocessor = get_preprocessor(normalize_whitespace=False)
+    text = "Apple shares rose 3% after quarterly earnings beat estimates."
+    assert preprocessor.clean_content(text) == text
+
+
+def test_planner_timestamps_match_strptime_layouts():
+    preprocessor = get_preprocessor(language_detection=False)
+    cases = {
+        "2024-01-05": datetime(2024, 1, 5),
+        "2024-1-5": datetime(2024, 1, 5),
+        "2024-03-07T09:15:30": datetime(2024, 3, 7, 9, 15, 30),
+        "2024-3-7 9:5:3": datetime(2024, 3, 7, 9, 5, 3),
+        "2024-03-07T09:15:30.123456+00:00": datetime(2024, 3, 7, 9, 15, 30),
+    }
+    for date_str, expected in cases.items():
+        item = {"title": "Oil prices rise", "url": "https://www.reuters.com/markets/oil",
+                "description": "Oil prices rose sharply on Tuesday after producers cut output.",
+                "published_date": date_str}
+        chunk = preprocessor.process_planner_result_item(item, "financial_news")
+        assert chunk.metadata.timestamp == expected, date_str
@@ -0,0 +1,303 @@
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock, patch
+
+import numpy as np
+
+from news_agent.aggregator import summarizer as summarizer_module
+from news_agent.aggregator.config import SummarizerConfig
+from news_agent.aggregator.models import ChunkMetadata, ClusterMetadata, ContentChunk, ContentCluster, ReliabilityTier, SourceType
+from news_agent.aggregator.summarizer import GeminiSummarizer, SemanticSummaryCache
+
+
+SUMMARY_JSON = json.dumps({
+    "summary": "Oil prices rose after producers announced deeper output cuts.",
+    "key_points": ["Producers cut output", "Prices rose"],
+})
+
+
+def get_mock_model(text=SUMMARY_JSON):
+    model = Mock()
+    model.generate_content.return_value = Mock(text=text)
+    return model
+
+
+def get_summarizer(model, embedding_fn=None, **overrides):
+    config = SummarizerConfig(api_key="test-key", retry_attempts=1, **overrides)
+    with patch.object(summarizer_module, "genai"), \
+         patch.object(summarizer_module, "_get_model", return_value=model):
+        return GeminiSummarizer(config, embedding_fn=embedding_fn)
+
+
+def get_fingerprint_embedding(text):
+    # Oil stories and bank stories land on orthogonal axes
+    if "Oil" in text:
+        return np.array([1.0, 0.1, 0.0], dtype=np.float32)
+    return np.array([0.0, 0.1, 1.0], dtype=np.float32)
+
+
+def get_cluster(cluster_id, titles=("Oil prices rise", "OPEC cuts output"), content_suffix=""):
+    chunks = []
+    for i, title in enumerate(titles):
+        metadata = ChunkMetadata(
+            timestamp=datetime.utcnow() - timedelta(hours=i), source="Reuters",
+            url=f"https://example.com/{cluster_id}/{i}", title=title, topic="energy",
+            source_type=SourceType.GENERAL_NEWS, reliability_tier=ReliabilityTier.TIER_2,
+            source_retriever="test"
+        )
+        chunks.append(ContentChunk(id=f"{cluster_id}-{i}", content=f"{title} body text{content_suffix}",
+                                   metadata=metadata))
+    cluster_metadata = ClusterMetadata(confidence_score=0.8, cluster_size=len(chunks),
+                                       primary_ticker="XOM", topics=["energy"])
+    return ContentCluster(id=cluster_id, chunks=chunks, metadata=cluster_metadata)
+
+
+def test_exact_cache_hit_skips_the_model():
+    model = get_mock_model()
+    summarizer = get_summarizer(model)
+    
+    first = summarizer.summarize_cluster(get_cluster("a"))
+    second = summarizer.summarize_cluster(get_cluster("a"))
+    
+    assert model.generate_content.call_count == 1
+    assert second.summary == first.summary
+    assert second.key_points == first.key_points
+    assert second.key_points is not first.key_points
+    assert summarizer.stats == {"hits": 1, "misses": 1}
+
+
+def test_exact_cache_hit_is_rebound_to_the_requesting_cluster():
+    model = get_mock_model()
+    summarizer = get_summarizer(model)
+    
+    cluster = get_cluster("a")
+    summarizer.summarize_cluster(cluster)
+    # Same chunks under a different cluster object with a different id
+    rebound = ContentCluster(id="b", chunks=cluster.chunks, metadata=cluster.metadata)
+    summary = summarizer.summarize_cluster(rebound)
+    
+    assert model.generate_content.call_count == 1
+    assert summary.cluster_id == "b"
+
+
+def test_exact_cache_misses_when_content_changes():
+    model = get_mock_model()
+    summarizer = get_summarizer(model)
+    
+    summarizer.summarize_cluster(get_cluster("a"))
+    summarizer.summarize_cluster(get_cluster("a", content_suffix=" (updated)"))
+    
+    assert model.generate_content.call_count == 2
+    assert summarizer.stats == {"hits": 0, "misses": 2}
+
+
+def test_failed_summaries_are_not_cached():
+    model = get_mock_model()
+    model.generate_content.side_effect = RuntimeError("boom")
+    summarizer = get_summarizer(model)
+    
+    summarizer.summarize_cluster(get_cluster("a"))
+    model.generate_content.side_effect = None
+    summary = summarizer.summarize_cluster(get_cluster("a"))
+    
+    assert model.generate_content.call_count == 2
+    assert summary.summary.startswith("Oil prices rose")
+
+
+def test_cache_disabled_always_calls_the_model():
+    model = get_mock_model()
+    summarizer = get_summarizer(model, cache_enabled=False)
+    
+    summarizer.summarize_cluster(get_cluster("a"))
+    summarizer.summarize_cluster(get_cluster("a"))
+    
+    assert model.generate_content.call_count == 2
+
+
+def test_semantic_cache_hit_for_near_duplicate_cluster():
+    model = get_mock_model()
+    summarizer = get_summarizer(model, embedding_fn=get_fingerprint_embedding)
+    
+    first = summarizer.summarize_cluster(get_cluster("a"))
+    # Same story, different articles: exact miss, semantic hit
+    second = summarizer.summarize_cluster(get_cluster("b", content_suffix=" (syndicated)"))
+    
+    assert model.generate_content.call_count == 1
+    assert second.cluster_id == "b"
+    assert second.summary == first.summary
+    assert second.model_used == f"{first.model_used}+semcache"
+    assert second.confidence <= first.confidence
+    assert summarizer.stats == {"hits": 0, "misses": 2, "semantic_hits": 1, "semantic_misses": 1}
+
+
+def test_semantic_cache_miss_for_unrelated_cluster():
+    model = get_mock_model()
+    summarizer = get_summarizer(model, embedding_fn=get_fingerprint_embedding)
+    
+    summarizer.summarize_cluster(get_cluster("a"))
+    summarizer.summarize_cluster(get_cluster("b", titles=("Bank earnings beat", "Lenders raise guidance")))
+    
+    assert model.generate_content.call_count == 2
+    assert summarizer.stats["semantic_hits"] == 0
+
+
+def test_semantic_cache_tolerates_embedding_failures():
+    model = get_mock_model()
+    summarizer = get_summarizer(model, embedding_fn=Mock(side_effect=RuntimeError("no model")))
+    
+    summary = summarizer.summarize_cluster(get_cluster("a"))
+    
+    assert summary.summary.startswith("Oil prices rose")
+    assert len(summarizer._semantic_cache) == 0
+
+
+def test_fingerprint_embedding_is_serialized_across_threads():
+    in_flight = []
+    overlaps = []
+    
+    def get_slow_embedding(text):
+        in_flight.append(text)
+        overlaps.append(len(in_flight) > 1)
+        time.sleep(0.01)
+        in_flight.remove(text)
+        return get_fingerprint_embedding(text)
+    
+    summarizer = get_summarizer(get_mock_model(), embedding_fn=get_slow_embedding)
+    clusters = [get_cluster(str(i)) for i in range(5)]
+    
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        list(executor.map(summarizer._embed_fingerprint, clusters))
+    
+    assert len(overlaps) == 5
+    assert not any(overlaps)
+
+
+def test_semantic_summary_cache_threshold_and_eviction():
+    cache = SemanticSummaryCache(threshold=0.9, max_entries=2)
+    summaries = [Mock(name=f"summary-{i}") for i in range(3)]
+    cache.set(np.array([1.0, 0.0, 0.0]), summaries[0])
+    cache.set(np.array([0.0, 1.0, 0.0]), summaries[1])
+    cache.set(np.array([0.0, 0.0, 1.0]), summaries[2])
+    
+    assert len(cache) == 2
+    assert cache.get(np.array([1.0, 0.0, 0.0])) is None  # Evicted
+    match, similarity = cache.get(np.array([0.0, 0.2, 2.0]))
+    assert match is summaries[2]
+    assert similarity > 0.9
+    assert cache.get(np.array([0.0, 1.0, 1.0])) is None  # Below threshold
+    assert cache.get(np.array([1.0, 0.0])) is None  # Dimension mismatch
+
+
+def get_batch_model(batch_text):
+    # Multi-cluster requests carry their own generation_config; single requests don't
+    model = Mock()
+    def generate_content(input_text, **kwargs):
+        return Mock(text=batch_text if "generation_config" in kwargs else SUMMARY_JSON)
+    model.generate_content.side_effect = generate_content
+    return model
+
+
+def test_multi_cluster_prompt_sends_instructions_once():
+    summarizer = get_summarizer(get_mock_model())
+    clusters = [get_cluster("a"), get_cluster("b"), get_cluster("c")]
+    
+    prompt = summarizer._format_multi_cluster_prompt(clusters)
+    
+    assert prompt.startswith(summarizer_module._BATCH_PROMPT_HEADER)
+    assert prompt.count(summarizer_module._PROMPT_INSTRUCTIONS) == 1
+    assert prompt.count("ARTICLES:") == 3
+    assert prompt.index(summarizer_module._PROMPT_INSTRUCTIONS) < prompt.index("===CLUSTER id=a===")
+    # Single-cluster prompts keep their own copy
+    assert summarizer._build_prompt(clusters[0]).count(summarizer_module._PROMPT_INSTRUCTIONS) == 1
+
+
+def test_generate_batch_summaries_keeps_only_usable_items():
+    response = json.dumps([
+        {"cluster_id": "a", "summary": "Summary for a.", "key_points": ["Point a"]},
+        {"cluster_id": "b", "summary": "   ", "key_points": ["Blank summary"]},
+        {"cluster_id": "zzz", "summary": "Not requested.", "key_points": []},
+        "not an object",
+    ])
+    summarizer = get_summarizer(get_batch_model(response))
+    
+    with patch.object(summarizer_module, "genai"):
+        results = summarizer._generate_batch_summaries([get_cluster("a"), get_cluster("b")])
+    
+    assert results == {"a": ("Summary for a.", ["Point a"])}
+
+
+def test_generate_batch_summaries_rejects_malformed_responses():
+    for response in ["not json at all", json.dumps({"cluster_id": "a", "summary": "x"}), "API_ERROR: quota"]:
+        summarizer = get_summarizer(get_batch_model(response))
+        with patch.object(summarizer_module, "genai"):
+            assert summarizer._generate_batch_summaries([get_cluster("a"), get_cluster("b")]) == {}, response
+
+
+def test_generate_batch_summaries_needs_two_clusters():
+    model = get_batch_model("[]")
+    summarizer = get_summarizer(model)
+    
+    assert summarizer._generate_batch_summaries([get_cluster("a")]) == {}
+    assert model.generate_content.call_count == 0
+
+
+def test_summarize_clusters_batch_falls_back_for_missing_clusters():
+    response = json.dumps([{"cluster_id": "a", "summary": "Summary for a.", "key_points": ["Point a"]}])
+    model = get_batch_model(response)
+    summarizer = get_summarizer(model, batch_size=5)
+    clusters = [get_cluster("a"), get_cluster("b", titles=("Bank earnings beat", "Lenders raise guidance"))]
+    
+    with patch.object(summarizer_module, "genai"):
+        summaries = summarizer.summarize_clusters_batch(clusters)
+    
+    assert [summary.cluster_id for summary in summaries] == ["a", "b"]
+    assert summaries[0].summary == "Summary for a."
+    assert summaries[1].summary.startswith("Oil prices rose")
+    # One multi-cluster request, then one single request for the cluster it missed
+    assert model.generate_content.call_count == 2
+
+
+def test_summarize_clusters_batch_falls_back_on_malformed_batch():
+    model = get_batch_model("{truncated")
+    summarizer = get_summarizer(model, batch_size=5)
+    
+    with patch.object(summarizer_module, "genai"):
+        summaries = summarizer.summarize_clusters_batch([get_cluster("a"), get_cluster("b", content_suffix="!")])
+    
+    assert [summary.cluster_id for summary in summaries] == ["a", "b"]
+    assert all(summary.summary.startswith("Oil prices rose") for summary in summaries)
+    assert model.generate_content.call_count == 3
+
+
+def test_token_budget_only_counts_inputs_near_the_limit():
+    model = get_mock_model()
+    model.count_tokens.return_value = Mock(total_tokens=900)
+    summarizer = get_summarizer(model, max_input_tokens=1000)
+    summarizer._bucket = Mock()
+    
+    # Well under and well over the 4 chars/token estimate: no count request
+    short, long = "x" * 2000, "x" * 6000
+    assert summarizer._truncate_to_token_budget(short, "test") == short
+    assert summarizer._truncate_to_token_budget(long, "test") == long[:4000]
+    model.count_tokens.assert_not_called()
+    
+    near = "x" * 4200
+    assert summarizer._truncate_to_token_budget(near, "test") == near
+    model.count_tokens.assert_called_once_with(near)
+    # The count request waits for quota like a generation request
+    summarizer._bucket.acquire.assert_called_once()
+
+
+def test_token_budget_cuts_by_measured_ratio():
+    model = get_mock_model()
+    model.count_tokens_async = AsyncMock(return_value=Mock(total_tokens=1200))
+    summarizer = get_summarizer(model, max_input_tokens=1000)
+    summarizer._bucket = Mock(acquire_async=AsyncMock())
+    
+    truncated = asyncio.run(summarizer._truncate_to_token_budget_async("x" * 3600, "test"))
+    
+    assert len(truncated) == int(3600 * 1000 / 1200 * 0.95)
+    summarizer._bucket.acquire_async.assert_awaited_once()
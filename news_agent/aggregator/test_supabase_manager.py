@@ -0,0 +1,200 @@
+import asyncio
+import logging
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import numpy as np
+
+from news_agent.aggregator import supabase_manager as supabase_module
+from news_agent.aggregator.models import ChunkMetadata, ContentChunk, ReliabilityTier, SourceType
+from news_agent.aggregator.supabase_manager import AsyncSupabaseManager, SimilarityQueryCache, SupabaseManager
+
+
+MATCHES = [{"id": "c1", "similarity": 0.93}, {"id": "c2", "similarity": 0.85}]
+
+
+def get_mock_client(rpc_data=None):
+    client = Mock()
+    client.rpc.return_value.execute.return_value = Mock(data=rpc_data)
+    client.table.return_value.upsert.return_value.execute.return_value = Mock(data=[{"id": "new"}])
+    return client
+
+
+def get_manager(client):
+    with patch.object(supabase_module, "create_client", return_value=client):
+        return SupabaseManager("https://example.supabase.co", "test-key", vector_dimension=4)
+
+
+def get_embedding(seed=0):
+    vector = np.random.default_rng(seed).standard_normal(4).astype(np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def get_chunk(chunk_id):
+    metadata = ChunkMetadata(
+        timestamp=datetime.utcnow(), source="Reuters", url=f"https://example.com/{chunk_id}",
+        title="Oil prices rise", topic="energy", source_type=SourceType.GENERAL_NEWS,
+        reliability_tier=ReliabilityTier.TIER_2, source_retriever="test"
+    )
+    return ContentChunk(id=chunk_id, content="Oil prices rise", metadata=metadata, embedding=get_embedding())
+
+
+def test_update_chunk_cluster_assignment_sends_one_rpc_per_batch():
+    client = get_mock_client(rpc_data=2)
+    manager = get_manager(client)
+    manager.ASSIGN_BATCH_SIZE = 2
+    
+    manager.update_chunk_cluster_assignment(["c1", "c2", "c3", "c4", "c5"], "cluster-1")
+    
+    assert [call.args for call in client.rpc.call_args_list] == [
+        ("assign_cluster", {"chunk_ids": ["c1", "c2"], "new_cluster_id": "cluster-1"}),
+        ("assign_cluster", {"chunk_ids": ["c3", "c4"], "new_cluster_id": "cluster-1"}),
+        ("assign_cluster", {"chunk_ids": ["c5"], "new_cluster_id": "cluster-1"}),
+    ]
+    client.table.assert_not_called()
+
+
+def test_update_chunk_cluster_assignment_ignores_empty_input():
+    client = get_mock_client()
+    manager = get_manager(client)
+    
+    manager.update_chunk_cluster_assignment([], "cluster-1")
+    
+    client.rpc.assert_not_called()
+
+
+def test_update_chunk_cluster_assignment_warns_about_missing_chunks(caplog):
+    client = get_mock_client(rpc_data=1)
+    manager = get_manager(client)
+    
+    with caplog.at_level(logging.WARNING, logger=supabase_module.__name__):
+        manager.update_chunk_cluster_assignment(["c1", "c2"], "cluster-1")
+    
+    assert "Only 1 of 2 chunks" in caplog.text
+
+
+def test_similarity_query_cache_evicts_least_recently_used():
+    cache = SimilarityQueryCache(max_entries=2)
+    cache.set("a", [{"id": "a"}])
+    cache.set("b", [{"id": "b"}])
+    cache.get("a")
+    cache.set("c", [{"id": "c"}])
+    
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == [{"id": "a"}]
+    assert cache.stats == {"hits": 2, "misses": 1}
+
+
+def test_similarity_query_cache_returns_copies():
+    cache = SimilarityQueryCache()
+    results = [{"id": "a"}]
+    cache.set("key", results)
+    results.append({"id": "late"})
+    cache.get("key").append({"id": "caller"})
+    
+    assert cache.get("key") == [{"id": "a"}]
+
+
+def test_similarity_query_cache_drops_results_fetched_before_a_clear():
+    cache = SimilarityQueryCache()
+    generation = cache.generation
+    cache.clear()
+    cache.set("key", [{"id": "old"}], generation)
+    
+    assert cache.get("key") is None
+    cache.set("key", [{"id": "new"}], cache.generation)
+    assert cache.get("key") == [{"id": "new"}]
+
+
+def test_find_similar_chunks_serves_repeat_queries_from_cache():
+    client = get_mock_client(rpc_data=MATCHES)
+    manager = get_manager(client)
+    embedding = np.full(4, 0.5, dtype=np.float32)
+    
+    first = manager.find_similar_chunks(embedding, threshold=0.8)
+    # Rounds to the same hundredths, so it shares the cache entry
+    second = manager.find_similar_chunks(embedding + 0.001, threshold=0.8)
+    
+    assert first == second == MATCHES
+    assert client.rpc.call_count == 1
+
+
+def test_find_similar_chunks_keys_on_query_arguments():
+    client = get_mock_client(rpc_data=MATCHES)
+    manager = get_manager(client)
+    embedding = get_embedding()
+    
+    manager.find_similar_chunks(embedding, threshold=0.8)
+    manager.find_similar_chunks(embedding, threshold=0.9)
+    manager.find_similar_chunks(embedding, threshold=0.8, exclude_ids=["c1"])
+    manager.find_similar_chunks(embedding, threshold=0.8, title_prefilter="oil")
+    manager.find_similar_chunks(get_embedding(seed=1), threshold=0.8)
+    
+    assert client.rpc.call_count == 5
+
+
+def test_find_similar_chunks_does_not_cache_failures():
+    client = get_mock_client(rpc_data=MATCHES)
+    client.rpc.return_value.execute.side_effect = [RuntimeError("timeout"), Mock(data=MATCHES)]
+    manager = get_manager(client)
+    
+    assert manager.find_similar_chunks(get_embedding()) == []
+    assert manager.find_similar_chunks(get_embedding()) == MATCHES
+    assert client.rpc.call_count == 2
+
+
+def test_chunk_writes_invalidate_similarity_cache():
+    writes = [
+        lambda manager: manager.insert_chunk(get_chunk("new")),
+        lambda manager: manager.insert_chunks_batch([get_chunk("new")]),
+        lambda manager: manager.update_chunk_cluster_assignment(["c1"], "cluster-1"),
+        lambda manager: manager.cleanup_old_data(days=7),
+    ]
+    for write in writes:
+        client = get_mock_client()
+        client.rpc.side_effect = lambda name, params: Mock(
+            execute=Mock(return_value=Mock(data=1 if name == "assign_cluster" else MATCHES)))
+        manager = get_manager(client)
+        manager.find_similar_chunks(get_embedding())
+        
+        write(manager)
+        
+        assert len(manager.similarity_cache) == 0
+        client.rpc.reset_mock()
+        manager.find_similar_chunks(get_embedding())
+        assert client.rpc.call_count == 1
+
+
+def test_async_write_during_similarity_query_is_not_masked_by_cache():
+    manager = AsyncSupabaseManager("https://example.supabase.co", "test-key", vector_dimension=4)
+    rows = [{"id": "old"}]
+    query_started, write_done = asyncio.Event(), asyncio.Event()
+    
+    async def rpc(function, args):
+        # Read the table, then hold the response until the write has landed
+        snapshot = list(rows)
+        query_started.set()
+        await write_done.wait()
+        return snapshot
+    
+    async def upsert(table, row):
+        rows.append({"id": row["id"]})
+        return [row]
+    
+    async def insert_after_query_starts():
+        await query_started.wait()
+        await manager.insert_chunk(get_chunk("new"))
+        write_done.set()
+    
+    async def run():
+        manager._rpc, manager._upsert = rpc, upsert
+        stale, _ = await asyncio.gather(manager.find_similar_chunks(get_embedding()),
+                                        insert_after_query_starts())
+        fresh = await manager.find_similar_chunks(get_embedding())
+        return stale, fresh
+    
+    stale, fresh = asyncio.run(run())
+    
+    assert stale == [{"id": "old"}]
+    assert fresh == [{"id": "old"}, {"id": "new"}]